@@ -5,12 +5,16 @@ Provides common functionality for League Manager, Referee, and Player agents.
 """
 
 from .config_loader import ConfigLoader, get_config
+from .consistent_hash import ConsistentHashRing
+from .endpoint_directory import EndpointDirectory
+from .rng import derive_seed, rng_stream, new_league_seed
 from .config_models import SystemConfig, AgentsConfig, LeagueConfig
 from .helpers import (
     utc_now,
     generate_uuid,
     generate_token,
     validate_utc,
+    parse_utc,
     parse_sender,
     format_sender,
     is_retryable_error,
@@ -20,6 +24,12 @@ from .helpers import (
 from .logger import JsonLogger
 from .mcp_client import MCPClient
 from .mcp_server import MCPServer
+from .ws_transport import WebSocketPeer
+from .local_transport import LocalRegistry, local_registry
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry, metrics_registry
+from .tracing import Span, SpanContext
+from .watchdog import LoopWatchdog
+from .profiler import SamplingProfiler
 from .repositories import StandingsRepository, MatchRepository, StateRepository
 from .schemas import (
     LeagueRegisterRequest,
@@ -52,11 +62,16 @@ from .auth import (
     sanitize_display_name,
     sanitize_metadata,
 )
+from .retry import DeadlineExceeded, RetryBudget, RetryBudgetRegistry, backoff_delay
+from .hedging import HedgePolicy, hedged
+from .idempotency import ResponseCache
 from .circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerOpen,
     CircuitBreakerRegistry,
+    CircuitConfig,
     CircuitState,
+    circuit_registry,
     with_circuit_breaker,
 )
 from .ring_buffer_logger import (
@@ -71,6 +86,12 @@ from .benchmarks import (
     PerformanceTimer,
     benchmark_sync,
     benchmark_async,
+    ConcurrencyResult,
+    benchmark_concurrent,
+    asgi_client,
+    print_concurrency_result,
+    percentile,
+    summarize,
     timed,
     print_benchmark_results,
 )
@@ -92,11 +113,19 @@ __all__ = [
     "SystemConfig",
     "AgentsConfig",
     "LeagueConfig",
+    # Sharding
+    "ConsistentHashRing",
+    "EndpointDirectory",
+    # Random streams
+    "derive_seed",
+    "rng_stream",
+    "new_league_seed",
     # Helpers
     "utc_now",
     "generate_uuid",
     "generate_token",
     "validate_utc",
+    "parse_utc",
     "parse_sender",
     "format_sender",
     "is_retryable_error",
@@ -106,6 +135,20 @@ __all__ = [
     "JsonLogger",
     "MCPClient",
     "MCPServer",
+    "WebSocketPeer",
+    "LocalRegistry",
+    "local_registry",
+    # Metrics
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "metrics_registry",
+    # Tracing
+    "Span",
+    "SpanContext",
+    "LoopWatchdog",
+    "SamplingProfiler",
     # Repositories
     "StandingsRepository",
     "MatchRepository",
@@ -145,8 +188,18 @@ __all__ = [
     "CircuitBreaker",
     "CircuitBreakerOpen",
     "CircuitBreakerRegistry",
+    "CircuitConfig",
     "CircuitState",
+    "circuit_registry",
     "with_circuit_breaker",
+    # Retry policy
+    "DeadlineExceeded",
+    "RetryBudget",
+    "RetryBudgetRegistry",
+    "backoff_delay",
+    "HedgePolicy",
+    "hedged",
+    "ResponseCache",
     # Logging
     "RingBufferHandler",
     "setup_ring_buffer_logger",
@@ -162,6 +215,12 @@ __all__ = [
     "benchmark_async",
     "timed",
     "print_benchmark_results",
+    "ConcurrencyResult",
+    "benchmark_concurrent",
+    "asgi_client",
+    "print_concurrency_result",
+    "percentile",
+    "summarize",
     # Visualization
     "MatchResult",
     "PlayerStats",
@@ -5,14 +5,17 @@ Provides tools for measuring and reporting performance metrics
 for the league system.
 """
 
+import math
 import time
 import tracemalloc
 import asyncio
-from typing import Callable, Any, Dict, List, Optional
+from typing import Callable, Any, Dict, Iterable, List, Optional, Sequence
 from dataclasses import dataclass, field
 from functools import wraps
 import statistics
 
+import httpx
+
 
 @dataclass
 class BenchmarkResult:
@@ -59,6 +62,43 @@ class PerformanceTimer:
         self.elapsed = self.end_time - self.start_time
 
 
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values.
+
+    Args:
+        sorted_values: Values in ascending order
+        q: Percentile in [0, 100]
+
+    Returns:
+        The smallest value with at least q% of values at or below it
+        (0.0 when there are no values)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(values: Iterable[float]) -> Dict[str, float]:
+    """
+    Summarize a latency sample.
+
+    Returns:
+        {count, mean, p50, p95, p99, max}
+    """
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
 def benchmark_sync(
     func: Callable,
     *args,
@@ -76,6 +116,9 @@ def benchmark_sync(
         warmup: Whether to do a warmup run
         **kwargs: Keyword arguments for function
 
+    Peak memory comes from one extra run under tracemalloc, after the
+    timed runs, so tracing does not inflate the timings.
+
     Returns:
         BenchmarkResult with timing data
     """
@@ -91,24 +134,26 @@ def benchmark_sync(
         except Exception:
             pass
 
-    # Timed runs
+    # Timed runs (untraced: tracemalloc slows allocation-heavy code several-fold)
     for _ in range(num_runs):
-        tracemalloc.start()
-
         try:
             start = time.perf_counter()
             func(*args, **kwargs)
             end = time.perf_counter()
-
-            current, peak = tracemalloc.get_traced_memory()
-            peak_memory = max(peak_memory, peak)
-
             times.append(end - start)
             success_count += 1
         except Exception:
             failure_count += 1
-        finally:
-            tracemalloc.stop()
+
+    # Separate memory run
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    except Exception:
+        pass
+    finally:
+        tracemalloc.stop()
 
     if not times:
         times = [0]
@@ -143,6 +188,9 @@ async def benchmark_async(
         warmup: Whether to do a warmup run
         **kwargs: Keyword arguments for function
 
+    Peak memory comes from one extra run under tracemalloc, after the
+    timed runs, so tracing does not inflate the timings.
+
     Returns:
         BenchmarkResult with timing data
     """
@@ -158,24 +206,26 @@ async def benchmark_async(
         except Exception:
             pass
 
-    # Timed runs
+    # Timed runs (untraced: tracemalloc slows allocation-heavy code several-fold)
     for _ in range(num_runs):
-        tracemalloc.start()
-
         try:
             start = time.perf_counter()
             await func(*args, **kwargs)
             end = time.perf_counter()
-
-            current, peak = tracemalloc.get_traced_memory()
-            peak_memory = max(peak_memory, peak)
-
             times.append(end - start)
             success_count += 1
         except Exception:
             failure_count += 1
-        finally:
-            tracemalloc.stop()
+
+    # Separate memory run
+    tracemalloc.start()
+    try:
+        await func(*args, **kwargs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    except Exception:
+        pass
+    finally:
+        tracemalloc.stop()
 
     if not times:
         times = [0]
@@ -193,6 +243,178 @@ async def benchmark_async(
     )
 
 
+# Upper bounds (ms) of the latency histogram buckets; the last is open-ended.
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, math.inf)
+
+
+@dataclass
+class ConcurrencyResult:
+    """Result of a concurrent async benchmark."""
+    function_name: str
+    mode: str  # "closed" (fixed concurrency) or "open" (fixed arrival rate)
+    concurrency: Optional[int]
+    target_rate: Optional[float]
+    requests: int
+    errors: int
+    elapsed_seconds: float
+    latency_ms: Dict[str, float]
+    histogram: List[Dict[str, Any]]
+    loop_lag_ms: Dict[str, float]
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return (self.requests - self.errors) / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "function": self.function_name,
+            "mode": self.mode,
+            "concurrency": self.concurrency,
+            "target_rate": self.target_rate,
+            "requests": self.requests,
+            "errors": self.errors,
+            "elapsed_s": round(self.elapsed_seconds, 3),
+            "throughput_rps": round(self.throughput, 1),
+            "latency_ms": {k: round(v, 3) for k, v in self.latency_ms.items()},
+            "histogram": self.histogram,
+            "loop_lag_ms": {k: round(v, 3) for k, v in self.loop_lag_ms.items()},
+        }
+
+
+def _histogram(latencies_ms: List[float]) -> List[Dict[str, Any]]:
+    """Count latencies per LATENCY_BUCKETS_MS bucket ("+Inf" keeps the JSON valid)."""
+    counts = [0] * len(LATENCY_BUCKETS_MS)
+    for value in latencies_ms:
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if value <= bound:
+                counts[i] += 1
+                break
+    return [
+        {"le_ms": "+Inf" if bound == math.inf else bound, "count": c}
+        for bound, c in zip(LATENCY_BUCKETS_MS, counts)
+    ]
+
+
+async def _sample_loop_lag(lags: List[float], stop: asyncio.Event, interval: float) -> None:
+    """Record how late each `interval` sleep wakes up until `stop` is set."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(time.perf_counter() - start - interval, 0.0))
+
+
+async def benchmark_concurrent(
+    func: Callable,
+    *args,
+    concurrency: int = 10,
+    rate: Optional[float] = None,
+    requests: int = 1000,
+    duration: Optional[float] = None,
+    warmup: int = 1,
+    lag_interval: float = 0.01,
+    **kwargs
+) -> ConcurrencyResult:
+    """
+    Benchmark an async function under concurrent load.
+
+    Closed loop (default): `concurrency` workers call func back to back.
+    Open loop (`rate` set): calls start on a fixed schedule of `rate` per
+    second whether or not earlier calls finished, and latency is measured
+    from the scheduled start so queueing delay is not hidden.
+
+    Args:
+        func: Async function to benchmark
+        *args: Positional arguments for function
+        concurrency: Concurrent workers (closed loop)
+        rate: Target requests per second (switches to open loop)
+        requests: Total calls, unless duration is given
+        duration: Run for this many seconds instead of a fixed count
+        warmup: Untimed calls made first
+        lag_interval: Event-loop lag sampling interval in seconds
+        **kwargs: Keyword arguments for function
+
+    Returns:
+        ConcurrencyResult with throughput, latency percentiles and
+        histogram, and event-loop lag
+    """
+    for _ in range(warmup):
+        try:
+            await func(*args, **kwargs)
+        except Exception:
+            pass
+
+    latencies: List[float] = []
+    lags: List[float] = []
+    errors = 0
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_sample_loop_lag(lags, stop, lag_interval))
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    async def call(scheduled: float) -> None:
+        nonlocal errors
+        try:
+            await func(*args, **kwargs)
+            latencies.append(time.perf_counter() - scheduled)
+        except Exception:
+            errors += 1
+
+    if rate:
+        total = int(rate * duration) if duration else requests
+        tasks = []
+        for i in range(total):
+            scheduled = start + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(call(scheduled)))
+        await asyncio.gather(*tasks)
+        issued = total
+    else:
+        issued = 0
+
+        async def worker() -> None:
+            nonlocal issued
+            while (time.perf_counter() < deadline) if deadline else (issued < requests):
+                issued += 1
+                await call(time.perf_counter())
+                # Yield even when func never suspends (e.g. in-memory ASGI),
+                # so workers interleave and loop lag is sampled
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await lag_task
+
+    latencies_ms = [t * 1000 for t in latencies]
+    return ConcurrencyResult(
+        function_name=getattr(func, "__name__", "func"),
+        mode="open" if rate else "closed",
+        concurrency=None if rate else concurrency,
+        target_rate=rate,
+        requests=issued,
+        errors=errors,
+        elapsed_seconds=elapsed,
+        latency_ms=summarize(latencies_ms),
+        histogram=_histogram(latencies_ms),
+        loop_lag_ms=summarize(t * 1000 for t in lags),
+    )
+
+
+def asgi_client(app: Any, base_url: str = "http://asgi") -> httpx.AsyncClient:
+    """
+    HTTP client that calls an ASGI app (e.g. MCPServer.app) in memory.
+
+    Requests go through the app's full HTTP stack (routing, JSON parsing,
+    responses) without sockets, so benchmarks need no network.
+    """
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=base_url)
+
+
 def timed(func: Callable) -> Callable:
     """Decorator to time function execution."""
     @wraps(func)
@@ -221,3 +443,26 @@ def print_benchmark_results(results: List[BenchmarkResult]) -> None:
               f"{r.peak_memory_mb:<10.2f}")
 
     print("=" * 70 + "\n")
+
+
+def print_concurrency_result(result: ConcurrencyResult) -> None:
+    """Print a concurrent benchmark result with its latency histogram."""
+    load = (f"{result.target_rate:g} req/s open loop" if result.mode == "open"
+            else f"{result.concurrency} concurrent")
+    lat, lag = result.latency_ms, result.loop_lag_ms
+    print("\n" + "=" * 70)
+    print(f"  CONCURRENT BENCHMARK: {result.function_name} ({load})")
+    print("=" * 70)
+    print(f"  Requests:   {result.requests} ({result.errors} errors) "
+          f"in {result.elapsed_seconds:.2f}s = {result.throughput:.1f} req/s")
+    print(f"  Latency ms: p50 {lat['p50']:.2f}  p95 {lat['p95']:.2f}  "
+          f"p99 {lat['p99']:.2f}  max {lat['max']:.2f}")
+    print(f"  Loop lag:   p50 {lag['p50']:.2f}  p99 {lag['p99']:.2f}  max {lag['max']:.2f} ms")
+    print(f"  {'-' * 66}")
+    peak = max((b["count"] for b in result.histogram), default=0) or 1
+    for bucket in result.histogram:
+        if bucket["count"]:
+            label = f"<= {bucket['le_ms']:g} ms" if bucket["le_ms"] != "+Inf" else "> 1000 ms"
+            bar = "#" * max(round(40 * bucket["count"] / peak), 1)
+            print(f"  {label:>12} {bucket['count']:>7}  {bar}")
+    print("=" * 70 + "\n")
@@ -3,15 +3,36 @@ Circuit breaker pattern implementation.
 
 Prevents cascading failures by temporarily blocking requests
 to failing services.
+
+Each breaker judges its endpoint over a sliding window of recent call
+outcomes: the circuit opens when the failure rate, or the share of slow
+calls, crosses its threshold once the window holds enough calls. After
+`timeout_seconds` it turns half-open and admits at most
+`half_open_max_calls` probes at a time; `success_threshold` successful
+probes close it again, a failed (or slow) probe reopens it. All timing
+uses the monotonic clock.
+
+Callers that can free a probe slot admit calls with try_acquire() and
+hand the slot back with release(probe); can_execute() is the plain gate.
+
+Thresholds are per endpoint (CircuitBreakerRegistry.configure). The
+registry is bounded: past `max_breakers`, breakers idle for
+`idle_seconds` are dropped first, then the least recently used.
+Breakers are driven from one event loop; the registry only uses
+single dict operations (get/setdefault/pop), so it needs no lock.
 """
 
+import math
+import sys
 import time
-import asyncio
+from collections import deque
 from enum import Enum
 from typing import Optional, Callable, Any
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from functools import wraps
 
+from .metrics import metrics_registry
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -21,9 +42,63 @@ class CircuitState(Enum):
 
 
 # Configuration constants
-DEFAULT_FAILURE_THRESHOLD = 5  # Failures before opening circuit
-DEFAULT_SUCCESS_THRESHOLD = 2  # Successes to close circuit
-DEFAULT_TIMEOUT_SECONDS = 60   # Time before half-open transition
+DEFAULT_WINDOW_SIZE = 20          # Recent outcomes judged per endpoint
+DEFAULT_MINIMUM_CALLS = 5         # Outcomes needed before the circuit can open
+DEFAULT_FAILURE_RATE = 0.5        # Failure share that opens the circuit
+DEFAULT_SLOW_CALL_SECONDS = 10.0  # Calls at least this slow count as slow
+DEFAULT_SLOW_CALL_RATE = 1.0      # Slow share that opens the circuit
+DEFAULT_TIMEOUT_SECONDS = 60      # Time before half-open transition
+DEFAULT_HALF_OPEN_CALLS = 1       # Concurrent probes while half-open
+DEFAULT_SUCCESS_THRESHOLD = 2     # Successful probes to close circuit
+DEFAULT_MAX_BREAKERS = 512        # Endpoints tracked by one registry
+DEFAULT_IDLE_SECONDS = 600        # Unused breakers evicted first
+DEFAULT_FAILURE_THRESHOLD = 5     # Consecutive failures (legacy constructor)
+
+CIRCUIT_STATE = metrics_registry.gauge(
+    "circuit_breaker_state", "Circuit state (0 closed, 1 half-open, 2 open)", ("name",)
+)
+CIRCUIT_TRANSITIONS = metrics_registry.counter(
+    "circuit_breaker_transitions_total", "Circuit state changes", ("name", "state")
+)
+STATE_VALUES = {"CLOSED": 0, "HALF_OPEN": 1, "OPEN": 2}
+
+
+@dataclass(frozen=True)
+class CircuitConfig:
+    """Thresholds for one endpoint's circuit breaker."""
+
+    window_size: int = DEFAULT_WINDOW_SIZE
+    minimum_calls: int = DEFAULT_MINIMUM_CALLS
+    failure_rate_threshold: float = DEFAULT_FAILURE_RATE
+    slow_call_seconds: float = DEFAULT_SLOW_CALL_SECONDS
+    slow_call_rate_threshold: float = DEFAULT_SLOW_CALL_RATE
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS
+    half_open_max_calls: int = DEFAULT_HALF_OPEN_CALLS
+    success_threshold: int = DEFAULT_SUCCESS_THRESHOLD
+
+    @classmethod
+    def from_thresholds(
+        cls,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        success_threshold: int = DEFAULT_SUCCESS_THRESHOLD,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> "CircuitConfig":
+        """
+        Config behaving like the old consecutive-failure breaker.
+
+        A window of failure_threshold calls that opens only when all of
+        them failed is exactly "failure_threshold failures in a row".
+        The old breaker had no slow calls and no probe limit.
+        """
+        return cls(
+            window_size=failure_threshold,
+            minimum_calls=failure_threshold,
+            failure_rate_threshold=1.0,
+            slow_call_seconds=math.inf,
+            timeout_seconds=timeout_seconds,
+            half_open_max_calls=sys.maxsize,
+            success_threshold=success_threshold,
+        )
 
 
 @dataclass
@@ -38,70 +113,170 @@ class CircuitBreaker:
     - CLOSED: Normal operation, requests pass through
     - OPEN: Service failing, requests fail fast
     - HALF_OPEN: Testing service recovery with limited requests
+
+    A call admitted by try_acquire() reports its outcome with
+    record_success(seconds) or record_failure(), and when it ends passes
+    the probe it was given (if any) to release() to free its half-open
+    slot.
+
+    The old keyword arguments (failure_threshold, success_threshold,
+    timeout_seconds) are still accepted in place of a config and map to
+    CircuitConfig.from_thresholds; read thresholds from `config`.
+
+    Named breakers (the registry names them by endpoint) export their
+    state and transitions as metrics. OPEN -> HALF_OPEN happens lazily, so
+    the state gauge changes when the next request checks the breaker.
     """
 
-    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD
-    success_threshold: int = DEFAULT_SUCCESS_THRESHOLD
-    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS
+    config: CircuitConfig = field(default_factory=CircuitConfig)
+    name: str = ""
+    failure_threshold: InitVar[Optional[int]] = None
+    success_threshold: InitVar[Optional[int]] = None
+    timeout_seconds: InitVar[Optional[float]] = None
 
     _state: CircuitState = field(default=CircuitState.CLOSED)
-    _failure_count: int = field(default=0)
-    _success_count: int = field(default=0)
-    _last_failure_time: Optional[float] = field(default=None)
-    _last_state_change: float = field(default_factory=time.time)
+    _window: deque = field(default_factory=deque)
+    _failures: int = field(default=0)
+    _slow_calls: int = field(default=0)
+    _probe_successes: int = field(default=0)
+    _probes_in_flight: int = field(default=0)
+    _opened_at: float = field(default=0.0)
+    _last_state_change: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+    def __post_init__(
+        self,
+        failure_threshold: Optional[int],
+        success_threshold: Optional[int],
+        timeout_seconds: Optional[float],
+    ) -> None:
+        legacy = {
+            "failure_threshold": failure_threshold,
+            "success_threshold": success_threshold,
+            "timeout_seconds": timeout_seconds,
+        }
+        legacy = {key: value for key, value in legacy.items() if value is not None}
+        if legacy:
+            self.config = CircuitConfig.from_thresholds(**legacy)
+        self._window = deque(maxlen=self.config.window_size)
 
     @property
     def state(self) -> CircuitState:
         """Get current circuit state, checking for timeout transition."""
         if self._state == CircuitState.OPEN:
-            if time.time() - self._last_failure_time >= self.timeout_seconds:
+            if time.monotonic() - self._opened_at >= self.config.timeout_seconds:
                 self._transition_to(CircuitState.HALF_OPEN)
         return self._state
 
+    @property
+    def failure_rate(self) -> float:
+        """Share of failed calls in the window."""
+        return self._failures / len(self._window) if self._window else 0.0
+
+    @property
+    def slow_call_rate(self) -> float:
+        """Share of slow calls in the window."""
+        return self._slow_calls / len(self._window) if self._window else 0.0
+
     def _transition_to(self, new_state: CircuitState) -> None:
         """Transition to a new state."""
         self._state = new_state
-        self._last_state_change = time.time()
+        self._last_state_change = time.monotonic()
+        if self.name:
+            CIRCUIT_STATE.labels(self.name).set(STATE_VALUES[new_state.value])
+            CIRCUIT_TRANSITIONS.labels(self.name, new_state.value).inc()
 
         if new_state == CircuitState.CLOSED:
-            self._failure_count = 0
-            self._success_count = 0
-        elif new_state == CircuitState.HALF_OPEN:
-            self._success_count = 0
+            self._window.clear()
+            self._failures = 0
+            self._slow_calls = 0
+        elif new_state == CircuitState.OPEN:
+            self._opened_at = self._last_state_change
+        self._probe_successes = 0
+        self._probes_in_flight = 0
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        """Add an outcome to the window and open the circuit if over threshold."""
+        if len(self._window) == self._window.maxlen:
+            old_failed, old_slow = self._window[0]
+            self._failures -= old_failed
+            self._slow_calls -= old_slow
+        self._window.append((failed, slow))
+        self._failures += failed
+        self._slow_calls += slow
+
+        if len(self._window) >= self.config.minimum_calls and (
+            self.failure_rate >= self.config.failure_rate_threshold
+            or self.slow_call_rate >= self.config.slow_call_rate_threshold
+        ):
+            self._transition_to(CircuitState.OPEN)
 
-    def record_success(self) -> None:
-        """Record a successful call."""
+    def record_success(self, seconds: float = 0.0) -> None:
+        """Record a successful call and how long it took."""
+        slow = seconds >= self.config.slow_call_seconds
         if self._state == CircuitState.HALF_OPEN:
-            self._success_count += 1
-            if self._success_count >= self.success_threshold:
+            if slow:
+                self._transition_to(CircuitState.OPEN)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.config.success_threshold:
                 self._transition_to(CircuitState.CLOSED)
         elif self._state == CircuitState.CLOSED:
-            self._failure_count = 0  # Reset on success
+            self._record(False, slow)
 
     def record_failure(self) -> None:
         """Record a failed call."""
-        self._failure_count += 1
-        self._last_failure_time = time.time()
-
         if self._state == CircuitState.HALF_OPEN:
             self._transition_to(CircuitState.OPEN)
         elif self._state == CircuitState.CLOSED:
-            if self._failure_count >= self.failure_threshold:
-                self._transition_to(CircuitState.OPEN)
+            self._record(True, False)
 
-    def can_execute(self) -> bool:
-        """Check if a call can be executed."""
+    def try_acquire(self) -> tuple[bool, Optional[float]]:
+        """
+        Admit a call if the circuit allows it.
+
+        Returns:
+            (allowed, probe): probe is None unless the call took a
+            half-open probe slot, which it then frees with release(probe)
+        """
+        self.last_used = time.monotonic()
         state = self.state  # This triggers timeout check
-        return state in (CircuitState.CLOSED, CircuitState.HALF_OPEN)
+        if state == CircuitState.CLOSED:
+            return True, None
+        if state == CircuitState.HALF_OPEN and self._probes_in_flight < self.config.half_open_max_calls:
+            self._probes_in_flight += 1
+            return True, self._last_state_change  # Identifies this half-open period
+        return False, None
+
+    def can_execute(self) -> bool:
+        """Check if a call can be executed (half-open, this takes a probe slot)."""
+        return self.try_acquire()[0]
+
+    def release(self, probe: Optional[float]) -> None:
+        """
+        Free a probe slot taken by try_acquire.
+
+        A no-op for calls admitted while closed (probe None) and for
+        probes of an earlier half-open period, whose slots were dropped
+        when the circuit changed state.
+        """
+        if (
+            probe is not None
+            and probe == self._last_state_change
+            and self._state == CircuitState.HALF_OPEN
+            and self._probes_in_flight > 0
+        ):
+            self._probes_in_flight -= 1
 
     def get_status(self) -> dict:
         """Get circuit breaker status for monitoring."""
         return {
             "state": self.state.value,
-            "failure_count": self._failure_count,
-            "success_count": self._success_count,
-            "last_failure": self._last_failure_time,
-            "last_state_change": self._last_state_change,
+            "calls": len(self._window),
+            "failure_rate": round(self.failure_rate, 3),
+            "slow_call_rate": round(self.slow_call_rate, 3),
+            "probes_in_flight": self._probes_in_flight,
+            "seconds_in_state": round(time.monotonic() - self._last_state_change, 3),
         }
 
 
@@ -124,18 +299,22 @@ def with_circuit_breaker(circuit: CircuitBreaker):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if not circuit.can_execute():
+            allowed, probe = circuit.try_acquire()
+            if not allowed:
                 raise CircuitBreakerOpen(
-                    f"Circuit open, retry after {circuit.timeout_seconds}s"
+                    f"Circuit open, retry after {circuit.config.timeout_seconds}s"
                 )
 
+            start = time.monotonic()
             try:
                 result = await func(*args, **kwargs)
-                circuit.record_success()
+                circuit.record_success(time.monotonic() - start)
                 return result
-            except Exception as e:
+            except Exception:
                 circuit.record_failure()
                 raise
+            finally:
+                circuit.release(probe)
 
         return wrapper
     return decorator
@@ -145,29 +324,82 @@ class CircuitBreakerRegistry:
     """
     Registry for managing multiple circuit breakers.
 
-    Maintains separate circuit breakers for different endpoints.
+    Maintains separate circuit breakers for different endpoints, each
+    with the endpoint's configured thresholds (or the registry default).
+    The old get(endpoint, failure_threshold=, timeout_seconds=) keywords
+    still set the thresholds of a breaker being created.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        config: Optional[CircuitConfig] = None,
+        max_breakers: int = DEFAULT_MAX_BREAKERS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            config: Thresholds for endpoints without their own
+            max_breakers: Breakers kept before eviction starts
+            idle_seconds: Breakers unused this long are evicted first
+        """
+        self.config = config or CircuitConfig()
+        self.max_breakers = max_breakers
+        self.idle_seconds = idle_seconds
+        self._configs: dict[str, CircuitConfig] = {}
         self._breakers: dict[str, CircuitBreaker] = {}
 
+    def configure(self, endpoint: str, config: CircuitConfig) -> None:
+        """Set an endpoint's thresholds (its breaker restarts closed)."""
+        self._configs[endpoint] = config
+        self._breakers.pop(endpoint, None)
+
     def get(
         self,
         endpoint: str,
-        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
-        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        failure_threshold: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
     ) -> CircuitBreaker:
         """Get or create circuit breaker for endpoint."""
-        if endpoint not in self._breakers:
-            self._breakers[endpoint] = CircuitBreaker(
-                failure_threshold=failure_threshold,
-                timeout_seconds=timeout_seconds,
-            )
-        return self._breakers[endpoint]
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            config = self._configs.get(endpoint, self.config)
+            if failure_threshold is not None or timeout_seconds is not None:
+                config = CircuitConfig.from_thresholds(
+                    failure_threshold or DEFAULT_FAILURE_THRESHOLD,
+                    timeout_seconds=DEFAULT_TIMEOUT_SECONDS if timeout_seconds is None else timeout_seconds,
+                )
+            created = CircuitBreaker(config, name=endpoint)
+            breaker = self._breakers.setdefault(endpoint, created)
+            if breaker is created:
+                CIRCUIT_STATE.labels(endpoint).set(STATE_VALUES["CLOSED"])
+                if len(self._breakers) > self.max_breakers:
+                    self._evict()
+        return breaker
+
+    def _evict(self) -> None:
+        """Drop idle breakers, then least recently used ones, down to the bound."""
+        now = time.monotonic()
+        by_use = sorted(self._breakers.items(), key=lambda item: item[1].last_used)
+        excess = len(by_use) - self.max_breakers
+        for endpoint, breaker in by_use:
+            if excess <= 0 and now - breaker.last_used < self.idle_seconds:
+                break
+            if self._breakers.pop(endpoint, None) is not None:
+                CIRCUIT_STATE.remove(endpoint)
+                excess -= 1
+
+    def __len__(self) -> int:
+        return len(self._breakers)
 
     def get_all_status(self) -> dict[str, dict]:
         """Get status of all circuit breakers."""
         return {
             endpoint: breaker.get_status()
-            for endpoint, breaker in self._breakers.items()
+            for endpoint, breaker in list(self._breakers.items())
         }
+
+
+# Shared by every MCPClient in the process
+circuit_registry = CircuitBreakerRegistry()
@@ -85,6 +85,7 @@ class LeagueConfig:
     min_referees: int = 1
     rounds_per_matchup: int = 1
     parallel_matches: bool = True
+    seed: Optional[int] = None  # League RNG seed; None picks one at start
     auto_start: AutoStartConfig = field(default_factory=AutoStartConfig)
 
 
@@ -0,0 +1,105 @@
+"""
+Consistent hash ring for sharding work across agents.
+
+Maps keys (e.g. match IDs) onto nodes (e.g. referee IDs) so that adding
+or removing a node only moves the keys that node owned.
+"""
+
+import bisect
+import hashlib
+from typing import Iterable, Optional
+
+
+# Configuration constants
+DEFAULT_VIRTUAL_NODES = 64  # Ring points per node, smooths the distribution
+
+
+def _hash(key: str) -> int:
+    """Hash a string onto the 64-bit ring."""
+    digest = hashlib.md5(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class ConsistentHashRing:
+    """
+    Consistent hash ring with virtual nodes.
+
+    Each node is placed on the ring several times; a key belongs to the
+    first node point clockwise from the key's hash.
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[str] = (),
+        virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+    ):
+        """
+        Initialize the ring.
+
+        Args:
+            nodes: Initial node identifiers
+            virtual_nodes: Number of ring points per node
+        """
+        self.virtual_nodes = virtual_nodes
+        self._points: list[int] = []
+        self._owners: dict[int, str] = {}
+        self._nodes: set[str] = set()
+
+        for node in nodes:
+            self.add_node(node)
+
+    def add_node(self, node: str) -> None:
+        """Add a node to the ring (no-op if already present)."""
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self.virtual_nodes):
+            point = _hash(f"{node}#{i}")
+            if point in self._owners:
+                continue
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove_node(self, node: str) -> None:
+        """Remove a node and all of its ring points."""
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        self._points = [p for p in self._points if self._owners[p] != node]
+        self._owners = {p: self._owners[p] for p in self._points}
+
+    def sync(self, nodes: Iterable[str]) -> None:
+        """Make the ring contain exactly the given nodes."""
+        wanted = set(nodes)
+        for node in self._nodes - wanted:
+            self.remove_node(node)
+        for node in sorted(wanted - self._nodes):
+            self.add_node(node)
+
+    def get_node(self, key: str) -> Optional[str]:
+        """
+        Get the node that owns a key.
+
+        Args:
+            key: Key to place on the ring (e.g. a match ID)
+
+        Returns:
+            Owning node identifier, or None if the ring is empty
+        """
+        if not self._points:
+            return None
+        idx = bisect.bisect(self._points, _hash(key))
+        if idx == len(self._points):
+            idx = 0
+        return self._owners[self._points[idx]]
+
+    @property
+    def nodes(self) -> list[str]:
+        """Get all nodes on the ring."""
+        return sorted(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._nodes
@@ -0,0 +1,136 @@
+"""
+Endpoint directory with TTL caching.
+
+Resolves agent IDs (e.g. "REF01", "P03", "MANAGER") to their /mcp
+endpoints. Populated from registration responses, manager queries and
+the contact_endpoint advertised in authenticated envelopes, so agents
+never have to derive addresses from sender strings.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+# Configuration constants
+DEFAULT_TTL_SECONDS = 300  # Cached endpoints expire after 5 minutes
+
+EndpointFetcher = Callable[[], Awaitable[dict[str, str]]]
+
+
+class EndpointDirectory:
+    """
+    Agent ID -> endpoint cache.
+
+    Entries expire after a TTL and are dropped when a connection to
+    their endpoint fails, forcing a fresh lookup on next use. Pinned
+    entries (set from registration) are never replaced by observe().
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        """
+        Initialize directory.
+
+        Args:
+            ttl_seconds: Entry lifetime; None keeps entries until invalidated
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[str, Optional[float], bool]] = {}
+        self._clock = time.monotonic
+
+    def register(
+        self,
+        agent_id: str,
+        endpoint: str,
+        ttl_seconds: Optional[float] = None,
+        pinned: bool = False,
+    ) -> None:
+        """Add or refresh an agent's endpoint (pinned: registered, authoritative)."""
+        if not agent_id or not endpoint:
+            return
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = self._clock() + ttl if ttl is not None else None
+        self._entries[agent_id] = (endpoint, expires_at, pinned)
+
+    def update(self, endpoints: Optional[dict[str, str]]) -> None:
+        """Register many endpoints (e.g. from a registration response)."""
+        for agent_id, endpoint in (endpoints or {}).items():
+            self.register(agent_id, endpoint)
+
+    def observe(self, params: dict[str, Any]) -> None:
+        """
+        Learn the sender's endpoint from an incoming envelope.
+
+        Only call this for envelopes whose sender was authenticated: the
+        sender field is otherwise just a claim. Pinned entries are kept.
+        """
+        endpoint = params.get("contact_endpoint")
+        sender = params.get("sender", "")
+        if endpoint and ":" in sender:
+            agent_id = sender.split(":", 1)[1]
+            entry = self._entries.get(agent_id)
+            if entry is None or not entry[2]:
+                self.register(agent_id, endpoint)
+
+    def resolve(self, agent_id: str) -> Optional[str]:
+        """
+        Look up an agent's endpoint.
+
+        Args:
+            agent_id: Agent identifier
+
+        Returns:
+            Endpoint URL, or None if unknown or expired
+        """
+        entry = self._entries.get(agent_id)
+        if entry is None:
+            return None
+        endpoint, expires_at, _ = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._entries[agent_id]
+            return None
+        return endpoint
+
+    async def resolve_or_fetch(
+        self,
+        agent_id: str,
+        fetch: EndpointFetcher,
+    ) -> Optional[str]:
+        """
+        Resolve from cache, falling back to a single fetch on a miss.
+
+        Args:
+            agent_id: Agent identifier
+            fetch: Coroutine returning an agent ID -> endpoint mapping
+
+        Returns:
+            Endpoint URL, or None if still unknown after fetching
+        """
+        endpoint = self.resolve(agent_id)
+        if endpoint:
+            return endpoint
+        self.update(await fetch())
+        return self.resolve(agent_id)
+
+    def invalidate(self, agent_id: str) -> None:
+        """Drop an agent's cached endpoint."""
+        self._entries.pop(agent_id, None)
+
+    def invalidate_endpoint(self, endpoint: str) -> None:
+        """Drop every agent cached at an endpoint (e.g. after connect failure)."""
+        stale = [a for a, (e, _, _) in self._entries.items() if e == endpoint]
+        for agent_id in stale:
+            del self._entries[agent_id]
+
+    def snapshot(self) -> dict[str, str]:
+        """Get all live entries as agent ID -> endpoint."""
+        return {
+            agent_id: endpoint
+            for agent_id in list(self._entries)
+            if (endpoint := self.resolve(agent_id))
+        }
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
+
+    def __contains__(self, agent_id: object) -> bool:
+        return isinstance(agent_id, str) and self.resolve(agent_id) is not None
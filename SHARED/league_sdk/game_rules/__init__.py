@@ -2,6 +2,20 @@
 Game rules module for the league system.
 """
 
-from .even_odd import EvenOddGame, determine_winner
+from .even_odd import (
+    EvenOddGame,
+    BatchOutcome,
+    OUTCOME_TABLE,
+    RESULT_NAMES,
+    determine_outcomes,
+    determine_winner,
+)
 
-__all__ = ["EvenOddGame", "determine_winner"]
+__all__ = [
+    "EvenOddGame",
+    "BatchOutcome",
+    "OUTCOME_TABLE",
+    "RESULT_NAMES",
+    "determine_outcomes",
+    "determine_winner",
+]
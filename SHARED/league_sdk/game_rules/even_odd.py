@@ -1,17 +1,47 @@
 """
 Even/Odd game logic.
 
-Implements the rules for determining winners in Even/Odd games.
+Implements the rules for determining winners in Even/Odd games. Every
+outcome comes from one precomputed table over the 2x2x2 space of
+(choice A, choice B, drawn parity), shared by the single-match and the
+batch APIs.
 """
 
 import random
-from typing import Literal, Optional
+from typing import Any, Literal, Optional, Sequence
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, only for array inputs
+    np = None
+
 
 ParityChoice = Literal["even", "odd"]
 GameResult = Literal["WIN", "LOSS", "DRAW", "TECHNICAL_LOSS"]
 
+# Compact codes used by the batch API
+EVEN, ODD = 0, 1
+WIN, LOSS, DRAW = 0, 1, 2
+RESULT_NAMES: tuple[GameResult, ...] = ("WIN", "LOSS", "DRAW")
+NO_WINNER, WINNER_A, WINNER_B = -1, 0, 1
+
+
+def _outcome_row(a: int, b: int, parity: int) -> tuple[int, int, int, int, int]:
+    """(result_a, result_b, winner, points_a, points_b) for one combination."""
+    a_correct, b_correct = a == parity, b == parity
+    if a_correct and not b_correct:
+        return WIN, LOSS, WINNER_A, 3, 0
+    if b_correct and not a_correct:
+        return LOSS, WIN, WINNER_B, 0, 3
+    return DRAW, DRAW, NO_WINNER, 1, 1  # Both or neither correct
+
+
+# OUTCOME_TABLE[(a << 2) | (b << 1) | parity], with even=0 and odd=1
+OUTCOME_TABLE = tuple(_outcome_row(i >> 2 & 1, i >> 1 & 1, i & 1) for i in range(8))
+# One contiguous 8-entry row per field, so array lookups are cheap np.take calls
+_OUTCOME_COLUMNS = np.array(OUTCOME_TABLE, dtype=np.int8).T.copy() if np is not None else None
+
 
 @dataclass
 class MatchOutcome:
@@ -39,9 +69,9 @@ class EvenOddGame:
         self.min_number = min_number
         self.max_number = max_number
 
-    def draw_number(self) -> int:
-        """Draw a random number."""
-        return random.randint(self.min_number, self.max_number)
+    def draw_number(self, rng: Optional[random.Random] = None) -> int:
+        """Draw a random number, from `rng` if given (see league_sdk.rng)."""
+        return (rng or random).randint(self.min_number, self.max_number)
 
     def get_parity(self, number: int) -> ParityChoice:
         """Determine if number is even or odd."""
@@ -54,6 +84,7 @@ class EvenOddGame:
         player_b_id: str,
         player_b_choice: ParityChoice,
         drawn_number: Optional[int] = None,
+        rng: Optional[random.Random] = None,
     ) -> MatchOutcome:
         """
         Determine the outcome of a match.
@@ -64,47 +95,25 @@ class EvenOddGame:
             player_b_id: Player B identifier
             player_b_choice: Player B's parity choice
             drawn_number: Pre-drawn number (optional, for testing)
+            rng: Stream to draw from when no number is given
 
         Returns:
             MatchOutcome with results for both players
         """
         if drawn_number is None:
-            drawn_number = self.draw_number()
-
-        number_parity = self.get_parity(drawn_number)
-
-        a_correct = player_a_choice == number_parity
-        b_correct = player_b_choice == number_parity
-
-        if a_correct and b_correct:
-            # Both correct - draw
-            player_a_result = "DRAW"
-            player_b_result = "DRAW"
-            winner_id = None
-        elif a_correct:
-            # A wins
-            player_a_result = "WIN"
-            player_b_result = "LOSS"
-            winner_id = player_a_id
-        elif b_correct:
-            # B wins
-            player_a_result = "LOSS"
-            player_b_result = "WIN"
-            winner_id = player_b_id
-        else:
-            # Neither correct - draw
-            player_a_result = "DRAW"
-            player_b_result = "DRAW"
-            winner_id = None
+            drawn_number = self.draw_number(rng)
 
+        result_a, result_b, winner, _, _ = OUTCOME_TABLE[
+            _index(_bit(player_a_choice), _bit(player_b_choice), drawn_number)
+        ]
         return MatchOutcome(
             drawn_number=drawn_number,
-            number_parity=number_parity,
+            number_parity=self.get_parity(drawn_number),
             player_a_choice=player_a_choice,
             player_b_choice=player_b_choice,
-            player_a_result=player_a_result,
-            player_b_result=player_b_result,
-            winner_id=winner_id,
+            player_a_result=RESULT_NAMES[result_a],
+            player_b_result=RESULT_NAMES[result_b],
+            winner_id=(player_a_id, player_b_id)[winner] if winner != NO_WINNER else None,
         )
 
 
@@ -119,13 +128,106 @@ def determine_winner(
     Returns:
         Tuple of (player_a_result, player_b_result, winner_id or None)
     """
-    game = EvenOddGame()
-    outcome = game.determine_match_outcome(
-        "A", player_a_choice, "B", player_b_choice, drawn_number
+    result_a, result_b, winner, _, _ = OUTCOME_TABLE[
+        _index(_bit(player_a_choice), _bit(player_b_choice), drawn_number)
+    ]
+    winner_name = ("player_a", "player_b")[winner] if winner != NO_WINNER else None
+    return RESULT_NAMES[result_a], RESULT_NAMES[result_b], winner_name
+
+
+@dataclass
+class BatchOutcome:
+    """Outcomes of many matches as parallel sequences (lists or arrays)."""
+    drawn_numbers: Sequence[int]
+    result_a: Sequence[int]  # WIN / LOSS / DRAW codes, see RESULT_NAMES
+    result_b: Sequence[int]
+    winner: Sequence[int]  # NO_WINNER / WINNER_A / WINNER_B
+    points_a: Sequence[int]
+    points_b: Sequence[int]
+
+    def __len__(self) -> int:
+        return len(self.drawn_numbers)
+
+
+def determine_outcomes(
+    choices_a: Sequence[Any],
+    choices_b: Sequence[Any],
+    drawn_numbers: Optional[Sequence[int]] = None,
+    rng: Optional[Any] = None,
+    min_number: int = 1,
+    max_number: int = 10,
+) -> BatchOutcome:
+    """
+    Determine the outcomes of many matches at once.
+
+    Choices may be "even"/"odd" strings or EVEN/ODD bits. NumPy array
+    inputs (any shape) are evaluated with one table lookup and return
+    arrays; other sequences return lists.
+
+    Args:
+        choices_a: Player A choices, one per match
+        choices_b: Player B choices, one per match
+        drawn_numbers: Pre-drawn numbers (drawn here if omitted)
+        rng: random.Random for lists, numpy Generator for arrays
+        min_number: Minimum drawn number (inclusive)
+        max_number: Maximum drawn number (inclusive)
+
+    Returns:
+        BatchOutcome with one entry per match
+    """
+    arrays = np is not None and any(
+        isinstance(x, np.ndarray) for x in (choices_a, choices_b, drawn_numbers)
     )
-    winner = None
-    if outcome.winner_id == "A":
-        winner = "player_a"
-    elif outcome.winner_id == "B":
-        winner = "player_b"
-    return outcome.player_a_result, outcome.player_b_result, winner
+    if arrays:
+        a, b = _bit_array(choices_a), _bit_array(choices_b)
+        if drawn_numbers is None:
+            rng = rng or np.random.default_rng()
+            drawn_numbers = rng.integers(min_number, max_number + 1, size=a.shape)
+        drawn = np.asarray(drawn_numbers)
+        index = (a << 2) | (b << 1) | (drawn & 1).astype(np.int8)
+        return BatchOutcome(drawn, *(np.take(column, index) for column in _OUTCOME_COLUMNS))
+
+    a = [_bit(c) for c in choices_a]
+    b = [_bit(c) for c in choices_b]
+    if drawn_numbers is None:
+        rng = rng or random
+        drawn_numbers = [rng.randint(min_number, max_number) for _ in a]
+    rows = [OUTCOME_TABLE[_index(x, y, n)] for x, y, n in zip(a, b, drawn_numbers)]
+    columns = [list(col) for col in zip(*rows)] if rows else [[] for _ in range(5)]
+    return BatchOutcome(list(drawn_numbers), *columns)
+
+
+_BITS = {"even": EVEN, "odd": ODD, EVEN: EVEN, ODD: ODD}
+
+
+def _invalid_choice(choice: Any) -> ValueError:
+    return ValueError(f"Invalid parity choice {choice!r}: expected 'even'/'odd' or {EVEN}/{ODD}")
+
+
+def _bit(choice: Any) -> int:
+    """Map "even"/"odd" (or an existing bit) to EVEN/ODD, rejecting anything else."""
+    try:
+        return _BITS[choice]
+    except (KeyError, TypeError):
+        raise _invalid_choice(choice) from None
+
+
+def _index(a: int, b: int, drawn_number: int) -> int:
+    """Row of OUTCOME_TABLE for two choice bits and a drawn number."""
+    return (a << 2) | (b << 1) | (drawn_number & 1)
+
+
+def _bit_array(choices: Any) -> "np.ndarray":
+    """Convert choices (strings or bits) to an int8 bit array, rejecting anything else."""
+    arr = np.asarray(choices)
+    if arr.dtype.kind == "O":
+        return np.vectorize(_bit, otypes=[np.int8])(arr)
+    if arr.dtype.kind == "U":
+        odd = arr == "odd"
+        valid = odd | (arr == "even")
+    else:
+        odd = arr
+        valid = np.isin(arr, (EVEN, ODD))
+    if not valid.all():
+        raise _invalid_choice(arr[~valid].flat[0])
+    return odd.astype(np.int8)
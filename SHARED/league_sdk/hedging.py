@@ -0,0 +1,120 @@
+"""
+Request hedging for latency-critical calls.
+
+A hedged call sends the request, and if no response has arrived after
+the method's recent p95 latency, sends an identical copy (same JSON-RPC
+id) and takes whichever succeeds first. Only the slowest ~5% of calls
+are duplicated, so the extra load is small while a stalled connection
+or a paused peer no longer holds the caller for the full timeout.
+
+The receiving MCPServer deduplicates copies that arrive while the
+original is still being handled, so handlers run once per request id.
+
+Usage:
+    hedge = HedgePolicy({"CHOOSE_PARITY_CALL", "GAME_INVITATION"})
+    client = MCPClient("referee:REF01", hedge=hedge)  # Share across clients
+"""
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar
+
+from .benchmarks import percentile
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """Which methods to hedge, and when, from observed latencies."""
+
+    def __init__(
+        self,
+        methods: Iterable[str],
+        quantile: float = 95.0,
+        initial_delay: float = 0.05,
+        min_delay: float = 0.005,
+        max_delay: float = 1.0,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            methods: Message types to hedge
+            quantile: Latency percentile after which the copy is sent
+            initial_delay: Hedge delay until min_samples latencies are known
+            min_delay: Lower bound on the delay (seconds)
+            max_delay: Upper bound on the delay (seconds)
+            window: Recent latencies kept per method
+            min_samples: Samples needed before the percentile is used
+        """
+        self.methods = frozenset(methods)
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: dict[str, deque] = {}
+
+    def applies(self, method: str) -> bool:
+        """Whether calls of this method are hedged."""
+        return method in self.methods
+
+    def observe(self, method: str, seconds: float) -> None:
+        """Record the latency of a successful request."""
+        samples = self._latencies.get(method)
+        if samples is None:
+            samples = self._latencies[method] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def delay(self, method: str) -> float:
+        """Seconds to wait before sending the hedge copy."""
+        samples = self._latencies.get(method)
+        if not samples or len(samples) < self.min_samples:
+            return self.initial_delay
+        value = percentile(sorted(samples), self.quantile)
+        return min(max(value, self.min_delay), self.max_delay)
+
+
+async def hedged(
+    call: Callable[[], Awaitable[T]],
+    delay: float,
+    on_hedge: Optional[Callable[[], None]] = None,
+) -> tuple[T, bool]:
+    """
+    Run `call`, starting a second copy if the first is slower than `delay`.
+
+    A failure before the delay is raised at once (the caller's retry
+    policy decides what happens next). Once both copies run, the first
+    success wins and the other is cancelled; if both fail, the primary's
+    error is raised. `on_hedge` is called when the copy is started.
+
+    Returns:
+        (result, True if the hedge copy won)
+    """
+    primary = asyncio.ensure_future(call())
+    tasks = [primary]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return primary.result(), False
+
+        backup = asyncio.ensure_future(call())
+        tasks.append(backup)
+        if on_hedge:
+            on_hedge()
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=tasks.index):
+                if task.exception() is None:
+                    return task.result(), task is backup
+        raise primary.exception()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # Mark a losing copy's error as retrieved
@@ -49,6 +49,18 @@ def validate_utc(timestamp: str) -> bool:
     return bool(re.match(z_pattern, timestamp) or re.match(utc_offset_pattern, timestamp))
 
 
+def parse_utc(timestamp: Optional[str]) -> Optional[float]:
+    """
+    Convert a UTC timestamp (see validate_utc) to epoch seconds.
+
+    Returns:
+        Seconds since the epoch, or None if missing or not valid UTC
+    """
+    if not isinstance(timestamp, str) or not validate_utc(timestamp):
+        return None
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+
+
 def parse_sender(sender: str) -> tuple[str, str]:
     """
     Parse sender string into type and ID.
@@ -0,0 +1,71 @@
+"""
+Bounded response cache for replaying retried JSON-RPC requests.
+
+MCPClient reuses the JSON-RPC id for every retry and hedge copy of a
+call, so (sender, id) identifies one logical request. MCPServer stores
+each successful response here and answers later copies from the cache
+instead of running the handler again: a retried MATCH_RESULT_REPORT is
+counted once, a retried GAME_INVITATION does not re-run the handler.
+
+Entries expire `ttl_seconds` after they were stored; beyond `max_entries`
+the least recently used entry is evicted.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class ResponseCache:
+    """TTL + LRU cache of JSON-RPC responses."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: How long a response can be replayed
+            max_entries: Responses kept at most (0 disables the cache)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[dict[str, Any]]:
+        """Stored response for key, if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored, response = entry
+        if time.monotonic() - stored > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Hashable, response: dict[str, Any]) -> None:
+        """Store a response, evicting expired and least recently used entries."""
+        if self.max_entries <= 0:
+            return
+        now = time.monotonic()
+        self._entries[key] = (now, response)
+        self._entries.move_to_end(key)
+        while self._entries:
+            oldest, (stored, _) = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_entries and now - stored <= self.ttl_seconds:
+                break
+            del self._entries[oldest]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,60 @@
+"""
+In-process transport for agents sharing one Python process.
+
+Servers registered here are reached by MCPClient without any network
+I/O: the JSON-RPC request goes straight into the target server's
+dispatch, so envelope validation, auth and rate limiting still apply.
+Requests and responses are JSON round-tripped to keep wire semantics
+(no shared mutable state, non-serializable payloads still fail).
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .mcp_server import MCPServer
+
+
+class LocalRegistry:
+    """Endpoint -> MCPServer map for in-process delivery."""
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._servers: dict[str, "MCPServer"] = {}
+
+    def register(self, server: "MCPServer") -> None:
+        """Make a server reachable in-process at its endpoint."""
+        self._servers[server.endpoint] = server
+
+    def unregister(self, endpoint: str) -> None:
+        """Remove a server; clients fall back to the network."""
+        self._servers.pop(endpoint, None)
+
+    def get(self, endpoint: str) -> Optional["MCPServer"]:
+        """Get the local server for an endpoint, if any."""
+        return self._servers.get(endpoint)
+
+    def clear(self) -> None:
+        """Remove every registered server."""
+        self._servers.clear()
+
+    async def send(self, endpoint: str, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Deliver a JSON-RPC request to a local server.
+
+        Raises:
+            KeyError: If no server is registered at the endpoint
+        """
+        server = self._servers[endpoint]
+        response = await server.dispatch(json.loads(json.dumps(request)))
+        return json.loads(json.dumps(response))
+
+    def __contains__(self, endpoint: object) -> bool:
+        return endpoint in self._servers
+
+    def __len__(self) -> int:
+        return len(self._servers)
+
+
+# Default registry shared by MCPServer.serve_in_process and MCPClient
+local_registry = LocalRegistry()
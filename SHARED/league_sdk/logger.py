@@ -110,6 +110,10 @@ class JsonLogger:
             **kwargs,
         )
 
+    def span(self, name: str, **kwargs: Any) -> None:
+        """Log a finished trace span (file only, no console echo)."""
+        self._write(self._create_record("INFO", "SPAN", name, span=name, **kwargs))
+
     def match_event(self, match_id: str, event: str, **kwargs: Any) -> None:
         """Log match-related event."""
         self.info("MATCH_EVENT", event, match_id=match_id, **kwargs)
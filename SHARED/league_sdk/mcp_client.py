@@ -2,36 +2,78 @@
 MCP HTTP client with retry logic, circuit breaker, and connection pooling.
 
 Provides async HTTP client for inter-agent communication with resilience.
+Messages to agents served in-process or over a live WebSocket peer
+skip HTTP entirely. HTTP retries use full-jitter exponential backoff,
+stop at the call's deadline and draw on a per-endpoint retry budget
+(see retry.py). Methods covered by a HedgePolicy send a duplicate when
+an attempt is slower than their recent p95 (see hedging.py).
 """
 
 import asyncio
+import time
 from typing import Any, Optional
 import httpx
 
-from .helpers import utc_now, generate_uuid, is_retryable_error
-from .circuit_breaker import CircuitBreaker, CircuitBreakerOpen, CircuitBreakerRegistry
+from .helpers import utc_now, generate_uuid, is_retryable_error, parse_utc
+from .circuit_breaker import CircuitBreaker, CircuitBreakerOpen, circuit_registry
+from .endpoint_directory import EndpointDirectory
+from .ws_transport import WebSocketPeer
+from .local_transport import local_registry
+from .metrics import metrics_registry
+from .retry import DeadlineExceeded, RetryBudgetRegistry, backoff_delay
+from .hedging import HedgePolicy, hedged
+from . import tracing
 
 
 # Configuration constants
 DEFAULT_MAX_RETRIES = 3
-DEFAULT_BACKOFF_SECONDS = 2
+DEFAULT_BACKOFF_SECONDS = 0.5      # Base of the exponential backoff
+DEFAULT_MAX_BACKOFF_SECONDS = 8
 DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_MAX_CONNECTIONS = 10
 
+CLIENT_REQUESTS = metrics_registry.counter(
+    "mcp_client_requests_total", "MCP messages sent", ("sender", "method", "outcome")
+)
+CLIENT_SECONDS = metrics_registry.histogram(
+    "mcp_client_request_duration_seconds",
+    "MCP send time including retries",
+    ("sender", "method"),
+)
+CLIENT_RETRIES = metrics_registry.counter(
+    "mcp_client_retries_total", "MCP HTTP send retries", ("sender", "method")
+)
+RETRIES_ABANDONED = metrics_registry.counter(
+    "mcp_client_retries_abandoned_total",
+    "Retries skipped because of the deadline or retry budget",
+    ("sender", "method", "reason"),
+)
+HEDGES = metrics_registry.counter(
+    "mcp_client_hedges_total",
+    "Hedge copies sent, by which copy answered first",
+    ("sender", "method", "winner"),
+)
+
 
 class MCPClient:
     """HTTP client for MCP protocol with circuit breaker and pooling."""
 
-    _circuit_registry = CircuitBreakerRegistry()
+    _circuit_registry = circuit_registry
+    _retry_budgets = RetryBudgetRegistry()
 
     def __init__(
         self,
         sender: str,
         auth_token: Optional[str] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        backoff_seconds: int = DEFAULT_BACKOFF_SECONDS,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
         timeout: int = DEFAULT_TIMEOUT_SECONDS,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        contact_endpoint: Optional[str] = None,
+        directory: Optional[EndpointDirectory] = None,
+        peers: Optional[dict[str, WebSocketPeer]] = None,
+        hedge: Optional[HedgePolicy] = None,
     ):
         """
         Initialize MCP client with connection pooling.
@@ -40,16 +82,26 @@ class MCPClient:
             sender: Sender identifier (e.g., "player:P01")
             auth_token: Authentication token
             max_retries: Maximum retry attempts
-            backoff_seconds: Seconds between retries
+            backoff_seconds: Backoff base; retry n waits up to base * 2**n
+            max_backoff_seconds: Cap on the backoff range
             timeout: Request timeout in seconds
             max_connections: Max keep-alive connections
+            contact_endpoint: Own endpoint advertised in every envelope
+            directory: Endpoint directory invalidated on connection failures
+            peers: Live WebSocket peers by endpoint (usually MCPServer.peers)
+            hedge: Hedging policy for HTTP requests (share one per agent)
         """
         self.sender = sender
         self.auth_token = auth_token
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
         self.timeout = timeout
         self.max_connections = max_connections
+        self.contact_endpoint = contact_endpoint
+        self.directory = directory
+        self.peers = peers
+        self.hedge = hedge
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -85,6 +137,9 @@ class MCPClient:
         }
         if self.auth_token:
             envelope["auth_token"] = self.auth_token
+        if self.contact_endpoint:
+            envelope["contact_endpoint"] = self.contact_endpoint
+        tracing.inject(envelope)
         envelope.update(kwargs)
         return envelope
 
@@ -98,6 +153,7 @@ class MCPClient:
         message_type: str,
         payload: dict[str, Any],
         conversation_id: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> dict[str, Any]:
         """
         Send a message with retry logic and circuit breaker.
@@ -107,14 +163,67 @@ class MCPClient:
             message_type: Message type identifier
             payload: Message payload
             conversation_id: Optional conversation ID
+            deadline: time.time() by which the call must complete. Defaults
+                to the payload's deadline or response_deadline field
 
         Returns:
             Response data
+
+        Raises:
+            CircuitBreakerOpen: If the endpoint's circuit is open
+            DeadlineExceeded: If the deadline passed before a response
         """
+        if deadline is None:
+            deadline = parse_utc(payload.get("deadline") or payload.get("response_deadline"))
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await self._send(endpoint, message_type, payload, conversation_id, deadline)
+            outcome = "ok"
+            return response
+        except CircuitBreakerOpen:
+            outcome = "circuit_open"
+            raise
+        except DeadlineExceeded:
+            outcome = "deadline"
+            raise
+        finally:
+            CLIENT_REQUESTS.labels(self.sender, message_type, outcome).inc()
+            CLIENT_SECONDS.labels(self.sender, message_type).observe(time.perf_counter() - start)
+
+    async def _send(
+        self,
+        endpoint: str,
+        message_type: str,
+        payload: dict[str, Any],
+        conversation_id: Optional[str],
+        deadline: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Deliver one message if the endpoint's circuit admits it."""
         circuit = self._get_circuit_breaker(endpoint)
 
-        if not circuit.can_execute():
+        allowed, probe = circuit.try_acquire()
+        if not allowed:
             raise CircuitBreakerOpen(f"Circuit open for {endpoint}")
+        try:
+            return await self._deliver(
+                circuit, endpoint, message_type, payload, conversation_id, deadline
+            )
+        finally:
+            circuit.release(probe)
+
+    async def _deliver(
+        self,
+        circuit: CircuitBreaker,
+        endpoint: str,
+        message_type: str,
+        payload: dict[str, Any],
+        conversation_id: Optional[str],
+        deadline: Optional[float],
+    ) -> dict[str, Any]:
+        """Deliver one message: in-process, over a live peer, or HTTP with retries."""
+        if deadline is not None and time.time() >= deadline:
+            raise DeadlineExceeded(f"{message_type} to {endpoint}: deadline already passed")
 
         envelope = self._build_envelope(message_type, conversation_id, **payload)
 
@@ -125,45 +234,111 @@ class MCPClient:
             "id": generate_uuid(),
         }
 
+        if endpoint in local_registry:
+            start = time.monotonic()
+            response = await local_registry.send(endpoint, jsonrpc_request)
+            circuit.record_success(time.monotonic() - start)
+            return response
+
+        peer = self.peers.get(endpoint) if self.peers else None
+        if peer and not peer.closed:
+            start = time.monotonic()
+            try:
+                response = await peer.request(jsonrpc_request, self._attempt_timeout(deadline))
+                circuit.record_success(time.monotonic() - start)
+                return response
+            except (ConnectionError, asyncio.TimeoutError):
+                circuit.record_failure()  # Fall back to HTTP below
+
         client = await self._get_client()
+        budget = self._retry_budgets.get(endpoint)
         last_error: Optional[Exception] = None
+        abandoned: Optional[str] = None
 
         for attempt in range(self.max_retries + 1):
+            start = time.monotonic()
             try:
-                response = await client.post(
-                    endpoint,
-                    json=jsonrpc_request,
-                    headers={"Content-Type": "application/json"},
-                )
-                response.raise_for_status()
-                circuit.record_success()
+                response = await self._post(client, endpoint, jsonrpc_request, deadline)
+                circuit.record_success(time.monotonic() - start)
                 return response.json()
 
-            except httpx.TimeoutException as e:
+            except (httpx.TimeoutException, httpx.ConnectError) as e:
                 last_error = e
                 circuit.record_failure()
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self.backoff_seconds * (attempt + 1))
-                continue
 
             except httpx.HTTPStatusError as e:
-                last_error = e
-                if e.response.status_code >= 500:
-                    circuit.record_failure()
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(self.backoff_seconds * (attempt + 1))
-                        continue
-                raise
-
-            except httpx.ConnectError as e:
+                if e.response.status_code < 500:
+                    raise
                 last_error = e
                 circuit.record_failure()
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self.backoff_seconds * (attempt + 1))
-                continue
 
+            if attempt == self.max_retries:
+                break
+            delay = backoff_delay(attempt, self.backoff_seconds, self.max_backoff_seconds)
+            if deadline is not None and time.time() + delay >= deadline:
+                abandoned = "deadline"
+            elif not budget.try_acquire():
+                abandoned = "budget"
+            if abandoned:
+                RETRIES_ABANDONED.labels(self.sender, message_type, abandoned).inc()
+                break
+            CLIENT_RETRIES.labels(self.sender, message_type).inc()
+            await asyncio.sleep(delay)
+
+        if self.directory and isinstance(last_error, httpx.ConnectError):
+            # Peer is gone or moved; force a fresh lookup next time
+            self.directory.invalidate_endpoint(endpoint)
+
+        if abandoned == "deadline" or (deadline is not None and time.time() >= deadline):
+            raise DeadlineExceeded(f"{message_type} to {endpoint}: deadline passed") from last_error
         raise last_error or Exception("Max retries exceeded")
 
+    async def _post(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        jsonrpc_request: dict[str, Any],
+        deadline: Optional[float],
+    ) -> httpx.Response:
+        """One HTTP attempt, hedged when the policy covers the method."""
+        method = jsonrpc_request["method"]
+        hedge = self.hedge if self.hedge and self.hedge.applies(method) else None
+
+        async def post() -> httpx.Response:
+            start = time.perf_counter()
+            response = await client.post(
+                endpoint,
+                json=jsonrpc_request,
+                headers={"Content-Type": "application/json"},
+                timeout=self._attempt_timeout(deadline),
+            )
+            response.raise_for_status()
+            if hedge:
+                hedge.observe(method, time.perf_counter() - start)
+            return response
+
+        if hedge is None:
+            return await post()
+        delay = hedge.delay(method)
+        if deadline is not None and time.time() + delay >= deadline:
+            return await post()  # No time left for a copy to help
+        sent = []
+        try:
+            response, hedge_won = await hedged(post, delay, on_hedge=lambda: sent.append(True))
+        except Exception:
+            if sent:
+                HEDGES.labels(self.sender, method, "none").inc()
+            raise
+        if sent:
+            HEDGES.labels(self.sender, method, "hedge" if hedge_won else "primary").inc()
+        return response
+
+    def _attempt_timeout(self, deadline: Optional[float]) -> float:
+        """Per-attempt timeout, shortened to what is left before the deadline."""
+        if deadline is None:
+            return self.timeout
+        return max(min(self.timeout, deadline - time.time()), 0.001)
+
     def get_circuit_status(self) -> dict[str, dict]:
         """Get status of all circuit breakers."""
         return self._circuit_registry.get_all_status()
@@ -2,15 +2,27 @@
 Base MCP server class for agents.
 
 Provides FastAPI-based MCP server foundation with authentication
-and rate limiting support.
+and rate limiting support. Requests arrive over HTTP POST /mcp or over
+persistent WebSocket connections on /ws; both share the same dispatch.
 """
 
+import asyncio
+import secrets
+import time
 from typing import Any, Callable, Optional
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.responses import JSONResponse, Response
 
-from .helpers import utc_now, generate_uuid, validate_utc
+from .helpers import utc_now, generate_uuid, generate_token, validate_utc
 from .logger import JsonLogger
+from .endpoint_directory import EndpointDirectory
+from .ws_transport import PEER_TOKEN_HEADER, WebSocketPeer, connect_peer
+from .local_transport import local_registry
+from .metrics import CONTENT_TYPE, metrics_registry
+from .watchdog import LoopWatchdog
+from .profiler import SamplingProfiler
+from .idempotency import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, ResponseCache
+from . import tracing
 from .auth import (
     RateLimiter,
     AuthTokenValidator,
@@ -18,6 +30,37 @@ from .auth import (
     sanitize_metadata,
 )
 
+REQUESTS = metrics_registry.counter(
+    "mcp_server_requests_total", "MCP requests handled", ("agent", "method", "status")
+)
+REQUEST_SECONDS = metrics_registry.histogram(
+    "mcp_server_request_duration_seconds", "MCP request handling time", ("agent", "method")
+)
+IN_FLIGHT = metrics_registry.gauge(
+    "mcp_server_requests_in_flight", "MCP requests being handled", ("agent",)
+)
+DUPLICATES = metrics_registry.counter(
+    "mcp_server_duplicate_requests_total",
+    "Copies of an in-flight request answered with its result",
+    ("agent", "method"),
+)
+REPLAYED = metrics_registry.counter(
+    "mcp_server_replayed_responses_total",
+    "Repeated requests answered from the idempotency cache",
+    ("agent", "method"),
+)
+
+# JSON-RPC error code -> status label
+ERROR_STATUS = {
+    -32700: "parse_error",
+    -32600: "invalid_request",
+    -32000: "rate_limited",
+    -32602: "invalid_envelope",
+    -32001: "auth_failed",
+    -32601: "unknown_method",
+    -32603: "handler_error",
+}
+
 
 class MCPServer:
     """Base MCP server for agents with auth and rate limiting."""
@@ -30,6 +73,9 @@ class MCPServer:
         port: int = 8000,
         enable_rate_limiting: bool = True,
         rate_limit: int = 100,
+        idempotency_ttl: float = DEFAULT_TTL_SECONDS,
+        idempotency_max_entries: int = DEFAULT_MAX_ENTRIES,
+        log_dir: Optional[str] = None,
     ):
         """
         Initialize MCP server.
@@ -41,16 +87,28 @@ class MCPServer:
             port: Server port
             enable_rate_limiting: Whether to enable rate limiting
             rate_limit: Max requests per minute per sender
+            idempotency_ttl: Seconds a response can be replayed for a repeated request
+            idempotency_max_entries: Responses kept for replay (0 disables)
+            log_dir: Log directory. Defaults to SHARED/logs/{agent_type}/
         """
         self.agent_type = agent_type
         self.agent_id = agent_id
         self.host = host
         self.port = port
         self.sender = f"{agent_type}:{agent_id}"
+        self.endpoint = f"http://{host}:{port}/mcp"
 
         self.app = FastAPI(title=f"{agent_type.title()} {agent_id}")
-        self.logger = JsonLogger(agent_type, agent_id)
+        self.logger = JsonLogger(agent_type, agent_id, log_dir)
         self._handlers: dict[str, Callable] = {}
+        self.directory = EndpointDirectory()
+        self.peers: dict[str, WebSocketPeer] = {}  # Remote endpoint -> live peer
+        self._peer_grants: dict[str, str] = {}  # Remote endpoint -> one-time WS token
+        self._peer_tasks: set[asyncio.Task] = set()
+        self._pending: dict[tuple[str, str, Any], asyncio.Future] = {}  # (sender, method, id) -> response
+        self._responses = ResponseCache(idempotency_ttl, idempotency_max_entries)
+        self.watchdog: Optional[LoopWatchdog] = None
+        self.profiler = SamplingProfiler(agent_id)
 
         # Security components
         self._rate_limiter = RateLimiter(max_requests=rate_limit)
@@ -59,6 +117,20 @@ class MCPServer:
 
         self._setup_routes()
 
+    def enable_watchdog(self, threshold_ms: float = 100.0, interval_ms: float = 20.0) -> LoopWatchdog:
+        """
+        Report event-loop stalls longer than threshold_ms (opt-in).
+
+        The watchdog starts and stops with the app. Stalls are logged as
+        LOOP_LAG warnings naming the handler that was running and the
+        stack samples taken while the loop was blocked.
+        """
+        if self.watchdog is None:
+            self.watchdog = LoopWatchdog(self.logger, self.sender, threshold_ms, interval_ms)
+            self.app.add_event_handler("startup", self.watchdog.start)
+            self.app.add_event_handler("shutdown", self.watchdog.stop)
+        return self.watchdog
+
     def _setup_routes(self) -> None:
         """Setup FastAPI routes."""
 
@@ -66,31 +138,112 @@ class MCPServer:
         async def mcp_endpoint(request: Request) -> JSONResponse:
             return await self._handle_request(request)
 
+        @self.app.websocket("/ws")
+        async def ws_endpoint(websocket: WebSocket) -> None:
+            await websocket.accept()
+            await self._serve_peer(websocket)
+
         @self.app.get("/health")
         async def health() -> dict[str, str]:
             return {"status": "healthy", "agent": self.sender}
 
+        @self.app.get("/metrics")
+        async def metrics_endpoint() -> Response:
+            return Response(metrics_registry.render(), media_type=CONTENT_TYPE)
+
+        @self.app.get("/admin/profile")
+        async def profile_status(request: Request) -> JSONResponse:
+            return self._admin_response(request, self.profiler.status)
+
+        @self.app.post("/admin/profile")
+        async def profile_start(request: Request) -> JSONResponse:
+            try:
+                options = await request.json()
+            except Exception:
+                options = {}
+            return self._admin_response(request, lambda: self.profiler.start(
+                options.get("message_type"),
+                float(options.get("sample_rate", 1.0)),
+                float(options.get("interval_ms", 5.0)),
+                float(options["duration"]) if options.get("duration") else None,
+            ))
+
+        @self.app.delete("/admin/profile")
+        async def profile_stop(request: Request) -> JSONResponse:
+            return self._admin_response(request, self.profiler.stop)
+
+    def _admin_response(self, request: Request, action: Callable[[], dict]) -> JSONResponse:
+        """Run an admin action for loopback clients only."""
+        client = request.client.host if request.client else None
+        if client not in ("127.0.0.1", "::1", "localhost"):
+            return JSONResponse({"error": "Admin endpoints are local only"}, status_code=403)
+        try:
+            return JSONResponse(action())
+        except (RuntimeError, ValueError, TypeError) as e:
+            return JSONResponse({"error": str(e)}, status_code=409)
+
     async def _handle_request(self, request: Request) -> JSONResponse:
-        """Handle incoming MCP request with auth and rate limiting."""
+        """Handle incoming HTTP MCP request."""
         try:
             body = await request.json()
         except Exception:
-            return self._error_response(None, -32700, "Parse error")
+            REQUESTS.labels(self.sender, "unknown", "parse_error").inc()
+            return JSONResponse(self._error_response(None, -32700, "Parse error"))
+        return JSONResponse(await self.dispatch(body))
+
+    async def dispatch(self, body: dict[str, Any]) -> dict[str, Any]:
+        """
+        Process a JSON-RPC request, recording request metrics.
+
+        A trace context in the envelope becomes the handler's active
+        context (so its outgoing messages continue the trace) and the
+        request is recorded as a "handle:<method>" span.
+        """
+        start = time.perf_counter()
+        # Only registered message types become label values and span names
+        method = body.get("method") if isinstance(body, dict) else None
+        method = method if method in self._handlers else "unknown"
+        params = body.get("params") if isinstance(body, dict) else None
+        context = tracing.extract(params) if isinstance(params, dict) else None
+
+        in_flight = IN_FLIGHT.labels(self.sender)
+        in_flight.inc()
+        token = tracing.attach(context)
+        watchdog = self.watchdog
+        label = watchdog.enter(method) if watchdog else None
+        profiled = self.profiler.active and self.profiler.enter(method)
+        try:
+            if context is None:
+                response = await self._dispatch(body)
+            else:
+                with tracing.Span(self.logger, f"handle:{method}", match_id=params.get("match_id")):
+                    response = await self._dispatch(body)
+        finally:
+            if watchdog:
+                watchdog.exit(label)
+            if profiled:
+                self.profiler.exit(profiled)
+            tracing.detach(token)
+            in_flight.dec()
 
+        error = response.get("error")
+        status = ERROR_STATUS.get(error["code"], "error") if error else "ok"
+        REQUESTS.labels(self.sender, method, status).inc()
+        REQUEST_SECONDS.labels(self.sender, method).observe(time.perf_counter() - start)
+        return response
+
+    async def _dispatch(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Process a JSON-RPC request with auth and rate limiting."""
         # Validate JSON-RPC structure
-        if body.get("jsonrpc") != "2.0":
-            return self._error_response(body.get("id"), -32600, "Invalid Request")
+        if not isinstance(body, dict) or body.get("jsonrpc") != "2.0":
+            request_id = body.get("id") if isinstance(body, dict) else None
+            return self._error_response(request_id, -32600, "Invalid Request")
 
         method = body.get("method")
         params = body.get("params", {})
         request_id = body.get("id")
         sender = params.get("sender", "unknown")
 
-        # Rate limiting check
-        if self._enable_rate_limiting and not self._rate_limiter.is_allowed(sender):
-            self.logger.warning("RATE_LIMITED", f"Rate limit exceeded: {sender}")
-            return self._error_response(request_id, -32000, "Rate limit exceeded")
-
         # Validate envelope
         if not self._validate_envelope(params):
             return self._error_response(request_id, -32602, "Invalid envelope")
@@ -102,6 +255,33 @@ class MCPServer:
                 self.logger.warning("AUTH_FAILED", f"Invalid auth: {sender}")
                 return self._error_response(request_id, -32001, "Auth failed")
 
+            # Learn the advertised endpoint only once the sender is proven
+            if self._is_token_owner(auth_token, sender):
+                self.directory.observe(params)
+
+        # Retries and hedged copies reuse the request id: replay a finished
+        # request's response, or share the response of one still running.
+        # Answered before rate limiting, so copies of one request do not
+        # use up the sender's budget. The method is part of the key so a
+        # sender reusing an id for another message is not answered with
+        # the first message's response
+        key = (sender, method, request_id)
+        if request_id is not None:
+            label = method if method in self._handlers else "unknown"
+            cached = self._responses.get(key)
+            if cached is not None:
+                REPLAYED.labels(self.sender, label).inc()
+                return cached
+            pending = self._pending.get(key)
+            if pending is not None:
+                DUPLICATES.labels(self.sender, label).inc()
+                return await asyncio.shield(pending)
+
+        # Rate limiting check
+        if self._enable_rate_limiting and not self._rate_limiter.is_allowed(sender):
+            self.logger.warning("RATE_LIMITED", f"Rate limit exceeded: {sender}")
+            return self._error_response(request_id, -32000, "Rate limit exceeded")
+
         # Log incoming message
         self.logger.message_received(method, sender)
 
@@ -110,13 +290,35 @@ class MCPServer:
         if not handler:
             return self._error_response(request_id, -32601, f"Unknown: {method}")
 
+        if request_id is None:
+            return await self._call_handler(handler, method, params, request_id)
+
+        pending = self._pending[key] = asyncio.get_running_loop().create_future()
+        response = None
+        try:
+            response = await self._call_handler(handler, method, params, request_id)
+            if "result" in response:  # Failed requests may be retried for real
+                self._responses.put(key, response)
+            return response
+        finally:
+            # If this copy was cancelled, waiting copies get an error they
+            # can retry rather than the cancellation
+            del self._pending[key]
+            pending.set_result(
+                response or self._error_response(request_id, -32603, "Request interrupted")
+            )
+
+    async def _call_handler(
+        self,
+        handler: Callable,
+        method: str,
+        params: dict[str, Any],
+        request_id: Any,
+    ) -> dict[str, Any]:
+        """Run a handler, turning exceptions into JSON-RPC errors."""
         try:
             result = await handler(params)
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id,
-            })
+            return {"jsonrpc": "2.0", "result": result, "id": request_id}
         except Exception as e:
             self.logger.error("HANDLER_ERROR", str(e), method=method)
             return self._error_response(request_id, -32603, str(e))
@@ -138,22 +340,108 @@ class MCPServer:
             return False
         return self._auth_validator.validate_token(token)
 
+    def _is_token_owner(self, token: Optional[str], sender: str) -> bool:
+        """Whether the token was issued to the agent named in sender."""
+        owner = self._auth_validator.get_agent_for_token(token) if token else None
+        return bool(owner) and owner.split(":")[-1] == sender.split(":")[-1]
+
     def register_auth_token(self, agent_id: str, token: str) -> None:
         """Register a valid auth token for an agent."""
         self._auth_validator.register_token(agent_id, token)
 
+    def unregister_auth_token(self, agent_id: str) -> None:
+        """Revoke an agent's auth token."""
+        self._auth_validator.unregister_token(agent_id)
+
     def _error_response(
         self,
         request_id: Optional[str],
         code: int,
         message: str,
-    ) -> JSONResponse:
+    ) -> dict[str, Any]:
         """Create JSON-RPC error response."""
-        return JSONResponse({
+        return {
             "jsonrpc": "2.0",
             "error": {"code": code, "message": message},
             "id": request_id,
-        })
+        }
+
+    async def _serve_peer(self, websocket: WebSocket) -> None:
+        """
+        Serve an accepted WebSocket until it disconnects.
+
+        The remote's requests are always answered. Our own clients route
+        to the remote over the socket only if it proved it owns the
+        endpoint it claims, and never in place of a live peer.
+        """
+        endpoint = websocket.query_params.get("endpoint")
+        peer = WebSocketPeer(
+            websocket.send_text, websocket.receive_text, self.dispatch, websocket.close
+        )
+        existing = self.peers.get(endpoint) if endpoint else None
+        routed = (existing is None or existing.closed) and self._is_peer_proven(
+            endpoint, websocket.headers.get(PEER_TOKEN_HEADER)
+        )
+        if routed:
+            self.peers[endpoint] = peer  # Lets our clients reach the remote
+        try:
+            await peer.run()
+        finally:
+            if routed and self.peers.get(endpoint) is peer:
+                del self.peers[endpoint]
+
+    def grant_peer(self, endpoint: str) -> str:
+        """
+        Issue a one-time token for the agent at endpoint to open a peer.
+
+        Send it only in a message addressed to that (trusted) endpoint:
+        presenting it on connect proves the caller receives that traffic.
+        """
+        token = self._peer_grants[endpoint] = generate_token()
+        return token
+
+    def _is_peer_proven(self, endpoint: Optional[str], token: Optional[str]) -> bool:
+        """Whether token proves the WebSocket caller owns endpoint."""
+        if not endpoint or not token:
+            return False
+        granted = self._peer_grants.get(endpoint)
+        if granted and secrets.compare_digest(granted, token):
+            del self._peer_grants[endpoint]
+            return True
+        # An auth token we issued, whose owner is registered at endpoint
+        owner = self._auth_validator.get_agent_for_token(token)
+        return bool(owner) and self.directory.resolve(owner.split(":")[-1]) == endpoint
+
+    def serve_in_process(self) -> "MCPServer":
+        """Let clients in this process reach the server without HTTP."""
+        local_registry.register(self)
+        return self
+
+    async def connect_peer(self, endpoint: str, token: Optional[str] = None) -> WebSocketPeer:
+        """
+        Open (or reuse) a persistent WebSocket to another agent.
+
+        Our clients route to the remote through the peer. With a token
+        the remote accepts (a grant_peer token or our auth token), the
+        remote reaches us back over the same connection too.
+        """
+        peer = self.peers.get(endpoint)
+        if peer and not peer.closed:
+            return peer
+        peer = await connect_peer(endpoint, self.dispatch, self.endpoint, token)
+        self.peers[endpoint] = peer
+        task = asyncio.create_task(self._run_peer(endpoint, peer))
+        self._peer_tasks.add(task)
+        task.add_done_callback(self._peer_tasks.discard)
+        return peer
+
+    async def _run_peer(self, endpoint: str, peer: WebSocketPeer) -> None:
+        """Run an outbound peer's read loop, dropping it once closed."""
+        try:
+            await peer.run()
+        finally:
+            if self.peers.get(endpoint) is peer:
+                del self.peers[endpoint]
 
     def register_handler(self, message_type: str, handler: Callable) -> None:
         """Register a message handler."""
@@ -167,5 +455,6 @@ class MCPServer:
             "sender": self.sender,
             "timestamp": utc_now(),
             "conversation_id": kwargs.pop("conversation_id", generate_uuid()),
+            "contact_endpoint": self.endpoint,
             **kwargs,
         }
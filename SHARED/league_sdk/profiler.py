@@ -0,0 +1,215 @@
+"""
+Runtime sampling profiler for MCP handlers.
+
+While a session is active, a thread samples the event-loop thread's
+stack every `interval` and attributes each sample to the message type
+whose request task is running at that moment. Only requests picked for
+profiling (matching message type, `sample_rate` of them) are labelled,
+so other traffic and idle time are not counted.
+
+Sampling fits asyncio better than cProfile: a deterministic profiler
+charges interleaved coroutines to whichever function happens to be on
+the stack, while a sample records exactly what the loop was executing.
+Awaited I/O does not show up (the loop is running other work or idle);
+the profile is on-loop CPU time per handler. Work in background tasks a
+handler spawns is not attributed to it.
+
+Results are written as collapsed stacks ("frame;frame;frame count"), one
+file per message type, ready for flamegraph.pl or speedscope.
+
+Usage (MCPServer exposes this at /admin/profile):
+    profiler.start("MATCH_RESULT_REPORT", sample_rate=0.5, duration=60)
+    ...
+    profiler.stop()  # -> {"files": {...}, "samples": {...}, ...}
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+import weakref
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_PROFILE_DIR = Path(__file__).parent.parent / "logs" / "profiles"
+MAX_STACK_DEPTH = 64  # Innermost frames kept per sample
+
+
+def collapse_stack(frame) -> str:
+    """Outermost-first "function (file:line)" frames joined by ';'."""
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SamplingProfiler:
+    """Samples the event loop and aggregates stacks per message type."""
+
+    def __init__(self, agent_id: str, output_dir: Optional[Path] = None):
+        """
+        Initialize profiler.
+
+        Args:
+            agent_id: Agent identifier (names the output directory)
+            output_dir: Base directory. Defaults to SHARED/logs/profiles/
+        """
+        self.agent_id = agent_id
+        self.output_dir = Path(output_dir) if output_dir else DEFAULT_PROFILE_DIR
+
+        self.message_type: Optional[str] = None  # None profiles every type
+        self.sample_rate = 1.0
+        self.interval = 0.005
+        self.started_at: Optional[float] = None
+
+        self._labels: "weakref.WeakKeyDictionary[asyncio.Task, str]" = weakref.WeakKeyDictionary()
+        self._stacks: dict[str, Counter] = defaultdict(Counter)
+        self._requests: Counter = Counter()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock = threading.Lock()
+        self._rng = random.Random()
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None
+
+    def start(
+        self,
+        message_type: Optional[str] = None,
+        sample_rate: float = 1.0,
+        interval_ms: float = 5.0,
+        duration: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """
+        Start a profiling session (call from the event loop).
+
+        Args:
+            message_type: Message type to profile (None for all)
+            sample_rate: Fraction of matching requests to profile
+            interval_ms: Stack sampling period
+            duration: Stop automatically after this many seconds
+
+        Returns:
+            Session status
+
+        Raises:
+            RuntimeError: If a session is already running
+            ValueError: On an invalid rate or interval
+        """
+        if self.active:
+            raise RuntimeError("Profiling session already running")
+        if not 0 < sample_rate <= 1 or interval_ms <= 0:
+            raise ValueError("sample_rate must be in (0, 1] and interval_ms positive")
+
+        self.message_type = message_type
+        self.sample_rate = sample_rate
+        self.interval = interval_ms / 1000
+        self.started_at = time.time()
+        self._stacks.clear()
+        self._requests.clear()
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run_sampler, name=f"profiler-{self.agent_id}", daemon=True
+        )
+        self._thread.start()
+        if duration:
+            self._timer = self._loop.call_later(duration, self.stop)
+        return self.status()
+
+    def stop(self) -> dict[str, Any]:
+        """
+        End the session and write one collapsed-stack file per message type.
+
+        Returns:
+            Session summary with the files written
+        """
+        if not self.active:
+            return self.status()
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        stamp = datetime.fromtimestamp(self.started_at, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        session_dir = self.output_dir / self.agent_id / stamp
+        files = {}
+        with self._lock:
+            stacks = {label: Counter(c) for label, c in self._stacks.items()}
+        for label, counts in stacks.items():
+            session_dir.mkdir(parents=True, exist_ok=True)
+            path = session_dir / f"{label}.collapsed"
+            path.write_text(
+                "".join(f"{stack} {n}\n" for stack, n in counts.most_common()), encoding="utf-8"
+            )
+            files[label] = str(path)
+
+        summary = self.status()
+        summary["files"] = files
+        return summary
+
+    def status(self) -> dict[str, Any]:
+        """Current session settings and counts."""
+        with self._lock:
+            samples = {label: sum(c.values()) for label, c in self._stacks.items()}
+        return {
+            "active": self.active,
+            "message_type": self.message_type,
+            "sample_rate": self.sample_rate,
+            "interval_ms": self.interval * 1000,
+            "started_at": self.started_at,
+            "requests": dict(self._requests),
+            "samples": samples,
+        }
+
+    def enter(self, message_type: str) -> bool:
+        """
+        Decide whether the current request is profiled and label its task.
+
+        Returns:
+            True if labelled (pass to exit())
+        """
+        if self.message_type not in (None, message_type):
+            return False
+        if self.sample_rate < 1 and self._rng.random() >= self.sample_rate:
+            return False
+        task = asyncio.current_task()
+        if task is None or task in self._labels:
+            return False  # Nested in-process dispatch: keep the outer label
+        self._labels[task] = message_type
+        self._requests[message_type] += 1
+        return True
+
+    def exit(self, labelled: bool) -> None:
+        """Remove the label set by enter()."""
+        if labelled:
+            self._labels.pop(asyncio.current_task(), None)
+
+    def _run_sampler(self) -> None:
+        """Record the loop thread's stack whenever a labelled task is running."""
+        while not self._stop.wait(self.interval):
+            try:
+                task = asyncio.current_task(self._loop)
+            except RuntimeError:
+                continue
+            label = self._labels.get(task) if task is not None else None
+            if label is None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            stack = collapse_stack(frame)
+            with self._lock:
+                self._stacks[label][stack] += 1
@@ -0,0 +1,131 @@
+"""
+Retry policy for MCPClient: jittered backoff, deadlines and budgets.
+
+- Full-jitter exponential backoff: attempt n sleeps a random time in
+  [0, min(cap, base * 2**n)], so clients that failed together do not
+  retry together.
+- Deadlines: a call carrying a deadline (explicitly or via its
+  deadline/response_deadline field) never waits past it; retries that
+  could not finish in time are abandoned with DeadlineExceeded.
+- Retry budgets: a token bucket per endpoint. Every retry spends a token
+  and tokens refill at a fixed rate, so a failing endpoint sees at most
+  `capacity` retries in a burst and `refill_per_second` after that,
+  however many callers are retrying. Budgets of endpoints not retried
+  for a while are evicted; a budget idle that long has refilled anyway.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+
+from .metrics import metrics_registry
+
+DEFAULT_BUDGET_CAPACITY = 10      # Retries allowed in a burst per endpoint
+DEFAULT_BUDGET_REFILL = 1.0       # Retry tokens regained per second
+DEFAULT_MAX_BUDGETS = 512         # Endpoints tracked by one registry
+DEFAULT_IDLE_SECONDS = 600        # Unused budgets evicted first
+
+RETRY_BUDGET_TOKENS = metrics_registry.gauge(
+    "mcp_client_retry_budget_tokens", "Retry tokens left per endpoint", ("endpoint",)
+)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Raised when a call's deadline passes before it could succeed."""
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: random.Random = random) -> float:
+    """
+    Full-jitter exponential backoff.
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        base: Delay scale in seconds
+        cap: Upper bound on the delay range
+
+    Returns:
+        Seconds to sleep, uniform in [0, min(cap, base * 2**attempt)]
+    """
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
+@dataclass
+class RetryBudget:
+    """Token bucket limiting retries to one endpoint."""
+
+    capacity: float = DEFAULT_BUDGET_CAPACITY
+    refill_per_second: float = DEFAULT_BUDGET_REFILL
+    name: str = ""
+
+    _tokens: float = field(default=-1.0)
+    _updated: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        if self._tokens < 0:
+            self._tokens = self.capacity
+
+    @property
+    def last_used(self) -> float:
+        """Monotonic time of the last token check."""
+        return self._updated
+
+    @property
+    def tokens(self) -> float:
+        """Tokens available now."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+        return self._tokens
+
+    def try_acquire(self) -> bool:
+        """Spend one token if available."""
+        allowed = self.tokens >= 1
+        if allowed:
+            self._tokens -= 1
+        if self.name:
+            RETRY_BUDGET_TOKENS.labels(self.name).set(self._tokens)
+        return allowed
+
+
+class RetryBudgetRegistry:
+    """Retry budgets by endpoint, bounded like CircuitBreakerRegistry."""
+
+    def __init__(
+        self,
+        capacity: float = DEFAULT_BUDGET_CAPACITY,
+        refill_per_second: float = DEFAULT_BUDGET_REFILL,
+        max_budgets: int = DEFAULT_MAX_BUDGETS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_budgets = max_budgets
+        self.idle_seconds = idle_seconds
+        self._budgets: dict[str, RetryBudget] = {}
+
+    def get(self, endpoint: str) -> RetryBudget:
+        """Get or create the budget for an endpoint."""
+        budget = self._budgets.get(endpoint)
+        if budget is None:
+            budget = self._budgets[endpoint] = RetryBudget(
+                self.capacity, self.refill_per_second, name=endpoint
+            )
+            if len(self._budgets) > self.max_budgets:
+                self._evict()
+        return budget
+
+    def _evict(self) -> None:
+        """Drop idle budgets, then least recently used ones, down to the bound."""
+        now = time.monotonic()
+        by_use = sorted(self._budgets.items(), key=lambda item: item[1].last_used)
+        excess = len(by_use) - self.max_budgets
+        for endpoint, budget in by_use:
+            if excess <= 0 and now - budget.last_used < self.idle_seconds:
+                break
+            if self._budgets.pop(endpoint, None) is not None:
+                RETRY_BUDGET_TOKENS.remove(endpoint)
+                excess -= 1
+
+    def __len__(self) -> int:
+        return len(self._budgets)
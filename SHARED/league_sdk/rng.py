@@ -0,0 +1,51 @@
+"""
+Deterministic random streams.
+
+Each league has one seed; every consumer (a match's draw, a player's
+choice in a match) gets its own random.Random derived from that seed
+and a few labels. Streams never share state, so results do not depend
+on execution order, process, or thread, and any single match can be
+replayed from (league seed, match_id) alone.
+"""
+
+import hashlib
+import random
+import secrets
+from typing import Optional
+
+DRAW_STREAM = "draw"  # Label of the referee's number-draw stream
+
+
+def derive_seed(*parts: object) -> int:
+    """
+    Derive a 64-bit seed from a parent seed and labels.
+
+    Args:
+        parts: Seed and labels, e.g. (league_seed, match_id, "draw")
+
+    Returns:
+        Seed that is stable across processes and Python versions
+    """
+    material = "\x1f".join(str(p) for p in parts).encode()
+    return int.from_bytes(hashlib.blake2b(material, digest_size=8).digest(), "big")
+
+
+def rng_stream(seed: Optional[int], *labels: object) -> random.Random:
+    """
+    Get an independent random stream.
+
+    Args:
+        seed: League (or agent) seed; None gives an unseeded stream
+        labels: Stream labels, e.g. (match_id, player_id)
+
+    Returns:
+        Private random.Random instance
+    """
+    if seed is None:
+        return random.Random()
+    return random.Random(derive_seed(seed, *labels))
+
+
+def new_league_seed() -> int:
+    """Generate a fresh league seed (logged so the league can be replayed)."""
+    return secrets.randbits(63)
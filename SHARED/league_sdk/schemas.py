@@ -31,6 +31,7 @@ class LeagueRegisterResponse(MessageEnvelope):
     player_id: Optional[str] = None
     auth_token: Optional[str] = None
     reason: Optional[str] = None
+    endpoints: Optional[dict[str, str]] = None  # Agent ID -> endpoint directory
 
 
 class RefereeRegisterRequest(MessageEnvelope):
@@ -45,6 +46,8 @@ class RefereeRegisterResponse(MessageEnvelope):
     status: Literal["REGISTERED", "REJECTED"]
     referee_id: Optional[str] = None
     auth_token: Optional[str] = None
+    reason: Optional[str] = None
+    endpoints: Optional[dict[str, str]] = None  # Agent ID -> endpoint directory
 
 
 # Round Messages
@@ -72,6 +75,9 @@ class GameInvitation(MessageEnvelope):
     opponent_id: str
     role_in_match: MatchRole
     response_deadline: str
+    ack_in_response: bool = False  # Referee accepts GAME_JOIN_ACK as the reply
+    parity_in_response: bool = False  # Referee accepts an early parity choice
+    peer_token: Optional[str] = None  # Lets the player open a WebSocket back to the referee
 
 
 class GameJoinAck(MessageEnvelope):
@@ -79,6 +85,7 @@ class GameJoinAck(MessageEnvelope):
     message_type: Literal["GAME_JOIN_ACK"] = "GAME_JOIN_ACK"
     match_id: str
     status: Literal["ACCEPTED", "DECLINED"] = "ACCEPTED"
+    parity_choice: Optional[ParityChoice] = None  # Only on the fast path
 
 
 class ChooseParityCall(MessageEnvelope):
@@ -133,7 +140,8 @@ class LeagueStandingsUpdate(MessageEnvelope):
 class LeagueQuery(MessageEnvelope):
     """League information query."""
     message_type: Literal["LEAGUE_QUERY"] = "LEAGUE_QUERY"
-    query_type: Literal["standings", "schedule", "stats", "next_match"]
+    query_type: Literal["standings", "schedule", "stats", "next_match", "endpoints"]
+    agent_ids: Optional[list[str]] = None  # Filter for "endpoints" queries
 
 
 class LeagueQueryResponse(MessageEnvelope):
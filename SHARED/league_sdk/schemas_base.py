@@ -68,6 +68,7 @@ class MessageEnvelope(BaseModel):
     timestamp: str
     conversation_id: str
     auth_token: Optional[str] = None
+    contact_endpoint: Optional[str] = None  # Sender's own /mcp endpoint
 
     @field_validator("timestamp")
     @classmethod
@@ -0,0 +1,123 @@
+"""
+Lightweight span tracing across agents.
+
+A trace id and the current span id live in a context variable. MCPClient
+copies them into every outgoing envelope (trace_id, parent_span_id) and
+MCPServer.dispatch restores them for the handler, so spans recorded by
+different agents for one match share a trace id and form a tree. Spans
+are written to the agent's JSONL log as SPAN records; tools/trace_report.py
+assembles them into per-match waterfalls.
+
+Usage:
+    with Span(logger, "parity_collection", match_id=match_id):
+        ...
+"""
+
+import secrets
+import time
+from contextvars import ContextVar
+from typing import Any, NamedTuple, Optional
+
+from .logger import JsonLogger
+
+
+class SpanContext(NamedTuple):
+    """Identifies the active span of a trace."""
+
+    trace_id: str
+    span_id: Optional[str]
+
+
+_current: ContextVar[Optional[SpanContext]] = ContextVar("trace_context", default=None)
+
+
+def new_id() -> str:
+    """Random 64-bit id as 16 hex characters."""
+    return secrets.token_hex(8)
+
+
+def current_context() -> Optional[SpanContext]:
+    """The active span context, if any."""
+    return _current.get()
+
+
+def inject(envelope: dict[str, Any]) -> None:
+    """Add the active trace context to an outgoing envelope."""
+    context = _current.get()
+    if context is not None:
+        envelope["trace_id"] = context.trace_id
+        if context.span_id:
+            envelope["parent_span_id"] = context.span_id
+
+
+def extract(params: dict[str, Any]) -> Optional[SpanContext]:
+    """Read a trace context from an incoming envelope."""
+    trace_id = params.get("trace_id")
+    if not trace_id or not isinstance(trace_id, str):
+        return None
+    parent = params.get("parent_span_id")
+    return SpanContext(trace_id, parent if isinstance(parent, str) else None)
+
+
+class Span:
+    """
+    Context manager recording one span.
+
+    The span is a child of the active span (or of `parent`). With
+    root=True it starts a new trace instead, ignoring the active one.
+    Extra keyword arguments are stored on the SPAN record.
+    """
+
+    __slots__ = (
+        "logger", "name", "parent", "attributes", "context", "_token", "_start", "_wall",
+    )
+
+    def __init__(
+        self,
+        logger: JsonLogger,
+        name: str,
+        parent: Optional[SpanContext] = None,
+        root: bool = False,
+        **attributes: Any,
+    ):
+        self.logger = logger
+        self.name = name
+        self.parent = None if root else (parent or _current.get())
+        self.attributes = attributes
+
+    def __enter__(self) -> "Span":
+        trace_id = self.parent.trace_id if self.parent else new_id()
+        self.context = SpanContext(trace_id, new_id())
+        self._token = _current.set(self.context)
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration_ms = (time.perf_counter() - self._start) * 1000
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.logger.span(
+            self.name,
+            trace_id=self.context.trace_id,
+            span_id=self.context.span_id,
+            parent_span_id=self.parent.span_id if self.parent else None,
+            start=self._wall,
+            duration_ms=round(duration_ms, 3),
+            **self.attributes,
+        )
+
+    def set(self, **attributes: Any) -> None:
+        """Add attributes to the span before it ends."""
+        self.attributes.update(attributes)
+
+
+def attach(context: Optional[SpanContext]):
+    """Make `context` active; returns a token for detach()."""
+    return _current.set(context)
+
+
+def detach(token) -> None:
+    """Restore the context active before attach()."""
+    _current.reset(token)
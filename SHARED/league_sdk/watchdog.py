@@ -0,0 +1,207 @@
+"""
+Event-loop lag watchdog.
+
+A heartbeat coroutine sleeps for `interval` and measures how late it
+wakes up; that delay is the time the loop spent running something else
+without yielding. A monitor thread watches the heartbeat and, while it
+is overdue by more than `threshold`, samples the loop thread's stack
+with sys._current_frames(), so the blocking call itself (a synchronous
+file write, a blocking HTTP call, a large print) shows up in the sample
+rather than the code that ran after it.
+
+When the loop recovers the heartbeat logs one LOOP_LAG warning with the
+lag, the handler whose task was running and the distinct stacks seen.
+MCPServer labels each request's task with its message type; other tasks
+are labelled by coroutine name.
+
+Usage:
+    server.enable_watchdog(threshold_ms=50)   # Starts with the app
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import Counter as Tally
+from pathlib import Path
+from typing import Optional
+
+from .logger import JsonLogger
+from .metrics import metrics_registry
+
+LOOP_LAG_SECONDS = metrics_registry.histogram(
+    "event_loop_lag_seconds", "Heartbeat wake-up delay", ("agent",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+LOOP_STALLS = metrics_registry.counter(
+    "event_loop_stalls_total", "Heartbeats later than the watchdog threshold", ("agent", "task")
+)
+
+MAX_STACK_DEPTH = 12  # Innermost frames kept per sample
+
+
+def format_stack(frame) -> list[str]:
+    """Innermost-last "file:line in function" lines for a frame's stack."""
+    frames = traceback.extract_stack(frame)[-MAX_STACK_DEPTH:]
+    return [f"{Path(f.filename).name}:{f.lineno} in {f.name}" for f in frames]
+
+
+class LoopWatchdog:
+    """Detects event-loop stalls and samples the stack that caused them."""
+
+    def __init__(
+        self,
+        logger: JsonLogger,
+        agent: str,
+        threshold_ms: float = 100.0,
+        interval_ms: float = 20.0,
+        max_samples: int = 20,
+    ):
+        """
+        Initialize watchdog.
+
+        Args:
+            logger: Logger for LOOP_LAG records
+            agent: Agent label for metrics
+            threshold_ms: Lag above which a stall is reported
+            interval_ms: Heartbeat period
+            max_samples: Stack samples kept per stall
+        """
+        self.logger = logger
+        self.agent = agent
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.max_samples = max_samples
+
+        self._labels: "weakref.WeakKeyDictionary[asyncio.Task, str]" = weakref.WeakKeyDictionary()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._monitor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._beat = 0.0  # time.monotonic() of the last heartbeat wake-up
+
+        # Written by the monitor thread during a stall, taken by the heartbeat
+        self._stall_task: Optional[str] = None
+        self._stall_stacks: list[tuple[str, ...]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat is not None and not self._heartbeat.done()
+
+    def enter(self, label: str) -> Optional[str]:
+        """Label the current task (e.g. with a handler name); returns the previous label."""
+        task = asyncio.current_task()
+        if task is None:
+            return None
+        previous = self._labels.get(task)
+        self._labels[task] = label
+        return previous
+
+    def exit(self, previous: Optional[str]) -> None:
+        """Restore the label returned by enter()."""
+        task = asyncio.current_task()
+        if task is None:
+            return
+        if previous is None:
+            self._labels.pop(task, None)
+        else:
+            self._labels[task] = previous
+
+    def start(self) -> None:
+        """Start the heartbeat and monitor thread (call from the event loop)."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat = self._loop.create_task(self._run_heartbeat())
+        self._monitor = threading.Thread(
+            target=self._run_monitor, name=f"watchdog-{self.agent}", daemon=True
+        )
+        self._monitor.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and join the monitor thread."""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+        if self._monitor is not None:
+            self._monitor.join(timeout=1)
+            self._monitor = None
+
+    async def _run_heartbeat(self) -> None:
+        """Measure wake-up delay every interval and report stalls."""
+        lag_child = LOOP_LAG_SECONDS.labels(self.agent)
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - start - self.interval, 0.0)
+            self._beat = time.monotonic()
+            lag_child.observe(lag)
+            if lag > self.threshold:
+                self._report(lag)
+            elif self._stall_task is not None:
+                with self._lock:  # Samples from a stall that stayed under threshold
+                    self._stall_task, self._stall_stacks = None, []
+
+    def _report(self, lag: float) -> None:
+        """Log one stall with the samples the monitor took during it."""
+        with self._lock:
+            task, stacks = self._stall_task, self._stall_stacks
+            self._stall_task, self._stall_stacks = None, []
+
+        task = task or "unknown"
+        LOOP_STALLS.labels(self.agent, task).inc()
+        samples = [
+            {"count": count, "stack": list(stack)}
+            for stack, count in Tally(stacks).most_common()
+        ]
+        top = samples[0]["stack"][-1] if samples else "no sample"
+        self.logger.warning(
+            "LOOP_LAG",
+            f"Event loop blocked {lag * 1000:.0f} ms in {task} at {top}",
+            lag_ms=round(lag * 1000, 1),
+            task=task,
+            samples=samples,
+        )
+
+    def _run_monitor(self) -> None:
+        """Sample the loop thread's stack whenever the heartbeat is overdue."""
+        poll = min(self.interval, self.threshold / 2)
+        while not self._stop.wait(poll):
+            overdue = time.monotonic() - self._beat - self.interval
+            if overdue <= self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            stack = tuple(format_stack(frame))
+            with self._lock:
+                if self._stall_task is None:
+                    self._stall_task = self._describe_current_task()
+                if len(self._stall_stacks) < self.max_samples:
+                    self._stall_stacks.append(stack)
+
+    def _describe_current_task(self) -> str:
+        """Label of the task running on the loop right now (monitor thread)."""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return "unknown"
+        if task is None:
+            return "callback"  # A plain loop callback, e.g. transport I/O
+        label = self._labels.get(task)
+        if label:
+            return label
+        coro = task.get_coro()
+        return getattr(coro, "__qualname__", None) or task.get_name()
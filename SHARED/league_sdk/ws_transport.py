@@ -0,0 +1,167 @@
+"""
+Persistent WebSocket transport between agents.
+
+One connection carries JSON-RPC traffic in both directions. Outgoing
+requests are correlated with their responses by JSON-RPC id, so many
+messages can be in flight at once; incoming requests are dispatched to
+the local MCPServer and answered on the same socket.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import quote
+
+try:
+    import websockets
+except ImportError:  # Optional dependency
+    websockets = None
+
+
+# Configuration constants
+DEFAULT_REQUEST_TIMEOUT = 30  # Seconds to wait for a correlated response
+PEER_TOKEN_HEADER = "X-Peer-Token"  # Proves the caller's identity on connect
+
+SendText = Callable[[str], Awaitable[None]]
+ReceiveText = Callable[[], Awaitable[str]]
+Dispatch = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+class WebSocketPeer:
+    """
+    Multiplexed JSON-RPC peer over a single WebSocket.
+
+    Transport-agnostic: takes send/receive coroutines so it can wrap a
+    Starlette server socket, a websockets client connection, or an
+    in-memory pair in tests.
+    """
+
+    def __init__(
+        self,
+        send_text: SendText,
+        receive_text: ReceiveText,
+        dispatch: Dispatch,
+        close: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize peer.
+
+        Args:
+            send_text: Coroutine sending one text frame
+            receive_text: Coroutine receiving one text frame
+            dispatch: Handler for incoming JSON-RPC requests
+            close: Optional coroutine closing the underlying socket
+        """
+        self._send_text = send_text
+        self._receive_text = receive_text
+        self._dispatch = dispatch
+        self._close = close
+        self._pending: dict[Any, asyncio.Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.closed = False
+
+    async def request(
+        self,
+        message: dict[str, Any],
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> dict[str, Any]:
+        """
+        Send a JSON-RPC request and wait for its response.
+
+        Raises:
+            ConnectionError: If the peer is or becomes closed
+            asyncio.TimeoutError: If no response arrives in time
+        """
+        if self.closed:
+            raise ConnectionError("WebSocket peer is closed")
+        request_id = message["id"]
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            try:
+                await self._send_text(json.dumps(message))
+            except Exception as e:  # ConnectionClosed, RuntimeError, WebSocketDisconnect
+                self._fail_pending()
+                raise ConnectionError(f"WebSocket send failed: {e!r}") from e
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def run(self) -> None:
+        """Read frames until the socket closes."""
+        try:
+            while True:
+                message = json.loads(await self._receive_text())
+                if "method" in message:
+                    task = asyncio.create_task(self._answer(message))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                    continue
+                future = self._pending.get(message.get("id"))
+                if future and not future.done():
+                    future.set_result(message)
+        except Exception:
+            pass  # Disconnect or protocol error ends the session
+        finally:
+            self._fail_pending()
+
+    async def _answer(self, message: dict[str, Any]) -> None:
+        """Dispatch an incoming request and send back its response."""
+        response = await self._dispatch(message)
+        if self.closed:
+            return
+        try:
+            await self._send_text(json.dumps(response))
+        except Exception:
+            self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Mark closed and fail every in-flight request."""
+        self.closed = True
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("WebSocket peer closed"))
+
+    async def close(self) -> None:
+        """Close the peer and its socket."""
+        self._fail_pending()
+        if self._close:
+            await self._close()
+
+
+def websocket_url(endpoint: str, contact_endpoint: Optional[str] = None) -> str:
+    """Map an agent's /mcp endpoint to its /ws URL."""
+    url = endpoint.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+    if url.endswith("/mcp"):
+        url = url[: -len("/mcp")] + "/ws"
+    if contact_endpoint:
+        url += f"?endpoint={quote(contact_endpoint, safe='')}"
+    return url
+
+
+async def connect_peer(
+    endpoint: str,
+    dispatch: Dispatch,
+    contact_endpoint: Optional[str] = None,
+    token: Optional[str] = None,
+) -> WebSocketPeer:
+    """
+    Open a persistent connection to another agent.
+
+    Args:
+        endpoint: Remote agent's /mcp endpoint
+        dispatch: Local handler for requests the remote sends back
+        contact_endpoint: Own endpoint, so the remote can route to us
+        token: Peer grant or auth token proving we own contact_endpoint;
+            without it the remote only answers our requests
+
+    Returns:
+        Connected peer; its read loop must be run by the caller
+    """
+    if websockets is None:
+        raise RuntimeError("WebSocket transport requires the 'websockets' package")
+    connection = await websockets.connect(
+        websocket_url(endpoint, contact_endpoint),
+        extra_headers={PEER_TOKEN_HEADER: token} if token else None,
+    )
+    return WebSocketPeer(connection.send, connection.recv, dispatch, connection.close)
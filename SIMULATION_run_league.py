@@ -2,51 +2,97 @@
 Full League Simulation - Entry point for Even/Odd league.
 
 Runs a complete league simulation with configurable execution mode.
-Usage: python run_league.py [--parallel]
+Usage: python run_league.py [--parallel] [--seed N] [--quiet]
+                            [--players N] [--events FILE]
 """
 
-import sys
+import argparse
+from typing import List, Optional
 
 from simulation import (
     LeagueSimulation,
+    JsonlSink,
     print_match_history,
     print_activity_log,
     print_final_results,
 )
 
+DEFAULT_PLAYERS = [
+    ("AlphaBot", "random"),
+    ("BetaBot", "deterministic_even"),
+    ("GammaBot", "alternating"),
+    ("DeltaBot", "adaptive"),
+]
 
-def main(parallel: bool = False) -> LeagueSimulation:
-    """Run the full league simulation."""
-    print("\n" + "="*80)
-    mode = "PARALLEL" if parallel else "SEQUENTIAL"
-    print(f"       EVEN/ODD AI AGENT LEAGUE - {mode} SIMULATION")
-    print("="*80 + "\n")
 
-    sim = LeagueSimulation(parallel=parallel)
+def main(
+    parallel: bool = False,
+    seed: Optional[int] = None,
+    quiet: bool = False,
+    players: int = len(DEFAULT_PLAYERS),
+    events: Optional[str] = None,
+) -> LeagueSimulation:
+    """
+    Run the full league simulation.
+
+    Args:
+        parallel: Play each round across a process pool
+        seed: League seed for a reproducible run
+        quiet: Headless mode - print only the final results
+        players: Number of players (strategies repeat in order)
+        events: Optional JSONL file receiving every structured event
+    """
+    sink = JsonlSink(events) if events else None
+    sim = LeagueSimulation(parallel=parallel, seed=seed, quiet=quiet, sink=sink)
+    say = (lambda *_: None) if quiet else print
+
+    say("\n" + "="*80)
+    mode = "PARALLEL" if parallel else "SEQUENTIAL"
+    say(f"       EVEN/ODD AI AGENT LEAGUE - {mode} SIMULATION")
+    say("="*80 + "\n")
 
-    print("--- Registering Referees ---")
-    sim.register_referee("REF01")
-    sim.register_referee("REF02")
+    try:
+        say("--- Registering Referees ---")
+        sim.register_referee("REF01")
+        sim.register_referee("REF02")
 
-    print("\n--- Registering Players ---")
-    sim.register_player("P01", "AlphaBot", "random")
-    sim.register_player("P02", "BetaBot", "deterministic_even")
-    sim.register_player("P03", "GammaBot", "alternating")
-    sim.register_player("P04", "DeltaBot", "adaptive")
+        say("\n--- Registering Players ---")
+        for i in range(players):
+            name, strategy = DEFAULT_PLAYERS[i % len(DEFAULT_PLAYERS)]
+            if i >= len(DEFAULT_PLAYERS):
+                name = f"{name}{i // len(DEFAULT_PLAYERS) + 1}"
+            sim.register_player(f"P{i + 1:02d}", name, strategy)
 
-    print("\n--- Generating Schedule ---")
-    sim.generate_schedule()
+        say("\n--- Generating Schedule ---")
+        sim.generate_schedule()
 
-    print("\n--- Running League ---")
-    sim.run_league()
+        say("\n--- Running League ---")
+        sim.run_league()
+    finally:
+        if sink:
+            sink.close()
 
-    print_match_history(sim.match_results)
-    print_activity_log(sim.activity_log)
+    if not quiet:
+        print_match_history(sim.match_results)
+        print_activity_log(sim.activity_log)
     print_final_results(sim.get_standings(), sim.get_performance_stats())
 
     return sim
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Even/Odd league simulation")
+    parser.add_argument("--parallel", action="store_true", help="Use a process pool")
+    parser.add_argument("--seed", type=int, default=None, help="League seed")
+    parser.add_argument("--quiet", action="store_true", help="Print final results only")
+    parser.add_argument("--players", type=int, default=len(DEFAULT_PLAYERS),
+                        help="Number of players")
+    parser.add_argument("--events", default=None, help="Write events to a JSONL file")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    parallel_mode = "--parallel" in sys.argv
-    main(parallel=parallel_mode)
+    args = parse_args()
+    main(parallel=args.parallel, seed=args.seed, quiet=args.quiet,
+         players=args.players, events=args.events)
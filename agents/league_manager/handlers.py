@@ -14,6 +14,7 @@ from league_sdk import (
     generate_uuid,
     generate_token,
     MCPClient,
+    Span,
 )
 
 if TYPE_CHECKING:
@@ -57,6 +58,7 @@ class LeagueManagerHandlers:
 
         # Register auth token so player can send authenticated messages
         self.manager.server.register_auth_token(f"player:{player_id}", auth_token)
+        self.manager.server.directory.register(player_id, endpoint, pinned=True)
 
         # Register in standings
         self.manager.standings.register_player(player_id, display_name)
@@ -82,6 +84,7 @@ class LeagueManagerHandlers:
             status="REGISTERED",
             player_id=player_id,
             auth_token=auth_token,
+            endpoints=self.manager.server.directory.snapshot(),
         )
 
     async def handle_referee_registration(self, params: dict) -> dict:
@@ -89,9 +92,38 @@ class LeagueManagerHandlers:
         referee_meta = params.get("referee_meta", {})
         endpoint = referee_meta.get("contact_endpoint")
 
-        # Assign referee ID
-        self.manager.referee_counter += 1
-        referee_id = f"REF{self.manager.referee_counter:02d}"
+        # Referees choose their own ID (format: "referee:REF03") so any number
+        # of referee processes can join the pool; fall back to sequential IDs
+        sender = params.get("sender", "")
+        requested_id = sender.split(":")[-1] if ":" in sender else ""
+        existing = self.manager.registered_referees.get(requested_id)
+        if requested_id.startswith("REF"):
+            # A referee restarted on its old endpoint takes its ID back with
+            # a new token; another endpoint claiming a taken ID would get
+            # the live referee's matches and a token for its identity
+            if existing and existing["endpoint"] != endpoint:
+                self.logger.warning(
+                    "REFEREE_REJECTED",
+                    f"Referee ID {requested_id} is already registered",
+                    referee_id=requested_id,
+                    endpoint=endpoint,
+                )
+                return self.manager.server.build_response(
+                    "REFEREE_REGISTER_RESPONSE",
+                    conversation_id=params.get("conversation_id"),
+                    status="REJECTED",
+                    referee_id=requested_id,
+                    reason=f"Referee ID {requested_id} is already registered",
+                )
+            if existing:
+                # The old process is gone; its token must not outlive it
+                self.manager.server.unregister_auth_token(f"referees:{requested_id}")
+            referee_id = requested_id
+        else:
+            self.manager.referee_counter += 1
+            while f"REF{self.manager.referee_counter:02d}" in self.manager.registered_referees:
+                self.manager.referee_counter += 1  # Skip IDs referees chose themselves
+            referee_id = f"REF{self.manager.referee_counter:02d}"
         auth_token = generate_token()
 
         # Store registration
@@ -104,11 +136,13 @@ class LeagueManagerHandlers:
 
         # Register auth token so referee can send authenticated messages
         self.manager.server.register_auth_token(f"referees:{referee_id}", auth_token)
+        self.manager.server.directory.register(referee_id, endpoint, pinned=True)
 
         self.logger.info(
             "REFEREE_REGISTERED",
-            f"Referee {referee_id} registered",
+            f"Referee {referee_id} registered at {endpoint}",
             referee_id=referee_id,
+            endpoint=endpoint,
         )
 
         # Print registration status
@@ -119,6 +153,9 @@ class LeagueManagerHandlers:
 
         # Check if we can start
         asyncio.create_task(self.manager.check_and_start_league())
+        if existing and self.manager.league_started:
+            # The old process took its accepted matches down with it
+            asyncio.create_task(self.restart_matches(referee_id))
 
         return self.manager.server.build_response(
             "REFEREE_REGISTER_RESPONSE",
@@ -126,6 +163,7 @@ class LeagueManagerHandlers:
             status="REGISTERED",
             referee_id=referee_id,
             auth_token=auth_token,
+            endpoints=self.manager.server.directory.snapshot(),
         )
 
     async def handle_match_result(self, params: dict) -> dict:
@@ -137,6 +175,13 @@ class LeagueManagerHandlers:
         player_b_result = params.get("player_b_result")
         winner_id = params.get("winner_id")
 
+        # A restarted referee replays matches whose report may already be in
+        if match_id in self.manager.reported_matches:
+            self.logger.warning("DUPLICATE_RESULT", f"Match {match_id} already reported",
+                                match_id=match_id)
+            return {"status": "ACCEPTED"}
+        self.manager.reported_matches.add(match_id)
+
         # Update standings
         self.manager.standings.update_result(player_a_id, player_a_result)
         self.manager.standings.update_result(player_b_id, player_b_result)
@@ -207,6 +252,12 @@ class LeagueManagerHandlers:
             player_id = sender.split(":")[-1] if ":" in sender else None
             if player_id:
                 data = {"match": self.manager.scheduler.get_player_next_match(player_id)}
+        elif query_type == "endpoints":
+            endpoints = self.manager.server.directory.snapshot()
+            agent_ids = params.get("agent_ids")
+            if agent_ids:
+                endpoints = {a: e for a, e in endpoints.items() if a in agent_ids}
+            data = {"endpoints": endpoints}
 
         return self.manager.server.build_response(
             "LEAGUE_QUERY_RESPONSE",
@@ -217,7 +268,7 @@ class LeagueManagerHandlers:
 
     async def start_round(self) -> None:
         """Start a new round."""
-        # Assign referees to matches
+        # Shard remaining matches over the current referee pool
         referee_ids = list(self.manager.registered_referees.keys())
         self.manager.scheduler.assign_referees(referee_ids)
 
@@ -238,6 +289,12 @@ class LeagueManagerHandlers:
         for match in round_matches:
             await self.notify_referee_start_match(match)
 
+    async def restart_matches(self, referee_id: str) -> None:
+        """Re-send a restarted referee its unreported matches of the current round."""
+        for match in self.manager.scheduler.get_current_round() or []:
+            if match["referee_id"] == referee_id and match["match_id"] not in self.manager.reported_matches:
+                await self.notify_referee_start_match(match)
+
     async def broadcast_round_announcement(
         self, round_id: str, round_num: int, matches: list[dict]
     ) -> None:
@@ -263,21 +320,30 @@ class LeagueManagerHandlers:
         )
 
         # Send HTTP request to referee to start match
-        client = MCPClient("league_manager:MANAGER")
+        client = MCPClient(
+            "league_manager:MANAGER",
+            contact_endpoint=self.manager.server.endpoint,
+            peers=self.manager.server.peers,
+        )
 
+        # Each match is its own trace, even when started from the previous
+        # match's result report
         try:
-            await client.send(
-                referee["endpoint"],
-                "START_MATCH",
-                {
-                    "match_id": match["match_id"],
-                    "round_id": match["round_id"],
-                    "player_a": match["player_a"],
-                    "player_b": match["player_b"],
-                    "player_a_endpoint": self.manager.registered_players[match["player_a"]]["endpoint"],
-                    "player_b_endpoint": self.manager.registered_players[match["player_b"]]["endpoint"],
-                }
-            )
+            with Span(self.logger, "start_match", root=True,
+                      match_id=match["match_id"], referee=referee_id):
+                await client.send(
+                    referee["endpoint"],
+                    "START_MATCH",
+                    {
+                        "match_id": match["match_id"],
+                        "round_id": match["round_id"],
+                        "player_a": match["player_a"],
+                        "player_b": match["player_b"],
+                        "player_a_endpoint": self.manager.registered_players[match["player_a"]]["endpoint"],
+                        "player_b_endpoint": self.manager.registered_players[match["player_b"]]["endpoint"],
+                        "league_seed": self.manager.league_seed,
+                    }
+                )
             self.logger.info("MATCH_STARTED", f"Referee {referee_id} starting {match['match_id']}")
         except Exception as e:
             self.logger.error("MATCH_START_FAILED", str(e), match_id=match["match_id"])
@@ -6,13 +6,14 @@ Manages player/referee registration, scheduling, and standings.
 
 import sys
 import asyncio
+import argparse
 from pathlib import Path
 
 # Add SHARED to path for league_sdk imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
 
 import uvicorn
-from league_sdk import MCPServer, JsonLogger, get_config
+from league_sdk import MCPServer, JsonLogger, EndpointDirectory, get_config, new_league_seed
 
 from handlers import LeagueManagerHandlers
 from scheduler import Scheduler
@@ -31,6 +32,9 @@ class LeagueManager:
         self.port = manager_config.get("port", 8000)
 
         self.server = MCPServer("league_manager", "MANAGER", self.host, self.port)
+        # The manager is the authoritative directory: entries never expire
+        self.server.directory = EndpointDirectory(ttl_seconds=None)
+        self.server.directory.register("MANAGER", self.server.endpoint)
         self.logger = JsonLogger("league_manager", "MANAGER")
 
         # Components
@@ -43,7 +47,10 @@ class LeagueManager:
         self.player_counter = 0
         self.referee_counter = 0
         self.league_started = False
+        self.reported_matches: set[str] = set()
         self._start_task = None
+        # Seeds every match's draw; referees get it, players never do
+        self.league_seed = self.config.league.get("seed")
 
         # Handlers
         self.handlers = LeagueManagerHandlers(self)
@@ -121,7 +128,9 @@ class LeagueManager:
             return
 
         self.league_started = True
-        self.logger.info("LEAGUE_START", "League starting")
+        if self.league_seed is None:
+            self.league_seed = new_league_seed()
+        self.logger.info("LEAGUE_START", "League starting", league_seed=self.league_seed)
 
         player_ids = list(self.registered_players.keys())
         self.scheduler.generate_schedule(player_ids)
@@ -150,6 +159,32 @@ class LeagueManager:
         uvicorn.run(self.server.app, host=self.host, port=self.port)
 
 
-if __name__ == "__main__":
+def main():
+    """Entry point; flags override league.json for this run."""
+    parser = argparse.ArgumentParser(description="League Manager")
+    parser.add_argument("--min-players", type=int, default=None,
+                        help="Players needed before the auto-start countdown")
+    parser.add_argument("--start-delay", type=int, default=None,
+                        help="Seconds to wait for more players once the minimum is met")
+    parser.add_argument("--seed", type=int, default=None, help="League seed")
+    parser.add_argument("--watchdog-ms", type=float, default=None,
+                        help="Log event-loop stalls longer than this (ms)")
+    args = parser.parse_args()
+
+    league_config = get_config().league
+    auto_start = league_config.setdefault("auto_start", {})
+    if args.min_players is not None:
+        auto_start["min_players_to_start"] = args.min_players
+    if args.start_delay is not None:
+        auto_start["wait_after_min_players_seconds"] = args.start_delay
+    if args.seed is not None:
+        league_config["seed"] = args.seed
+
     manager = LeagueManager()
+    if args.watchdog_ms is not None:
+        manager.server.enable_watchdog(args.watchdog_ms)
     manager.run()
+
+
+if __name__ == "__main__":
+    main()
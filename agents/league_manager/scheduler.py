@@ -7,6 +7,12 @@ Generates match schedules and assigns referees.
 from typing import Optional
 from itertools import combinations
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
+
+from league_sdk.consistent_hash import ConsistentHashRing
+
 
 class Scheduler:
     """Round-robin match scheduler."""
@@ -16,6 +22,7 @@ class Scheduler:
         self.schedule: list[list[dict]] = []  # rounds -> matches
         self.current_round: int = 0
         self.player_ids: list[str] = []
+        self.referee_ring = ConsistentHashRing()
 
     def generate_schedule(self, player_ids: list[str]) -> list[list[dict]]:
         """
@@ -69,19 +76,22 @@ class Scheduler:
 
     def assign_referees(self, referee_ids: list[str]) -> None:
         """
-        Assign referees to matches (load-balanced).
+        Assign referees to unplayed matches by consistent hashing.
+
+        Each match is owned by the referee its match_id hashes to, so
+        referees that register mid-league only take over a fair share of
+        the remaining matches and existing assignments stay put.
 
         Args:
-            referee_ids: List of available referee IDs
+            referee_ids: List of currently available referee IDs
         """
-        if not referee_ids:
+        self.referee_ring.sync(referee_ids)
+        if not len(self.referee_ring):
             return
 
-        ref_idx = 0
-        for round_matches in self.schedule:
+        for round_matches in self.schedule[self.current_round:]:
             for match in round_matches:
-                match["referee_id"] = referee_ids[ref_idx % len(referee_ids)]
-                ref_idx += 1
+                match["referee_id"] = self.referee_ring.get_node(match["match_id"])
 
     def get_current_round(self) -> Optional[list[dict]]:
         """Get matches for current round."""
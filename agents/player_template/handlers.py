@@ -8,7 +8,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
 
-from league_sdk import MCPClient, utc_now
+from league_sdk import utc_now
 
 if TYPE_CHECKING:
     from main import PlayerAgent
@@ -21,6 +21,7 @@ class PlayerHandlers:
         """Initialize handlers."""
         self.player = player
         self.logger = player.logger
+        self._choices: dict[str, str] = {}  # match_id -> committed parity choice
 
     async def handle_game_invitation(self, params: dict) -> dict:
         """Handle game invitation from referee."""
@@ -35,27 +36,33 @@ class PlayerHandlers:
             match_id=match_id,
         )
 
-        # Update state
+        # Update state. Players are in one match at a time, so a new
+        # invitation ends earlier ones, including matches aborted without
+        # GAME_OVER (join or choice timeouts)
         self.player.state.set_active(match_id, opponent_id)
+        self._choices = {m: c for m, c in self._choices.items() if m == match_id}
 
-        # Extract referee endpoint from sender (sender is "referee:REF01")
-        # We need to send GAME_JOIN_ACK back to the referee
-        referee_id = referee_sender.split(":")[-1] if ":" in referee_sender else referee_sender
+        # Later messages for this match can then arrive over one WebSocket
+        self.player.open_peer(params.get("contact_endpoint"), params.get("peer_token"))
+
+        if params.get("ack_in_response"):
+            # Fast path: the acknowledgment rides on this response
+            return self._build_inline_ack(params)
 
-        # Get referee endpoint (we need to look it up or extract from params)
-        # For now, construct it based on referee ID
-        if referee_id == "REF01":
-            referee_endpoint = "http://127.0.0.1:8001/mcp"
-        elif referee_id == "REF02":
-            referee_endpoint = "http://127.0.0.1:8002/mcp"
-        else:
-            referee_endpoint = f"http://127.0.0.1:8001/mcp"  # Default
+        # Referee endpoints come from the manager's directory, which is
+        # fetched once and cached; the manager is only asked on a miss
+        referee_id = referee_sender.split(":")[-1] if ":" in referee_sender else referee_sender
+        referee_endpoint = await self.player.resolve_endpoint(referee_id)
+        if not referee_endpoint:
+            self.logger.error(
+                "JOIN_ACK_FAILED",
+                f"No endpoint known for referee {referee_id}",
+                match_id=match_id,
+            )
+            return {"status": "RECEIVED"}
 
         # Send acknowledgment as separate HTTP POST to referee
-        client = MCPClient(
-            f"player:{self.player.state.assigned_id or self.player.player_id}",
-            self.player.state.auth_token,
-        )
+        client = self.player.create_client()
 
         try:
             self.logger.info(
@@ -85,24 +92,47 @@ class PlayerHandlers:
         # Return simple acknowledgment to referee's HTTP request
         return {"status": "RECEIVED"}
 
-    async def handle_choose_parity(self, params: dict) -> dict:
-        """Handle parity choice request."""
+    def _build_inline_ack(self, params: dict) -> dict:
+        """Build the GAME_JOIN_ACK returned as the invitation's result."""
         match_id = params.get("match_id")
-        opponent_id = self.player.state.current_opponent_id
-
-        # Use strategy to choose
-        choice = self.player.strategy.choose(
-            match_id,
-            opponent_id,
-            self.player.state.history,
+        ack = self.player.server.build_response(
+            "GAME_JOIN_ACK",
+            conversation_id=params.get("conversation_id"),
+            match_id=match_id,
+            status="ACCEPTED",
         )
+        if params.get("parity_in_response") and self.player.strategy.supports_early_choice:
+            ack["parity_choice"] = self._choose(match_id)
 
         self.logger.info(
-            "CHOICE_MADE",
-            f"Chose {choice} for match {match_id}",
+            "JOIN_ACK_INLINE",
+            f"Joined match {match_id} in invitation response",
             match_id=match_id,
-            choice=choice,
+            early_choice=ack.get("parity_choice"),
         )
+        return ack
+
+    def _choose(self, match_id: str) -> str:
+        """Choose parity once per match, reusing an earlier commitment."""
+        if match_id not in self._choices:
+            choice = self.player.strategy.choose(
+                match_id,
+                self.player.state.current_opponent_id,
+                self.player.state.history,
+            )
+            self._choices[match_id] = choice
+            self.logger.info(
+                "CHOICE_MADE",
+                f"Chose {choice} for match {match_id}",
+                match_id=match_id,
+                choice=choice,
+            )
+        return self._choices[match_id]
+
+    async def handle_choose_parity(self, params: dict) -> dict:
+        """Handle parity choice request."""
+        match_id = params.get("match_id")
+        choice = self._choose(match_id)
 
         return self.player.server.build_response(
             "CHOOSE_PARITY_RESPONSE",
@@ -119,6 +149,7 @@ class PlayerHandlers:
         your_choice = params.get("your_choice")
         opponent_choice = params.get("opponent_choice")
         points_earned = params.get("points_earned", 0)
+        self._choices.pop(match_id, None)
 
         self.logger.info(
             "GAME_OVER",
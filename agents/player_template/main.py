@@ -8,6 +8,7 @@ import sys
 import asyncio
 import argparse
 from pathlib import Path
+from typing import Optional
 
 # Add SHARED to path for league_sdk imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
@@ -29,6 +30,8 @@ class PlayerAgent:
         port: int,
         display_name: str = "",
         strategy_name: str = "random",
+        transport: str = "http",
+        seed: Optional[int] = None,
     ):
         """
         Initialize Player agent.
@@ -38,6 +41,8 @@ class PlayerAgent:
             port: Server port
             display_name: Display name for the player
             strategy_name: Strategy to use
+            transport: "http", or "websocket" for persistent peer connections
+            seed: Seed for reproducible strategy choices
         """
         self.player_id = player_id
         self.display_name = display_name or f"Player_{player_id}"
@@ -45,13 +50,16 @@ class PlayerAgent:
 
         self.host = "127.0.0.1"
         self.port = port
+        self.endpoint = f"http://{self.host}:{self.port}/mcp"
+        self.transport = transport
+        self._peer_tasks: set[asyncio.Task] = set()
 
         self.server = MCPServer("players", player_id, self.host, port)
         self.logger = JsonLogger("players", player_id)
 
         # State and strategy
         self.state = PlayerState(player_id)
-        self.strategy = get_strategy(strategy_name)
+        self.strategy = get_strategy(strategy_name, seed)
 
         # Handlers
         self.handlers = PlayerHandlers(self)
@@ -84,13 +92,66 @@ class PlayerAgent:
             self.handlers.handle_league_completed,
         )
 
+    def create_client(self) -> MCPClient:
+        """Create an MCP client that advertises this player's endpoint."""
+        return MCPClient(
+            f"player:{self.state.assigned_id or self.player_id}",
+            self.state.auth_token or None,
+            contact_endpoint=self.endpoint,
+            directory=self.server.directory,
+            peers=self.server.peers,
+        )
+
+    def open_peer(self, endpoint: Optional[str], token: Optional[str] = None) -> None:
+        """Open a persistent WebSocket to another agent in the background."""
+        if self.transport != "websocket" or not endpoint or endpoint in self.server.peers:
+            return
+        task = asyncio.create_task(self._open_peer(endpoint, token))
+        self._peer_tasks.add(task)
+        task.add_done_callback(self._peer_tasks.discard)
+
+    async def _open_peer(self, endpoint: str, token: Optional[str]) -> None:
+        """Connect to a peer, staying on HTTP if that fails."""
+        try:
+            await self.server.connect_peer(endpoint, token)
+            self.logger.info("PEER_CONNECTED", f"WebSocket open to {endpoint}")
+        except Exception as e:
+            self.logger.warning("PEER_CONNECT_FAILED", f"{endpoint}: {e}")
+
+    @property
+    def manager_endpoint(self) -> str:
+        """Get the League Manager endpoint (directory first, then config)."""
+        return self.server.directory.resolve("MANAGER") or self.config.agents.get(
+            "league_manager", {}
+        ).get("endpoint", "http://127.0.0.1:8000/mcp")
+
+    async def resolve_endpoint(self, agent_id: str) -> Optional[str]:
+        """Resolve another agent's endpoint, asking the manager only on a miss."""
+        return await self.server.directory.resolve_or_fetch(
+            agent_id, self._fetch_endpoints
+        )
+
+    async def _fetch_endpoints(self) -> dict[str, str]:
+        """Fetch the endpoint directory from the League Manager."""
+        client = self.create_client()
+        try:
+            response = await client.send(
+                self.manager_endpoint,
+                "LEAGUE_QUERY",
+                {"query_type": "endpoints"},
+            )
+            return response.get("result", {}).get("data", {}).get("endpoints", {})
+        except Exception as e:
+            self.logger.error("ENDPOINT_QUERY_FAILED", str(e))
+            return {}
+        finally:
+            await client.close()
+
     async def register_with_manager(self) -> bool:
         """Register with League Manager."""
-        manager_endpoint = self.config.agents.get("league_manager", {}).get(
-            "endpoint", "http://127.0.0.1:8000/mcp"
-        )
+        manager_endpoint = self.manager_endpoint
 
-        client = MCPClient(f"player:{self.player_id}")
+        client = MCPClient(f"player:{self.player_id}", contact_endpoint=self.endpoint)
 
         try:
             response = await client.send(
@@ -102,16 +163,18 @@ class PlayerAgent:
                         "version": "1.0.0",
                         "protocol_version": "league.v2",
                         "game_types": ["even_odd"],
-                        "contact_endpoint": f"http://{self.host}:{self.port}/mcp",
+                        "contact_endpoint": self.endpoint,
                     }
                 },
             )
 
             result = response.get("result", {})
             if result.get("status") == "REGISTERED":
+                self.server.directory.update(result.get("endpoints"))
                 assigned_id = result.get("player_id", self.player_id)
                 self.state.set_registered(assigned_id, result.get("auth_token", ""))
                 self.logger.info("REGISTERED", f"Registered as {assigned_id}")
+                self.open_peer(manager_endpoint, self.state.auth_token)
                 return True
 
         except Exception as e:
@@ -129,7 +192,7 @@ class PlayerAgent:
         print(f"  Display Name:  {self.display_name}")
         print(f"  Port:          {self.port}")
         print(f"  Strategy:      {self.strategy.name}")
-        print(f"  Endpoint:      http://{self.host}:{self.port}/mcp")
+        print(f"  Endpoint:      {self.endpoint}")
         print("=" * 60)
 
         self.logger.info("STARTUP", f"Player {self.player_id} starting")
@@ -149,9 +212,20 @@ def main():
     parser.add_argument("--port", type=int, default=8101, help="Server port")
     parser.add_argument("--name", default="", help="Display name")
     parser.add_argument("--strategy", default="random", help="Strategy name")
+    parser.add_argument(
+        "--transport", choices=["http", "websocket"], default="http",
+        help="Keep persistent WebSocket connections to manager and referees",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for strategy choices")
+    parser.add_argument("--watchdog-ms", type=float, default=None,
+                        help="Log event-loop stalls longer than this (ms)")
     args = parser.parse_args()
 
-    player = PlayerAgent(args.id, args.port, args.name, args.strategy)
+    player = PlayerAgent(
+        args.id, args.port, args.name, args.strategy, args.transport, args.seed
+    )
+    if args.watchdog_ms is not None:
+        player.server.enable_watchdog(args.watchdog_ms)
     player.run()
 
 
@@ -2,6 +2,8 @@
 Player strategy implementations.
 """
 
+from typing import Optional
+
 from .base import BaseStrategy
 from .random_strategy import RandomStrategy
 from .deterministic import DeterministicEvenStrategy, DeterministicOddStrategy
@@ -17,18 +19,23 @@ __all__ = [
     "AlternatingStrategy",
     "AdaptiveStrategy",
     "LLMStrategy",
+    "STRATEGY_CLASSES",
+    "get_strategy",
 ]
 
+# Strategy name (as passed to --strategy) -> implementation
+STRATEGY_CLASSES: dict[str, type[BaseStrategy]] = {
+    "random": RandomStrategy,
+    "deterministic_even": DeterministicEvenStrategy,
+    "deterministic_odd": DeterministicOddStrategy,
+    "alternating": AlternatingStrategy,
+    "adaptive": AdaptiveStrategy,
+    "llm": LLMStrategy,
+}
+
 
-def get_strategy(name: str) -> BaseStrategy:
-    """Get strategy by name."""
-    strategies = {
-        "random": RandomStrategy,
-        "deterministic_even": DeterministicEvenStrategy,
-        "deterministic_odd": DeterministicOddStrategy,
-        "alternating": AlternatingStrategy,
-        "adaptive": AdaptiveStrategy,
-        "llm": LLMStrategy,
-    }
-    strategy_class = strategies.get(name, RandomStrategy)
-    return strategy_class()
+def get_strategy(name: str, seed: Optional[int] = None) -> BaseStrategy:
+    """Get strategy by name, optionally seeded for reproducible choices."""
+    strategy = STRATEGY_CLASSES.get(name, RandomStrategy)()
+    strategy.seed = seed
+    return strategy
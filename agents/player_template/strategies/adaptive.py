@@ -4,7 +4,6 @@ Adaptive strategy - learns from opponent history.
 
 from typing import Optional
 from collections import defaultdict
-import random
 
 from .base import BaseStrategy, ParityChoice
 
@@ -16,6 +15,9 @@ class AdaptiveStrategy(BaseStrategy):
     Tracks opponent's choice patterns and counters accordingly.
     """
 
+    WINDOW = 10       # Recent opponent choices remembered
+    MIN_CHOICES = 3   # Choices needed before following the opponent
+
     def __init__(self):
         """Initialize adaptive strategy."""
         # Track opponent choices: opponent_id -> list of choices
@@ -40,14 +42,19 @@ class AdaptiveStrategy(BaseStrategy):
         - With insufficient data, choose randomly
         """
         opponent_choices = self._opponent_history.get(opponent_id, [])
+        even_count = opponent_choices.count("even")
+        return self.choose_from_counts(match_id, even_count, len(opponent_choices) - even_count)
 
-        if len(opponent_choices) < 3:
-            # Not enough data, choose randomly
-            return random.choice(["even", "odd"])
+    def choose_from_counts(self, match_id: str, even_count: int, odd_count: int) -> ParityChoice:
+        """
+        Choose from the opponent's recent even/odd counts.
 
-        # Count opponent's choices
-        even_count = opponent_choices.count("even")
-        odd_count = opponent_choices.count("odd")
+        Callers that keep their own compact history (the league simulator)
+        pass counts over at most WINDOW choices and skip update().
+        """
+        if even_count + odd_count < self.MIN_CHOICES:
+            # Not enough data, choose randomly
+            return self.rng(match_id).choice(["even", "odd"])
 
         # Mirror opponent's preference (increases chance of draw or win)
         if even_count > odd_count:
@@ -55,7 +62,7 @@ class AdaptiveStrategy(BaseStrategy):
         elif odd_count > even_count:
             return "odd"
         else:
-            return random.choice(["even", "odd"])
+            return self.rng(match_id).choice(["even", "odd"])
 
     def update(self, result: dict) -> None:
         """Record opponent's choice for future analysis."""
@@ -64,6 +71,6 @@ class AdaptiveStrategy(BaseStrategy):
 
         if opponent_id and opponent_choice:
             self._opponent_history[opponent_id].append(opponent_choice)
-            # Keep only last 10 choices
-            if len(self._opponent_history[opponent_id]) > 10:
-                self._opponent_history[opponent_id] = self._opponent_history[opponent_id][-10:]
+            # Keep only the last WINDOW choices
+            if len(self._opponent_history[opponent_id]) > self.WINDOW:
+                self._opponent_history[opponent_id] = self._opponent_history[opponent_id][-self.WINDOW:]
@@ -2,7 +2,7 @@
 Alternating strategy - switches between even and odd each game.
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 
 from .base import BaseStrategy, ParityChoice
 
@@ -34,6 +34,10 @@ class AlternatingStrategy(BaseStrategy):
         choice = self._current
         return choice
 
+    def choose_many(self, match_ids: Sequence[str], opponent_ids: Sequence[str]) -> list[ParityChoice]:
+        """Same choice for every match until the next update."""
+        return [self._current] * len(match_ids)
+
     def update(self, result: dict) -> None:
         """Switch to opposite choice after each game."""
         self._game_count += 1
@@ -2,8 +2,15 @@
 Base strategy interface for player agents.
 """
 
+import random
 from abc import ABC, abstractmethod
-from typing import Literal, Optional
+from typing import Literal, Optional, Sequence
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "SHARED"))
+
+from league_sdk.rng import rng_stream
 
 
 ParityChoice = Literal["even", "odd"]
@@ -12,12 +19,19 @@ ParityChoice = Literal["even", "odd"]
 class BaseStrategy(ABC):
     """Abstract base class for parity choice strategies."""
 
+    seed: Optional[int] = None  # Player seed; None draws from OS entropy
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Strategy name."""
         pass
 
+    @property
+    def supports_early_choice(self) -> bool:
+        """Whether a choice can be made cheaply at invitation time."""
+        return True
+
     @abstractmethod
     def choose(
         self,
@@ -38,6 +52,31 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def choose_many(
+        self,
+        match_ids: Sequence[str],
+        opponent_ids: Sequence[str],
+    ) -> list[ParityChoice]:
+        """
+        Choose parity for several matches against the current state.
+
+        Used by the league simulator, which asks each player for all of
+        its choices in a batch before any result is recorded. Override
+        when one call can be cheaper than a loop over choose().
+
+        Args:
+            match_ids: Match identifiers
+            opponent_ids: Opponent player ID for each match
+
+        Returns:
+            One choice per match, in order
+        """
+        return [self.choose(m, o) for m, o in zip(match_ids, opponent_ids)]
+
+    def rng(self, match_id: str) -> random.Random:
+        """Private random stream for one match (replayable when seeded)."""
+        return rng_stream(self.seed, match_id, self.name)
+
     def update(self, result: dict) -> None:
         """
         Update strategy state after a match.
@@ -2,7 +2,7 @@
 Deterministic strategies - always choose the same option.
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 
 from .base import BaseStrategy, ParityChoice
 
@@ -23,6 +23,9 @@ class DeterministicEvenStrategy(BaseStrategy):
         """Always return even."""
         return "even"
 
+    def choose_many(self, match_ids: Sequence[str], opponent_ids: Sequence[str]) -> list[ParityChoice]:
+        return ["even"] * len(match_ids)
+
 
 class DeterministicOddStrategy(BaseStrategy):
     """Always choose odd."""
@@ -39,3 +42,6 @@ class DeterministicOddStrategy(BaseStrategy):
     ) -> ParityChoice:
         """Always return odd."""
         return "odd"
+
+    def choose_many(self, match_ids: Sequence[str], opponent_ids: Sequence[str]) -> list[ParityChoice]:
+        return ["odd"] * len(match_ids)
@@ -31,6 +31,11 @@ class LLMStrategy(BaseStrategy):
         """Strategy name."""
         return f"llm-{self.model}"
 
+    @property
+    def supports_early_choice(self) -> bool:
+        """LLM calls are slow; answer CHOOSE_PARITY_CALL instead."""
+        return False
+
     def _get_client(self):
         """Get or create OpenAI client."""
         if self._client is None:
@@ -55,8 +60,7 @@ class LLMStrategy(BaseStrategy):
         client = self._get_client()
         if not client or not self.api_key:
             # Fallback to random choice
-            import random
-            return random.choice(["even", "odd"])
+            return self.rng(match_id).choice(["even", "odd"])
 
         # Build context from history
         history_text = self._format_history(history, opponent_id)
@@ -85,8 +89,7 @@ Respond with ONLY "even" or "odd" - nothing else."""
             pass
 
         # Fallback
-        import random
-        return random.choice(["even", "odd"])
+        return self.rng(match_id).choice(["even", "odd"])
 
     def _format_history(
         self,
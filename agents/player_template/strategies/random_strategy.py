@@ -2,8 +2,7 @@
 Random strategy - equal probability even/odd.
 """
 
-import random
-from typing import Optional, Literal
+from typing import Optional
 
 from .base import BaseStrategy, ParityChoice
 
@@ -22,4 +21,4 @@ class RandomStrategy(BaseStrategy):
         history: Optional[list[dict]] = None,
     ) -> ParityChoice:
         """Choose randomly between even and odd."""
-        return random.choice(["even", "odd"])
+        return self.rng(match_id).choice(["even", "odd"])
@@ -4,20 +4,28 @@ Game orchestration logic for the Referee.
 Handles match flow: invitation, parity collection, winner determination.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
 
 import asyncio
-from league_sdk import MCPClient
+import time
+from league_sdk import Span, metrics_registry
 from invitation_handler import InvitationHandler
 from parity_handler import ParityHandler
 
 if TYPE_CHECKING:
     from main import RefereeAgent
 
+MATCH_PHASE_SECONDS = metrics_registry.histogram(
+    "referee_match_phase_seconds", "Time per match phase", ("referee", "phase")
+)
+MATCHES = metrics_registry.counter(
+    "referee_matches_total", "Matches conducted", ("referee", "outcome")
+)
+
 
 class GameOrchestrator:
     """Orchestrates match flow."""
@@ -35,6 +43,7 @@ class GameOrchestrator:
         round_id: str,
         player_a: dict,
         player_b: dict,
+        league_seed: Optional[int] = None,
     ) -> dict:
         """
         Conduct a complete match.
@@ -44,6 +53,7 @@ class GameOrchestrator:
             round_id: Round identifier
             player_a: Player A info with endpoint
             player_b: Player B info with endpoint
+            league_seed: Seed for the number draw (replayable when set)
 
         Returns:
             Match result
@@ -60,31 +70,55 @@ class GameOrchestrator:
             "player_b_joined": False,
             "player_a_choice": None,
             "player_b_choice": None,
+            "joined_event": asyncio.Event(),
+            "league_seed": league_seed,
         }
         self.referee.active_matches[match_id] = match_state
 
+        referee_id = self.referee.referee_id
+        started = phase_start = time.perf_counter()
+        outcome = "error"
+
+        def phase_done(phase: str) -> None:
+            nonlocal phase_start
+            now = time.perf_counter()
+            MATCH_PHASE_SECONDS.labels(referee_id, phase).observe(now - phase_start)
+            phase_start = now
+
         try:
-            # Step 1: Send invitations
+            # Step 1: Send invitations (spans: invitation, join_wait)
             join_ok = await self.invitation_handler.send_invitations(match_state)
+            phase_done("join")
             if not join_ok:
+                outcome = "join_timeout"
                 return self._technical_loss_result(match_state, "join_timeout")
 
             # Step 2: Request parity choices
-            choices_ok = await self.parity_handler.request_parity_choices(match_state)
+            with Span(self.logger, "parity_collection", match_id=match_id):
+                choices_ok = await self.parity_handler.request_parity_choices(match_state)
+            phase_done("choose")
             if not choices_ok:
+                outcome = "choice_timeout"
                 return self._technical_loss_result(match_state, "choice_timeout")
 
             # Step 3: Determine winner
-            result = self.parity_handler.determine_winner(match_state)
+            with Span(self.logger, "winner_determination", match_id=match_id):
+                result = self.parity_handler.determine_winner(match_state)
+            phase_done("decide")
 
             # Step 4: Send game over to players
-            await self._send_game_over(match_state, result)
+            with Span(self.logger, "game_over", match_id=match_id):
+                await self._send_game_over(match_state, result)
+            phase_done("game_over")
+            outcome = "completed"
 
             return result
 
         finally:
             # Cleanup
             self.referee.active_matches.pop(match_id, None)
+            MATCH_PHASE_SECONDS.labels(referee_id, "total").observe(time.perf_counter() - started)
+            MATCHES.labels(referee_id, outcome).inc()
 
     async def _send_game_over(self, match_state: dict, result: dict) -> None:
         """Send game over to both players."""
@@ -92,10 +126,7 @@ class GameOrchestrator:
         self.logger.match_event(match_id, "Sending GAME_OVER to players")
 
         # Create MCP client for sending messages
-        client = MCPClient(
-            f"referee:{self.referee.referee_id}",
-            self.referee.auth_token,
-        )
+        client = self.referee.create_client()
 
         try:
             # Prepare GAME_OVER message for player A
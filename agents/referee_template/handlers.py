@@ -8,7 +8,8 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
 
-from league_sdk import utc_now
+from league_sdk import Span, utc_now
+from invitation_handler import mark_joined
 
 if TYPE_CHECKING:
     from main import RefereeAgent
@@ -42,13 +43,11 @@ class RefereeHandlers:
             self.logger.warning("UNKNOWN_MATCH", f"Unknown match {match_id}")
             return {"status": "ERROR", "message": "Unknown match"}
 
-        # Determine which player joined
+        # Determine which player joined. Anyone can POST this ack under a
+        # player's name, so a parity_choice on it is ignored: early choices
+        # only count from the invitation response the player itself sent
         player_id = sender.split(":")[-1] if ":" in sender else sender
-
-        if match_state["player_a"]["id"] == player_id:
-            match_state["player_a_joined"] = True
-        elif match_state["player_b"]["id"] == player_id:
-            match_state["player_b_joined"] = True
+        mark_joined(match_state, player_id)
 
         self.logger.info(
             "PLAYER_JOINED",
@@ -103,13 +102,17 @@ class RefereeHandlers:
         round_id = params.get("round_id")
         player_a_id = params.get("player_a")
         player_b_id = params.get("player_b")
-        player_a_endpoint = params.get("player_a_endpoint")
-        player_b_endpoint = params.get("player_b_endpoint")
+        league_seed = params.get("league_seed")
+        # START_MATCH is unauthenticated, so its player endpoints are not
+        # trusted; they come from the manager's directory instead
+        player_a_endpoint = await self.referee.resolve_endpoint(player_a_id)
+        player_b_endpoint = await self.referee.resolve_endpoint(player_b_id)
 
         self.logger.info(
             "MATCH_ASSIGNED",
             f"Assigned match {match_id}: {player_a_id} vs {player_b_id}",
             match_id=match_id,
+            league_seed=league_seed,
         )
 
         # Start match orchestration in background
@@ -124,9 +127,10 @@ class RefereeHandlers:
                     f"Starting match {match_id}",
                     match_id=match_id,
                 )
-                result = await self.referee.orchestrator.conduct_match(
-                    match_id, round_id, player_a, player_b
-                )
+                with Span(self.logger, "match", match_id=match_id):
+                    result = await self.referee.orchestrator.conduct_match(
+                        match_id, round_id, player_a, player_b, league_seed
+                    )
                 self.logger.info(
                     "MATCH_COMPLETED",
                     f"Match {match_id} completed",
@@ -150,34 +154,28 @@ class RefereeHandlers:
 
     async def _report_result(self, result: dict) -> None:
         """Report match result to League Manager."""
-        from league_sdk import MCPClient
+        manager_endpoint = self.referee.manager_endpoint
 
-        manager_endpoint = self.referee.config.agents.get("league_manager", {}).get(
-            "endpoint", "http://127.0.0.1:8000/mcp"
-        )
-
-        client = MCPClient(
-            f"referee:{self.referee.referee_id}",
-            self.referee.auth_token,
-        )
+        client = self.referee.create_client()
 
         try:
-            await client.send(
-                manager_endpoint,
-                "MATCH_RESULT_REPORT",
-                {
-                    "match_id": result.get("match_id"),
-                    "round_id": result.get("round_id"),
-                    "player_a_id": result.get("player_a_id"),
-                    "player_b_id": result.get("player_b_id"),
-                    "player_a_choice": result.get("player_a_choice"),
-                    "player_b_choice": result.get("player_b_choice"),
-                    "drawn_number": result.get("drawn_number"),
-                    "winner_id": result.get("winner_id"),
-                    "player_a_result": result.get("player_a_result"),
-                    "player_b_result": result.get("player_b_result"),
-                },
-            )
+            with Span(self.logger, "result_report", match_id=result.get("match_id")):
+                await client.send(
+                    manager_endpoint,
+                    "MATCH_RESULT_REPORT",
+                    {
+                        "match_id": result.get("match_id"),
+                        "round_id": result.get("round_id"),
+                        "player_a_id": result.get("player_a_id"),
+                        "player_b_id": result.get("player_b_id"),
+                        "player_a_choice": result.get("player_a_choice"),
+                        "player_b_choice": result.get("player_b_choice"),
+                        "drawn_number": result.get("drawn_number"),
+                        "winner_id": result.get("winner_id"),
+                        "player_a_result": result.get("player_a_result"),
+                        "player_b_result": result.get("player_b_result"),
+                    },
+                )
             self.logger.info("RESULT_REPORTED", f"Reported match {result.get('match_id')}")
         except Exception as e:
             self.logger.error("REPORT_FAILED", str(e))
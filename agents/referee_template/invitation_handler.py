@@ -12,12 +12,37 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
 
-from league_sdk import MCPClient
+from league_sdk import Span
 
 if TYPE_CHECKING:
     from main import RefereeAgent
 
 
+# Configuration constants
+JOIN_TIMEOUT_SECONDS = 5  # Deadline for both GAME_JOIN_ACKs
+
+
+def mark_joined(match_state: dict, player_id: str) -> None:
+    """Record a player's join and wake the waiter once both have joined."""
+    if match_state["player_a"]["id"] == player_id:
+        match_state["player_a_joined"] = True
+    elif match_state["player_b"]["id"] == player_id:
+        match_state["player_b_joined"] = True
+
+    if match_state["player_a_joined"] and match_state["player_b_joined"]:
+        match_state["joined_event"].set()
+
+
+def record_early_choice(match_state: dict, player_id: str, choice: str) -> None:
+    """Store a parity choice delivered in the player's invitation response."""
+    if choice not in ("even", "odd"):
+        return
+    if match_state["player_a"]["id"] == player_id:
+        match_state["player_a_choice"] = choice
+    elif match_state["player_b"]["id"] == player_id:
+        match_state["player_b_choice"] = choice
+
+
 class InvitationHandler:
     """Handles game invitations."""
 
@@ -25,18 +50,26 @@ class InvitationHandler:
         """Initialize handler."""
         self.referee = referee
         self.logger = referee.logger
+        # Offer the join ack and parity choice in the invitation response
+        self.offer_fast_path = True
 
     async def send_invitations(self, match_state: dict) -> bool:
         """
         Send game invitations to both players.
 
+        Invitations offer the fast path: players may return GAME_JOIN_ACK
+        (and their parity choice) as the JSON-RPC result instead of
+        POSTing a separate acknowledgment. Players that still send the
+        asynchronous GAME_JOIN_ACK are handled by the join ack handler.
+
         Returns:
             True if both players joined within deadline
         """
         match_id = match_state["match_id"]
-        deadline = (datetime.now(timezone.utc) + timedelta(seconds=5)).strftime(
-            "%Y-%m-%dT%H:%M:%SZ"
-        )
+        match_state.setdefault("joined_event", asyncio.Event())
+        deadline = (
+            datetime.now(timezone.utc) + timedelta(seconds=JOIN_TIMEOUT_SECONDS)
+        ).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         self.logger.info(
             "SENDING_INVITATIONS",
@@ -44,10 +77,7 @@ class InvitationHandler:
             match_id=match_id,
         )
 
-        client = MCPClient(
-            f"referee:{self.referee.referee_id}",
-            self.referee.auth_token,
-        )
+        client = self.referee.create_client()
 
         async def invite_player(player: dict, role: str, opponent_id: str) -> bool:
             try:
@@ -57,7 +87,7 @@ class InvitationHandler:
                     player_id=player["id"],
                     endpoint=player["endpoint"],
                 )
-                await client.send(
+                response = await client.send(
                     player["endpoint"],
                     "GAME_INVITATION",
                     {
@@ -66,8 +96,12 @@ class InvitationHandler:
                         "opponent_id": opponent_id,
                         "role_in_match": role,
                         "response_deadline": deadline,
+                        "ack_in_response": self.offer_fast_path,
+                        "parity_in_response": self.offer_fast_path,
+                        "peer_token": self.referee.server.grant_peer(player["endpoint"]),
                     },
                 )
+                self._handle_inline_ack(match_state, player, response.get("result") or {})
                 self.logger.info(
                     "INVITATION_SENT",
                     f"Invitation sent to {player['id']}",
@@ -92,16 +126,23 @@ class InvitationHandler:
             ),
         ]
 
-        await asyncio.gather(*tasks)
+        with Span(self.logger, "invitation", match_id=match_id):
+            await asyncio.gather(*tasks)
         await client.close()
 
-        # Wait for join acknowledgments
+        # Wait for any asynchronous join acknowledgments still outstanding
         self.logger.info(
             "WAITING_FOR_JOINS",
             f"Waiting for players to join match {match_id}",
             match_id=match_id,
         )
-        await asyncio.sleep(5)
+        with Span(self.logger, "join_wait", match_id=match_id) as span:
+            try:
+                await asyncio.wait_for(
+                    match_state["joined_event"].wait(), JOIN_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                span.set(timed_out=True)
 
         joined = match_state["player_a_joined"] and match_state["player_b_joined"]
         self.logger.info(
@@ -112,3 +153,23 @@ class InvitationHandler:
         )
 
         return joined
+
+    def _handle_inline_ack(self, match_state: dict, player: dict, result: dict) -> None:
+        """Apply a GAME_JOIN_ACK carried in the invitation response."""
+        if result.get("message_type") != "GAME_JOIN_ACK":
+            return  # Legacy player: ACK arrives as a separate message
+        if result.get("status") != "ACCEPTED":
+            self.logger.warning(
+                "JOIN_DECLINED",
+                f"Player {player['id']} declined match {match_state['match_id']}",
+            )
+            return
+
+        record_early_choice(match_state, player["id"], result.get("parity_choice"))
+        mark_joined(match_state, player["id"])
+        self.logger.info(
+            "PLAYER_JOINED",
+            f"Player {player['id']} joined match {match_state['match_id']} (inline ack)",
+            match_id=match_state["match_id"],
+            early_choice=result.get("parity_choice") is not None,
+        )
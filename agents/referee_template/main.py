@@ -8,33 +8,39 @@ import sys
 import asyncio
 import argparse
 from pathlib import Path
+from typing import Optional
 
 # Add SHARED to path for league_sdk imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
 
 import uvicorn
-from league_sdk import MCPServer, MCPClient, JsonLogger, get_config
+from league_sdk import MCPServer, MCPClient, HedgePolicy, JsonLogger, get_config
 
 from handlers import RefereeHandlers
 from game_logic import GameOrchestrator
 
+# Latency-critical calls to players that are safe to send twice
+HEDGED_METHODS = ("GAME_INVITATION", "CHOOSE_PARITY_CALL")
+
 
 class RefereeAgent:
     """Referee agent that orchestrates matches."""
 
-    def __init__(self, referee_id: str, port: int):
+    def __init__(self, referee_id: str, port: int, host: str = "127.0.0.1"):
         """
         Initialize Referee agent.
 
         Args:
             referee_id: Referee identifier (e.g., "REF01")
             port: Server port
+            host: Server host
         """
         self.referee_id = referee_id
         self.config = get_config()
 
-        self.host = "127.0.0.1"
+        self.host = host
         self.port = port
+        self.endpoint = f"http://{self.host}:{self.port}/mcp"
 
         self.server = MCPServer("referees", referee_id, self.host, port)
         self.logger = JsonLogger("referees", referee_id)
@@ -43,6 +49,8 @@ class RefereeAgent:
         self.auth_token: str = ""
         self.registered = False
         self.active_matches: dict[str, dict] = {}
+        # Duplicate slow calls to players after their p95 latency
+        self.hedge = HedgePolicy(HEDGED_METHODS)
 
         # Components
         self.orchestrator = GameOrchestrator(self)
@@ -64,13 +72,51 @@ class RefereeAgent:
             self.handlers.handle_match_assignment,
         )
 
+    def create_client(self) -> MCPClient:
+        """Create an MCP client that advertises this referee's endpoint."""
+        return MCPClient(
+            f"referee:{self.referee_id}",
+            self.auth_token or None,
+            contact_endpoint=self.endpoint,
+            directory=self.server.directory,
+            peers=self.server.peers,
+            hedge=self.hedge,
+        )
+
+    @property
+    def manager_endpoint(self) -> str:
+        """Get the League Manager endpoint (directory first, then config)."""
+        return self.server.directory.resolve("MANAGER") or self.config.agents.get(
+            "league_manager", {}
+        ).get("endpoint", "http://127.0.0.1:8000/mcp")
+
+    async def resolve_endpoint(self, agent_id: str) -> Optional[str]:
+        """Resolve another agent's endpoint, asking the manager only on a miss."""
+        return await self.server.directory.resolve_or_fetch(
+            agent_id, self._fetch_endpoints
+        )
+
+    async def _fetch_endpoints(self) -> dict[str, str]:
+        """Fetch the endpoint directory from the League Manager."""
+        client = self.create_client()
+        try:
+            response = await client.send(
+                self.manager_endpoint,
+                "LEAGUE_QUERY",
+                {"query_type": "endpoints"},
+            )
+            return response.get("result", {}).get("data", {}).get("endpoints", {})
+        except Exception as e:
+            self.logger.error("ENDPOINT_QUERY_FAILED", str(e))
+            return {}
+        finally:
+            await client.close()
+
     async def register_with_manager(self) -> bool:
         """Register with League Manager."""
-        manager_endpoint = self.config.agents.get("league_manager", {}).get(
-            "endpoint", "http://127.0.0.1:8000/mcp"
-        )
+        manager_endpoint = self.manager_endpoint
 
-        client = MCPClient(f"referee:{self.referee_id}")
+        client = self.create_client()
 
         try:
             response = await client.send(
@@ -80,13 +126,14 @@ class RefereeAgent:
                     "referee_meta": {
                         "version": "1.0.0",
                         "protocol_version": "league.v2",
-                        "contact_endpoint": f"http://{self.host}:{self.port}/mcp",
+                        "contact_endpoint": self.endpoint,
                     }
                 },
             )
 
             result = response.get("result", {})
             if result.get("status") == "REGISTERED":
+                self.server.directory.update(result.get("endpoints"))
                 self.auth_token = result.get("auth_token", "")
                 self.registered = True
                 self.logger.info(
@@ -94,6 +141,7 @@ class RefereeAgent:
                     f"Registered as {result.get('referee_id')}",
                 )
                 return True
+            self.logger.error("REGISTRATION_REJECTED", result.get("reason", "Rejected"))
 
         except Exception as e:
             self.logger.error("REGISTRATION_FAILED", str(e))
@@ -108,7 +156,7 @@ class RefereeAgent:
         print("=" * 60)
         print(f"  Referee ID:    {self.referee_id}")
         print(f"  Port:          {self.port}")
-        print(f"  Endpoint:      http://{self.host}:{self.port}/mcp")
+        print(f"  Endpoint:      {self.endpoint}")
         print("=" * 60)
 
         self.logger.info("STARTUP", f"Referee {self.referee_id} starting")
@@ -126,9 +174,14 @@ def main():
     parser = argparse.ArgumentParser(description="Referee Agent")
     parser.add_argument("--id", default="REF01", help="Referee ID")
     parser.add_argument("--port", type=int, default=8001, help="Server port")
+    parser.add_argument("--host", default="127.0.0.1", help="Server host")
+    parser.add_argument("--watchdog-ms", type=float, default=None,
+                        help="Log event-loop stalls longer than this (ms)")
     args = parser.parse_args()
 
-    referee = RefereeAgent(args.id, args.port)
+    referee = RefereeAgent(args.id, args.port, args.host)
+    if args.watchdog_ms is not None:
+        referee.server.enable_watchdog(args.watchdog_ms)
     referee.run()
 
 
@@ -12,8 +12,8 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "SHARED"))
 
-from league_sdk import MCPClient
 from league_sdk.game_rules import EvenOddGame
+from league_sdk.rng import DRAW_STREAM, rng_stream
 
 if TYPE_CHECKING:
     from main import RefereeAgent
@@ -40,12 +40,13 @@ class ParityHandler:
             "%Y-%m-%dT%H:%M:%SZ"
         )
 
-        client = MCPClient(
-            f"referee:{self.referee.referee_id}",
-            self.referee.auth_token,
-        )
+        client = self.referee.create_client()
 
         async def request_choice(player: dict, is_player_a: bool) -> bool:
+            choice_key = "player_a_choice" if is_player_a else "player_b_choice"
+            if match_state[choice_key] in ("even", "odd"):
+                # Delivered early in the invitation response
+                return True
             try:
                 self.logger.info(
                     "REQUESTING_PARITY",
@@ -120,6 +121,7 @@ class ParityHandler:
             match_state["player_a_choice"],
             match_state["player_b"]["id"],
             match_state["player_b_choice"],
+            rng=rng_stream(match_state.get("league_seed"), match_state["match_id"], DRAW_STREAM),
         )
 
         self.logger.match_event(
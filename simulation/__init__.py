@@ -0,0 +1,37 @@
+"""
+Even/Odd league simulation package.
+
+Runs a complete league in one process with simulated players and
+referees, sequentially or across a process pool. Quiet mode sends
+structured events only to an optional sink (see events.py).
+"""
+
+from .league import LeagueSimulation
+from .player import Player
+from .referee import Referee
+from .records import MatchLog
+from .schedule import round_robin
+from .events import EventSink, JsonlSink, RingBufferSink
+from .output import (
+    print_standings,
+    print_match_history,
+    print_activity_log,
+    print_final_results,
+    print_monte_carlo,
+)
+
+__all__ = [
+    "LeagueSimulation",
+    "Player",
+    "Referee",
+    "MatchLog",
+    "round_robin",
+    "EventSink",
+    "JsonlSink",
+    "RingBufferSink",
+    "print_standings",
+    "print_match_history",
+    "print_activity_log",
+    "print_final_results",
+    "print_monte_carlo",
+]
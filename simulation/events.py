@@ -0,0 +1,50 @@
+"""
+Structured event sinks for league simulation.
+
+A sink is any callable taking one event dict. The simulator emits
+events only when a sink is attached or console output is enabled, so
+headless runs pay nothing per match.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union
+
+EventSink = Callable[[Dict[str, Any]], None]
+
+
+class RingBufferSink:
+    """Keep only the most recent events in memory."""
+
+    def __init__(self, maxlen: int = 1000):
+        self.events: deque = deque(maxlen=maxlen)
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Get buffered events, oldest first."""
+        return list(self.events)
+
+
+class JsonlSink:
+    """Append events to a JSON Lines file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(event, default=str) + "\n")
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -2,167 +2,221 @@
 League simulation orchestration.
 """
 
+import os
 import time
-import asyncio
-from typing import List, Dict, Any, Optional
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
 
 from league_sdk.helpers import utc_now
+from league_sdk.rng import derive_seed, new_league_seed
 from .player import Player
 from .referee import Referee
 from .output import print_standings as _print_standings
+from .parallel import MatchTask, play_matches
+from .records import MatchLog
+from .schedule import round_robin
+from .events import EventSink
 
+# The pool pickles every match's players to a worker and back: measured on
+# one CPU that is ~28us per match on top of ~30us of play, plus a fixed
+# cost per round, so it only pays off with several CPUs and large rounds
+MIN_PARALLEL_MATCHES = 64  # Matches in the largest round to use the pool
+
+
+def _batches(tasks: List[MatchTask], count: int) -> List[List[MatchTask]]:
+    """Split tasks into at most `count` consecutive, near-equal batches."""
+    size = -(-len(tasks) // count) or 1
+    return [tasks[i:i + size] for i in range(0, len(tasks), size)]
 
-class LeagueSimulation:
-    """Full league simulation with parallel execution support."""
 
-    def __init__(self, parallel: bool = False):
+class LeagueSimulation:
+    """
+    Full league simulation with parallel execution support.
+
+    Players use the real strategy plugins, each seeded from (seed,
+    player_id), and every draw comes from a stream derived from (seed,
+    match_id), so a league replays identically for the same seed in
+    either mode.
+
+    parallel=True uses a process pool only where it can help: with more
+    than one CPU and rounds of at least min_parallel_matches matches.
+    Otherwise the league is played sequentially and parallel_skipped
+    says why.
+
+    With quiet=True nothing is printed or kept in activity_log; events
+    go only to the optional sink, and without a sink no event is even
+    built, so large leagues run at full speed.
+    """
+
+    def __init__(
+        self,
+        parallel: bool = False,
+        seed: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        quiet: bool = False,
+        sink: Optional[EventSink] = None,
+        min_parallel_matches: int = MIN_PARALLEL_MATCHES,
+    ):
         self.players: Dict[str, Player] = {}
         self.referees: Dict[str, Referee] = {}
         self.schedule: List[List[dict]] = []
-        self.match_results: List[dict] = []
+        self._player_ids: List[str] = []
+        self._referee_ids: List[str] = []
+        self.match_results = MatchLog(self._player_ids, self._referee_ids)
         self.activity_log: List[dict] = []
         self.parallel = parallel
+        self.quiet = quiet
+        self.sink = sink
+        self.emit_events = not quiet or sink is not None
+        self.seed = seed if seed is not None else new_league_seed()
+        self.max_workers = max_workers
+        self.min_parallel_matches = min_parallel_matches
+        self.workers = 1
+        self.parallel_skipped: Optional[str] = None  # Why parallel=True played sequentially
+        self._compute_seconds = 0.0  # Sum of per-batch play time
+        self._execution_seconds = 0.0  # Wall time spent executing matches
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
 
     def log(self, event_type: str, message: str, **kwargs) -> None:
-        """Log activity."""
+        """Log activity to the console/activity log and the sink."""
+        if not self.emit_events:
+            return
         entry = {
             "timestamp": utc_now(),
             "event": event_type,
             "message": message,
             **kwargs
         }
-        self.activity_log.append(entry)
-        print(f"[{entry['timestamp'][11:19]}] {event_type}: {message}")
+        if self.sink:
+            self.sink(entry)
+        if not self.quiet:
+            self.activity_log.append(entry)
+            print(f"[{entry['timestamp'][11:19]}] {event_type}: {message}")
 
     def register_referee(self, referee_id: str) -> None:
         """Register a referee."""
         referee = Referee(referee_id)
         self.referees[referee_id] = referee
+        self._referee_ids.append(referee_id)
         self.log("REFEREE_REGISTERED", f"{referee_id} registered")
 
     def register_player(self, player_id: str, display_name: str, strategy: str) -> None:
         """Register a player."""
-        player = Player(player_id, display_name, strategy)
+        player = Player(player_id, display_name, strategy, index=len(self._player_ids),
+                        seed=derive_seed(self.seed, player_id))
         self.players[player_id] = player
+        self._player_ids.append(player_id)
         self.log("PLAYER_REGISTERED", f"{player_id} ({display_name}) registered",
                  strategy=strategy)
 
     def generate_schedule(self) -> None:
         """Generate round-robin schedule."""
-        player_ids = list(self.players.keys())
-        all_matches = list(combinations(player_ids, 2))
-        remaining = list(all_matches)
-        round_num = 0
-
-        while remaining:
-            round_matches = []
-            players_in_round = set()
-
-            for match in remaining[:]:
-                p1, p2 = match
-                if p1 not in players_in_round and p2 not in players_in_round:
-                    round_matches.append({
-                        "match_id": f"R{round_num + 1}M{len(round_matches) + 1}",
-                        "round_id": f"ROUND_{round_num + 1}",
-                        "round_num": round_num + 1,
-                        "player_a": p1,
-                        "player_b": p2,
-                    })
-                    players_in_round.add(p1)
-                    players_in_round.add(p2)
-                    remaining.remove(match)
-
-            if round_matches:
-                self.schedule.append(round_matches)
-                round_num += 1
+        for round_idx, pairs in enumerate(round_robin(list(self.players.keys()))):
+            self.schedule.append([
+                {
+                    "match_id": f"R{round_idx + 1}M{match_idx + 1}",
+                    "round_id": f"ROUND_{round_idx + 1}",
+                    "round_num": round_idx + 1,
+                    "player_a": p1,
+                    "player_b": p2,
+                }
+                for match_idx, (p1, p2) in enumerate(pairs)
+            ])
 
         total_matches = sum(len(r) for r in self.schedule)
         self.log("SCHEDULE_GENERATED", f"{len(self.schedule)} rounds, {total_matches} matches")
 
-    def _execute_match(self, match: dict, referee: Referee) -> dict:
-        """Execute a single match."""
-        player_a = self.players[match["player_a"]]
-        player_b = self.players[match["player_b"]]
-        return referee.conduct_match(player_a, player_b, match["match_id"])
-
-    async def _run_round_parallel(self, round_matches: List[dict], round_num: int) -> None:
-        """Run all matches in a round in parallel."""
-        referee_ids = list(self.referees.keys())
-
-        async def run_match(match: dict, idx: int) -> dict:
-            referee = self.referees[referee_ids[idx % len(referee_ids)]]
-            await asyncio.sleep(0.01)
-            return self._execute_match(match, referee)
-
-        tasks = [run_match(m, i) for i, m in enumerate(round_matches)]
-        results = await asyncio.gather(*tasks)
-
-        for result, match in zip(results, round_matches):
-            result["round_num"] = round_num
-            result["referee"] = referee_ids[round_matches.index(match) % len(referee_ids)]
-            self.match_results.append(result)
-
-            winner_str = result["winner"] if result["winner"] else "DRAW"
-            self.log("MATCH_COMPLETED",
-                     f"{match['match_id']}: {result['player_a']} vs {result['player_b']} -> {winner_str}",
-                     drawn_number=result["drawn_number"])
-
     def run_league(self) -> None:
         """Run the entire league (sequential or parallel)."""
         self.start_time = time.perf_counter()
-        self.log("LEAGUE_START", f"League starting (parallel={self.parallel})")
-
-        if self.parallel:
-            asyncio.run(self._run_league_async())
+        self.log("LEAGUE_START", f"League starting (parallel={self.parallel})",
+                 seed=self.seed)
+
+        workers = self._pool_workers() if self.parallel else 1
+        if workers > 1:
+            self.workers = workers
+            with ProcessPoolExecutor(workers) as pool:
+                self._run_rounds(lambda tasks: list(pool.map(
+                    play_matches, _batches(tasks, self.workers)
+                )))
         else:
-            self._run_league_sequential()
+            self._run_rounds(lambda tasks: [play_matches(tasks)])
 
         self.end_time = time.perf_counter()
         duration_ms = (self.end_time - self.start_time) * 1000
         self.log("LEAGUE_COMPLETED", f"League finished in {duration_ms:.2f}ms")
 
-    async def _run_league_async(self) -> None:
-        """Run league with parallel match execution."""
-        for round_idx, round_matches in enumerate(self.schedule):
-            round_num = round_idx + 1
-            self.log("ROUND_START", f"Round {round_num} starting (parallel)",
-                     matches=len(round_matches))
-            await self._run_round_parallel(round_matches, round_num)
-            self.log("ROUND_COMPLETED", f"Round {round_num} completed")
-            self.print_standings(f"After Round {round_num}")
+    def _pool_workers(self) -> int:
+        """Worker processes worth starting (1 means play sequentially)."""
+        largest_round = max((len(r) for r in self.schedule), default=0)
+        cpus = os.cpu_count() or 1
+        workers = min(self.max_workers or cpus, largest_round)
+        if cpus < 2:
+            self.parallel_skipped = "single CPU"
+        elif workers < 2:
+            self.parallel_skipped = "single worker"
+        elif largest_round < self.min_parallel_matches:
+            self.parallel_skipped = f"rounds under {self.min_parallel_matches} matches"
+        else:
+            return workers
+        self.log("PARALLEL_SKIPPED", f"Playing sequentially: {self.parallel_skipped}")
+        return 1
+
+    def _run_rounds(self, execute: Callable[[List[MatchTask]], List[tuple]]) -> None:
+        """
+        Play every round, merging results into player stats in schedule order.
 
-    def _run_league_sequential(self) -> None:
-        """Run league with sequential match execution."""
-        referee_ids = list(self.referees.keys())
+        Args:
+            execute: Plays a round's tasks as consecutive batches and
+                returns one (results, seconds) pair per batch
+        """
+        referee_ids = self._referee_ids
+        mode = " (parallel)" if self.workers > 1 else ""
 
         for round_idx, round_matches in enumerate(self.schedule):
             round_num = round_idx + 1
-            self.log("ROUND_START", f"Round {round_num} starting", matches=len(round_matches))
-
-            for match_idx, match in enumerate(round_matches):
-                referee_id = referee_ids[match_idx % len(referee_ids)]
-                referee = self.referees[referee_id]
-
-                result = self._execute_match(match, referee)
-                result["round_num"] = round_num
-                result["referee"] = referee_id
-                self.match_results.append(result)
+            self.log("ROUND_START", f"Round {round_num} starting{mode}",
+                     matches=len(round_matches))
 
-                winner_str = result["winner"] if result["winner"] else "DRAW"
-                self.log("MATCH_COMPLETED",
-                         f"{match['match_id']}: {result['player_a']} vs {result['player_b']} -> {winner_str}",
-                         drawn_number=result["drawn_number"],
-                         choices=f"{result['choice_a']}/{result['choice_b']}")
+            tasks = [
+                (
+                    self.referees[referee_ids[match_idx % len(referee_ids)]],
+                    self.players[match["player_a"]],
+                    self.players[match["player_b"]],
+                    match["match_id"],
+                    self.seed,
+                )
+                for match_idx, match in enumerate(round_matches)
+            ]
+            started = time.perf_counter()
+            batches = execute(tasks)
+            self._execution_seconds += time.perf_counter() - started
+            self._compute_seconds += sum(elapsed for _, elapsed in batches)
+            played = [result for results, _ in batches for result in results]
+
+            for match_idx, (task, result) in enumerate(zip(tasks, played)):
+                referee, player_a, player_b, _, _ = task
+                referee.record_match(result, player_a, player_b)
+                self.match_results.append(
+                    result, round_num, match_idx + 1,
+                    player_a.index, player_b.index, match_idx % len(referee_ids),
+                )
+
+                if self.emit_events:  # Skip per-match formatting when headless
+                    winner_str = result["winner"] if result["winner"] else "DRAW"
+                    self.log("MATCH_COMPLETED",
+                             f"{result['match_id']}: {result['player_a']} vs {result['player_b']} -> {winner_str}",
+                             drawn_number=result["drawn_number"],
+                             choices=f"{result['choice_a']}/{result['choice_b']}")
 
             self.log("ROUND_COMPLETED", f"Round {round_num} completed")
-            self.print_standings(f"After Round {round_num}")
+            if not self.quiet:
+                self.print_standings(f"After Round {round_num}")
 
     def get_standings(self) -> List[Dict[str, Any]]:
         """Get current standings sorted by points."""
@@ -199,5 +253,13 @@ class LeagueSimulation:
             "total_duration_ms": round(duration_ms, 2),
             "total_matches": len(self.match_results),
             "avg_match_time_ms": round(duration_ms / max(len(self.match_results), 1), 2),
-            "parallel_mode": self.parallel,
+            "parallel_mode": self.workers > 1,
+            "parallel_skipped": self.parallel_skipped,
+            "workers": self.workers,
+            "seed": self.seed,
+            "match_execution_ms": round(self._execution_seconds * 1000, 2),
+            "sequential_estimate_ms": round(self._compute_seconds * 1000, 2),
+            "speedup_vs_sequential": round(
+                self._compute_seconds / self._execution_seconds, 2
+            ) if self._execution_seconds else 1.0,
         }
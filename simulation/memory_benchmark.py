@@ -0,0 +1,122 @@
+"""
+Memory benchmark for simulated players and match records.
+
+Measures, with tracemalloc, the bytes allocated per Player and per
+match record in MatchLog, against a dict-per-match baseline (the
+format Referee.play_match returns). Adaptive players are measured by
+the window of choices they remember per opponent met.
+
+Usage: python -m simulation.memory_benchmark --players 10000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from .player import Player
+from .records import MatchLog
+
+STRATEGIES = ["random", "deterministic_even", "alternating", "adaptive"]
+
+
+def _allocated(build: Callable[[], object]) -> int:
+    """Bytes held by build()'s result (measured while it is alive)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before
+
+
+def _players(count: int) -> List[Player]:
+    """Register players with freshly created strategies."""
+    return [
+        Player(f"P{i + 1:02d}", f"Bot{i + 1}", STRATEGIES[i % len(STRATEGIES)], index=i, seed=i)
+        for i in range(count)
+    ]
+
+
+def _adaptive_history(opponents: List[Player]) -> Player:
+    """An adaptive player that has met every one of `opponents`."""
+    player = Player("P00", "Adaptive", "adaptive", seed=0)
+    for opponent in opponents:
+        player.record_result("DRAW", opponent, "even")
+    return player
+
+
+def _sample_result(i: int, players: int) -> dict:
+    """A play_match-style result dict for match i."""
+    return {
+        "match_id": f"R{i // 1000 + 1}M{i % 1000 + 1}",
+        "player_a": f"P{i % players + 1:02d}",
+        "player_b": f"P{(i + 1) % players + 1:02d}",
+        "choice_a": "even",
+        "choice_b": "odd",
+        "drawn_number": i % 10 + 1,
+        "winner": f"P{i % players + 1:02d}",
+        "result_a": "WIN",
+        "result_b": "LOSS",
+        "round_num": i // 1000 + 1,
+        "referee": "REF01",
+    }
+
+
+def run(players: int = 10_000, matches: int = 100_000) -> Dict[str, float]:
+    """
+    Measure memory per player and per match.
+
+    Args:
+        players: Number of players to register
+        matches: Number of match records to store
+
+    Returns:
+        Bytes per player, per opponent in an adaptive player's history,
+        per match (MatchLog) and per match (dicts)
+    """
+    player_ids = [f"P{i + 1:02d}" for i in range(players)]
+    opponents = _players(players)[1:]
+
+    def log() -> MatchLog:
+        records = MatchLog(player_ids, ["REF01", "REF02"])
+        for i in range(matches):
+            records.append(_sample_result(i, players), i // 1000 + 1, i % 1000 + 1,
+                           i % players, (i + 1) % players, i % 2)
+        return records
+
+    def dicts() -> List[dict]:
+        return [_sample_result(i, players) for i in range(matches)]
+
+    return {
+        "players": players,
+        "matches": matches,
+        "bytes_per_player": _allocated(lambda: _players(players)) / players,
+        "bytes_per_opponent_history": _allocated(lambda: _adaptive_history(opponents))
+        / max(players - 1, 1),
+        "bytes_per_match": _allocated(log) / matches,
+        "bytes_per_match_dict": _allocated(dicts) / matches,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, float]:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Simulation memory benchmark")
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--matches", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    report = run(args.players, args.matches)
+    print(f"\n  MEMORY ({report['players']:,} players, {report['matches']:,} matches)")
+    print(f"  Per player:                          {report['bytes_per_player']:,.0f} bytes")
+    print(f"  Per opponent in adaptive history:    {report['bytes_per_opponent_history']:,.0f} bytes")
+    print(f"  Per match (MatchLog):                {report['bytes_per_match']:,.1f} bytes")
+    print(f"  Per match (result dicts):            {report['bytes_per_match_dict']:,.1f} bytes\n")
+    return report
+
+
+if __name__ == "__main__":
+    main()
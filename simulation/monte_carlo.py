@@ -0,0 +1,206 @@
+"""
+Vectorized Monte Carlo tournament simulator.
+
+Plays many independent round-robin leagues at once on NumPy arrays:
+one row per league, one column per player. Strategies are array
+kernels that choose parity for a whole column of leagues in one call,
+so per-match Python overhead disappears and millions of leagues can
+be simulated to estimate each strategy's win probability and rank
+distribution.
+
+Usage: python -m simulation.monte_carlo --leagues 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency
+    np = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk.game_rules.even_odd import (
+    EVEN,
+    ODD,
+    WINNER_A,
+    WINNER_B,
+    determine_outcomes,
+)
+from .schedule import round_robin
+
+DEFAULT_STRATEGIES = ["random", "deterministic_even", "alternating", "adaptive"]
+
+
+class _Batch:
+    """Mutable state for one batch of leagues."""
+
+    def __init__(self, rng, leagues: int, players: int):
+        self.rng = rng
+        self.size = leagues
+        self.points = np.zeros((leagues, players), dtype=np.int32)
+        self.wins = np.zeros((leagues, players), dtype=np.int32)
+        self.played = np.zeros(players, dtype=np.int32)  # Same in every league
+
+
+Kernel = Callable[[_Batch, int, int], "np.ndarray"]
+
+
+def _random(batch: _Batch, player: int, opponent: int) -> "np.ndarray":
+    return batch.rng.integers(0, 2, size=batch.size, dtype=np.int8)
+
+
+def _constant(choice: int) -> Kernel:
+    return lambda batch, player, opponent: np.full(batch.size, choice, dtype=np.int8)
+
+
+def _alternating(batch: _Batch, player: int, opponent: int) -> "np.ndarray":
+    """Even on the first match, then flip after every match played."""
+    return np.full(batch.size, batch.played[player] % 2, dtype=np.int8)
+
+
+STRATEGY_KERNELS: Dict[str, Kernel] = {
+    "random": _random,
+    "deterministic_even": _constant(EVEN),
+    "deterministic_odd": _constant(ODD),
+    "alternating": _alternating,
+    # AdaptiveStrategy needs three earlier choices of the same opponent,
+    # and a round robin pairs two players once per league, so it always
+    # falls back to a random choice
+    "adaptive": _random,
+}
+
+
+class MonteCarloSimulator:
+    """Batch simulator for many leagues with a fixed line-up of strategies."""
+
+    def __init__(
+        self,
+        strategies: Sequence[str],
+        seed: Optional[int] = None,
+        min_number: int = 1,
+        max_number: int = 10,
+    ):
+        """
+        Initialize simulator.
+
+        Args:
+            strategies: One strategy name per player, in registration order
+            seed: Seed for reproducible runs
+            min_number: Minimum drawn number (inclusive)
+            max_number: Maximum drawn number (inclusive)
+        """
+        if np is None:
+            raise ImportError("Monte Carlo simulation requires numpy")
+        unknown = set(strategies) - set(STRATEGY_KERNELS)
+        if unknown:
+            raise ValueError(f"Unknown strategies: {sorted(unknown)}")
+
+        self.strategies = list(strategies)
+        self.kernels = [STRATEGY_KERNELS[s] for s in self.strategies]
+        self.rounds = [
+            (np.array([a for a, _ in pairs]), np.array([b for _, b in pairs]))
+            for pairs in round_robin(range(len(self.strategies)))
+        ]
+        self.rng = np.random.default_rng(seed)
+        self.min_number = min_number
+        self.max_number = max_number
+
+    def _play_batch(self, leagues: int) -> _Batch:
+        """Play every round of `leagues` independent leagues."""
+        batch = _Batch(self.rng, leagues, len(self.strategies))
+        choices = np.zeros((leagues, len(self.strategies)), dtype=np.int8)
+
+        for a, b in self.rounds:
+            for player, opponent in zip(np.concatenate([a, b]), np.concatenate([b, a])):
+                choices[:, player] = self.kernels[player](batch, player, opponent)
+
+            choice_a, choice_b = choices[:, a], choices[:, b]
+            outcome = determine_outcomes(
+                choice_a, choice_b, rng=self.rng,
+                min_number=self.min_number, max_number=self.max_number,
+            )
+
+            # A player appears at most once per round, so fancy += is safe
+            batch.points[:, a] += outcome.points_a
+            batch.points[:, b] += outcome.points_b
+            batch.wins[:, a] += outcome.winner == WINNER_A
+            batch.wins[:, b] += outcome.winner == WINNER_B
+            batch.played[a] += 1
+            batch.played[b] += 1
+
+        return batch
+
+    def simulate(self, leagues: int, batch_size: int = 100_000) -> Dict[str, dict]:
+        """
+        Simulate leagues and summarize each strategy.
+
+        Ranks follow LeagueSimulation.get_standings: points, then wins,
+        then registration order.
+
+        Args:
+            leagues: Number of independent leagues
+            batch_size: Leagues simulated per array pass (bounds memory)
+
+        Returns:
+            Strategy -> {players, win_probability, expected_rank,
+            rank_distribution, mean_points}
+        """
+        n = len(self.strategies)
+        rank_counts = np.zeros((n, n), dtype=np.int64)  # [player, rank - 1]
+        total_points = np.zeros(n, dtype=np.int64)
+
+        for start in range(0, leagues, batch_size):
+            batch = self._play_batch(min(batch_size, leagues - start))
+            key = batch.points.astype(np.int64) * (len(self.rounds) + 1) + batch.wins
+            order = np.argsort(-key, axis=1, kind="stable")
+            for rank in range(n):
+                rank_counts[:, rank] += np.bincount(order[:, rank], minlength=n)
+            total_points += batch.points.sum(axis=0)
+
+        return self._summarize(rank_counts / leagues, total_points / leagues)
+
+    def _summarize(self, rank_dist: "np.ndarray", mean_points: "np.ndarray") -> Dict[str, dict]:
+        """Average per-player results over players sharing a strategy."""
+        summary = {}
+        for strategy in dict.fromkeys(self.strategies):
+            idx = [i for i, s in enumerate(self.strategies) if s == strategy]
+            dist = rank_dist[idx].mean(axis=0)
+            summary[strategy] = {
+                "players": len(idx),
+                "win_probability": float(dist[0]),
+                "expected_rank": float(dist @ np.arange(1, len(dist) + 1)),
+                "rank_distribution": [float(p) for p in dist],
+                "mean_points": float(mean_points[idx].mean()),
+            }
+        return summary
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, dict]:
+    """Command-line entry point."""
+    from .output import print_monte_carlo
+
+    parser = argparse.ArgumentParser(description="Monte Carlo strategy evaluation")
+    parser.add_argument("--leagues", type=int, default=100_000, help="Leagues to simulate")
+    parser.add_argument("--strategies", nargs="+", default=DEFAULT_STRATEGIES)
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducibility")
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    simulator = MonteCarloSimulator(args.strategies, seed=args.seed)
+    summary = simulator.simulate(args.leagues, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    print_monte_carlo(summary, args.leagues)
+    print(f"  {args.leagues:,} leagues in {elapsed:.2f}s "
+          f"({args.leagues / elapsed:,.0f} leagues/s)\n")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
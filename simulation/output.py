@@ -64,5 +64,46 @@ def print_final_results(
     if stats:
         print(f"\n  PERFORMANCE: {stats['total_duration_ms']:.2f}ms total, "
               f"{stats['avg_match_time_ms']:.2f}ms/match")
+        if stats.get("parallel_mode"):
+            print(f"  PARALLEL: {stats['workers']} workers, "
+                  f"{stats['speedup_vs_sequential']:.2f}x vs sequential")
+        elif stats.get("parallel_skipped"):
+            print(f"  PARALLEL: not used ({stats['parallel_skipped']}), played sequentially")
+        print(f"  SEED: {stats['seed']}")
 
     print("\n" + "="*80 + "\n")
+
+
+def print_monte_carlo(summary: Dict[str, Dict[str, Any]], leagues: int) -> None:
+    """Print Monte Carlo strategy evaluation."""
+    ranks = len(next(iter(summary.values()))["rank_distribution"])
+    print(f"\n{'='*80}")
+    print(f"  MONTE CARLO EVALUATION ({leagues:,} leagues)")
+    print(f"{'='*80}")
+    rank_header = "".join(f"{'#' + str(r + 1):>7}" for r in range(ranks))
+    print(f"  {'Strategy':<20}{'P(win)':>8}{'E[rank]':>9}{'Pts':>7}{rank_header}")
+    print(f"  {'-'*(44 + 7 * ranks)}")
+    for strategy, s in summary.items():
+        dist = "".join(f"{p:>7.3f}" for p in s["rank_distribution"])
+        print(f"  {strategy:<20}{s['win_probability']:>8.3f}{s['expected_rank']:>9.2f}"
+              f"{s['mean_points']:>7.2f}{dist}")
+    print(f"{'='*80}\n")
+
+
+def print_tournament(summary: Dict[str, Dict[str, Any]], leagues: int) -> None:
+    """Print strategy tournament results with 95% confidence intervals."""
+    ranks = len(next(iter(summary.values()))["rank_distribution"])
+    print(f"\n{'='*80}")
+    print(f"  STRATEGY TOURNAMENT ({leagues:,} leagues)")
+    print(f"{'='*80}")
+    rank_header = "".join(f"{'#' + str(r + 1):>7}" for r in range(ranks))
+    print(f"  {'Strategy':<20}{'N':>3}{'P(win)':>8}{'95% CI':>16}{'Pts':>8}{'95% CI':>16}"
+          f"{'E[rank]':>9}{rank_header}")
+    print(f"  {'-'*(80 + 7 * ranks)}")
+    for strategy, s in summary.items():
+        win_ci = f"{s['win_ci'][0]:.3f}-{s['win_ci'][1]:.3f}"
+        pts_ci = f"{s['points_ci'][0]:.2f}-{s['points_ci'][1]:.2f}"
+        dist = "".join(f"{p:>7.3f}" for p in s["rank_distribution"])
+        print(f"  {strategy:<20}{s['players']:>3}{s['win_probability']:>8.3f}{win_ci:>16}"
+              f"{s['mean_points']:>8.2f}{pts_ci:>16}{s['expected_rank']:>9.2f}{dist}")
+    print(f"{'='*80}\n")
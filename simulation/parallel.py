@@ -0,0 +1,53 @@
+"""
+Process-pool match execution for league simulation.
+
+Matches within a round never share a player, so a round can be split
+into batches played on pickled copies of their players in worker
+processes. Workers only compute results; the parent applies them to the
+real players in schedule order, so stat updates are never raced.
+"""
+
+import time
+from typing import Dict, List, Tuple
+
+from .player import Player
+from .referee import Referee
+
+MatchTask = Tuple[Referee, Player, Player, str, int]
+
+
+def play_matches(tasks: List[MatchTask]) -> Tuple[List[dict], float]:
+    """
+    Play a batch of matches from one round (worker entry point).
+
+    Each player makes all of its choices for the batch in one
+    choose_many call before any match is decided.
+
+    Args:
+        tasks: (referee, player_a, player_b, match_id, league_seed) each
+
+    Returns:
+        Tuple of (match results in task order, seconds spent playing)
+    """
+    start = time.perf_counter()
+    requests: Dict[str, Tuple[Player, List[str], List[Player]]] = {}
+    for _, player_a, player_b, match_id, _ in tasks:
+        for me, opponent in ((player_a, player_b), (player_b, player_a)):
+            _, match_ids, opponents = requests.setdefault(me.player_id, (me, [], []))
+            match_ids.append(match_id)
+            opponents.append(opponent)
+
+    choices: Dict[Tuple[str, str], str] = {}
+    for player, match_ids, opponents in requests.values():
+        for match_id, choice in zip(match_ids, player.choose_many(opponents, match_ids)):
+            choices[match_id, player.player_id] = choice
+
+    results = [
+        referee.decide_match(
+            player_a, choices[match_id, player_a.player_id],
+            player_b, choices[match_id, player_b.player_id],
+            match_id, seed,
+        )
+        for referee, player_a, player_b, match_id, seed in tasks
+    ]
+    return results, time.perf_counter() - start
@@ -2,61 +2,115 @@
 Simulated player agent for league simulation.
 """
 
-import random
-import asyncio
-from typing import Dict, List, Optional
+from array import array
+from typing import List, Optional, Sequence
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "player_template"))
 
 from league_sdk.helpers import generate_token
+from strategies import get_strategy
+
+# A remembered window packs into one uint16 per opponent index: the
+# number of choices in the top 4 bits, the choices (1 = odd, newest in
+# bit 0) below them
+_COUNT_SHIFT = 12
+_CHOICE_MASK = (1 << _COUNT_SHIFT) - 1
 
 
 class Player:
-    """Simulated player agent with strategy."""
+    """
+    Simulated player agent with strategy.
+
+    Choices come from the same BaseStrategy plugin a live player loads
+    (strategies.get_strategy), so simulated and production behavior
+    match.
+
+    Opponents are Player objects. Strategies that decide from an
+    opponent's recent even/odd counts (choose_from_counts, i.e.
+    AdaptiveStrategy) are fed from a compact window per opponent index,
+    two bytes each, instead of keeping their own per-opponent lists.
+    """
 
-    def __init__(self, player_id: str, display_name: str, strategy: str):
+    __slots__ = (
+        "player_id", "display_name", "strategy", "index", "auth_token",
+        "wins", "draws", "losses", "points",
+        "_strategy", "_windows",
+    )
+
+    def __init__(
+        self,
+        player_id: str,
+        display_name: str,
+        strategy: str,
+        index: int = 0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize player.
+
+        Args:
+            player_id: Player identifier
+            display_name: Display name
+            strategy: Strategy name, as accepted by get_strategy
+            index: Registration index (used by compact match records)
+            seed: Strategy seed; None draws from OS entropy
+        """
         self.player_id = player_id
         self.display_name = display_name
         self.strategy = strategy
+        self.index = index
         self.auth_token = generate_token()
         self.wins = 0
         self.draws = 0
         self.losses = 0
         self.points = 0
-        self.history: List[dict] = []
-        self._last_choice = "even"
-        self._opponent_history: Dict[str, List[str]] = {}
-        self._lock = asyncio.Lock() if asyncio else None
-
-    def choose_parity(self, opponent_id: str) -> str:
-        """Choose parity based on strategy."""
-        if self.strategy == "random":
-            return random.choice(["even", "odd"])
-        elif self.strategy == "deterministic_even":
-            return "even"
-        elif self.strategy == "deterministic_odd":
-            return "odd"
-        elif self.strategy == "alternating":
-            choice = self._last_choice
-            self._last_choice = "odd" if choice == "even" else "even"
-            return choice
-        elif self.strategy == "adaptive":
-            return self._adaptive_choice(opponent_id)
-        return random.choice(["even", "odd"])
-
-    def _adaptive_choice(self, opponent_id: str) -> str:
-        """Make adaptive choice based on opponent history."""
-        opp_hist = self._opponent_history.get(opponent_id, [])
-        if len(opp_hist) < 2:
-            return random.choice(["even", "odd"])
-        even_count = opp_hist.count("even")
-        odd_count = opp_hist.count("odd")
-        return "even" if even_count >= odd_count else "odd"
-
-    def record_result(self, result: str, opponent_id: str, opponent_choice: str):
-        """Record match result."""
+        self._strategy = get_strategy(strategy, seed=seed)
+        self._windows = array("H") if hasattr(self._strategy, "choose_from_counts") else None
+
+    def choose_parity(self, opponent: "Player", match_id: str) -> str:
+        """
+        Choose parity for one match.
+
+        Pure with respect to player state, so it can run on a copy of the
+        player in a worker process; state advances in record_result.
+        """
+        if self._windows is not None:
+            return self._strategy.choose_from_counts(match_id, *self._counts(opponent.index))
+        return self._strategy.choose(match_id, opponent.player_id)
+
+    def choose_many(self, opponents: Sequence["Player"], match_ids: Sequence[str]) -> List[str]:
+        """Choose parity for several matches in one strategy call."""
+        if self._windows is not None:
+            return [self.choose_parity(o, m) for o, m in zip(opponents, match_ids)]
+        return self._strategy.choose_many(match_ids, [o.player_id for o in opponents])
+
+    def _counts(self, opponent: int) -> tuple:
+        """(even, odd) counts in the remembered window for an opponent index."""
+        windows = self._windows
+        window = windows[opponent] if opponent < len(windows) else 0
+        odd = bin(window & _CHOICE_MASK).count("1")
+        return (window >> _COUNT_SHIFT) - odd, odd
+
+    def _remember(self, opponent: int, choice: str) -> None:
+        """Push an opponent's choice into its window, dropping the oldest."""
+        windows = self._windows
+        if opponent >= len(windows):
+            windows.extend([0] * (opponent + 1 - len(windows)))
+        size = self._strategy.WINDOW
+        window = windows[opponent]
+        choices = ((window << 1) | (choice == "odd")) & ((1 << size) - 1)
+        windows[opponent] = min((window >> _COUNT_SHIFT) + 1, size) << _COUNT_SHIFT | choices
+
+    def record_result(
+        self,
+        result: str,
+        opponent: "Player",
+        opponent_choice: str,
+    ) -> None:
+        """Record match result and update the strategy, as a live player does."""
         if result == "WIN":
             self.wins += 1
             self.points += 3
@@ -66,6 +120,11 @@ class Player:
         else:
             self.losses += 1
 
-        if opponent_id not in self._opponent_history:
-            self._opponent_history[opponent_id] = []
-        self._opponent_history[opponent_id].append(opponent_choice)
+        if self._windows is not None:
+            self._remember(opponent.index, opponent_choice)
+            return
+        self._strategy.update({
+            "opponent_id": opponent.player_id,
+            "opponent_choice": opponent_choice,
+            "result": result,
+        })
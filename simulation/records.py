@@ -0,0 +1,116 @@
+"""
+Compact match records for large simulations.
+
+MatchLog stores each played match in parallel typed arrays instead of a
+dict per match: player and referee indices, the round and match number,
+the drawn number, and one byte holding the OUTCOME_TABLE index
+(choice A, choice B, drawn parity). Winner and results are looked up
+from the table when a record is read, so nothing is stored twice.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk.game_rules.even_odd import (
+    EVEN,
+    ODD,
+    OUTCOME_TABLE,
+    RESULT_NAMES,
+    WINNER_A,
+    WINNER_B,
+)
+
+_PARITY_NAMES = ("even", "odd")
+
+
+class MatchLog:
+    """Append-only, array-backed list of match results."""
+
+    __slots__ = (
+        "player_ids", "referee_ids",
+        "_round", "_number", "_a", "_b", "_drawn", "_referee", "_outcome",
+    )
+
+    def __init__(self, player_ids: List[str], referee_ids: List[str]):
+        """
+        Initialize empty log.
+
+        Args:
+            player_ids: Player ID per player index (shared, may grow)
+            referee_ids: Referee ID per referee index (shared, may grow)
+        """
+        self.player_ids = player_ids
+        self.referee_ids = referee_ids
+        self._round = array("H")  # n players need n - 1 rounds
+        self._number = array("H")
+        self._a = array("I")
+        self._b = array("I")
+        self._drawn = array("I")
+        self._referee = array("H")
+        self._outcome = array("B")  # OUTCOME_TABLE index
+
+    def append(
+        self,
+        result: Dict[str, Any],
+        round_num: int,
+        match_num: int,
+        player_a: int,
+        player_b: int,
+        referee: int,
+    ) -> None:
+        """
+        Store one result from Referee.play_match.
+
+        Args:
+            result: Match result dict
+            round_num: 1-based round number
+            match_num: 1-based match number within the round
+            player_a: Index of player A
+            player_b: Index of player B
+            referee: Index of the referee
+        """
+        a = ODD if result["choice_a"] == "odd" else EVEN
+        b = ODD if result["choice_b"] == "odd" else EVEN
+        self._round.append(round_num)
+        self._number.append(match_num)
+        self._a.append(player_a)
+        self._b.append(player_b)
+        self._drawn.append(result["drawn_number"])
+        self._referee.append(referee)
+        self._outcome.append(a << 2 | b << 1 | result["drawn_number"] & 1)
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        """Expand record i into the dict Referee.play_match returned."""
+        outcome = self._outcome[i]
+        result_a, result_b, winner, _, _ = OUTCOME_TABLE[outcome]
+        player_a = self.player_ids[self._a[i]]
+        player_b = self.player_ids[self._b[i]]
+        return {
+            "match_id": f"R{self._round[i]}M{self._number[i]}",
+            "player_a": player_a,
+            "player_b": player_b,
+            "choice_a": _PARITY_NAMES[outcome >> 2 & 1],
+            "choice_b": _PARITY_NAMES[outcome >> 1 & 1],
+            "drawn_number": self._drawn[i],
+            "winner": {WINNER_A: player_a, WINNER_B: player_b}.get(winner),
+            "result_a": RESULT_NAMES[result_a],
+            "result_b": RESULT_NAMES[result_b],
+            "round_num": self._round[i],
+            "referee": self.referee_ids[self._referee[i]],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self[i] for i in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self._outcome)
+
+    def nbytes(self) -> int:
+        """Bytes used by the record arrays' contents."""
+        columns = (self._round, self._number, self._a, self._b,
+                   self._drawn, self._referee, self._outcome)
+        return sum(len(c) * c.itemsize for c in columns)
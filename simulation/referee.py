@@ -0,0 +1,84 @@
+"""
+Simulated referee agent for league simulation.
+"""
+
+from typing import Optional
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk.game_rules.even_odd import EvenOddGame
+from league_sdk.rng import DRAW_STREAM, rng_stream
+from .player import Player
+
+
+class Referee:
+    """Simulated referee that conducts matches."""
+
+    def __init__(self, referee_id: str, min_number: int = 1, max_number: int = 10):
+        self.referee_id = referee_id
+        self.game = EvenOddGame(min_number, max_number)
+        self.matches_conducted = 0
+
+    def play_match(
+        self,
+        player_a: Player,
+        player_b: Player,
+        match_id: str,
+        seed: Optional[int] = None,
+    ) -> dict:
+        """
+        Play a match without touching player state (safe in a worker).
+
+        Players choose from their own seeded strategy streams and the
+        draw uses a stream derived from (seed, match_id), so the match
+        replays identically anywhere.
+        """
+        choice_a = player_a.choose_parity(player_b, match_id)
+        choice_b = player_b.choose_parity(player_a, match_id)
+        return self.decide_match(player_a, choice_a, player_b, choice_b, match_id, seed)
+
+    def decide_match(
+        self,
+        player_a: Player,
+        choice_a: str,
+        player_b: Player,
+        choice_b: str,
+        match_id: str,
+        seed: Optional[int] = None,
+    ) -> dict:
+        """Draw the number and build the result for already-made choices."""
+        outcome = self.game.determine_match_outcome(
+            player_a.player_id, choice_a, player_b.player_id, choice_b,
+            rng=rng_stream(seed, match_id, DRAW_STREAM),
+        )
+        return {
+            "match_id": match_id,
+            "player_a": player_a.player_id,
+            "player_b": player_b.player_id,
+            "choice_a": choice_a,
+            "choice_b": choice_b,
+            "drawn_number": outcome.drawn_number,
+            "winner": outcome.winner_id,
+            "result_a": outcome.player_a_result,
+            "result_b": outcome.player_b_result,
+        }
+
+    def record_match(self, result: dict, player_a: Player, player_b: Player) -> None:
+        """Apply a played match's result to both players."""
+        player_a.record_result(result["result_a"], player_b, result["choice_b"])
+        player_b.record_result(result["result_b"], player_a, result["choice_a"])
+        self.matches_conducted += 1
+
+    def conduct_match(
+        self,
+        player_a: Player,
+        player_b: Player,
+        match_id: str,
+        seed: Optional[int] = None,
+    ) -> dict:
+        """Play a match and record its result."""
+        result = self.play_match(player_a, player_b, match_id, seed)
+        self.record_match(result, player_a, player_b)
+        return result
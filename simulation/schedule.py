@@ -0,0 +1,44 @@
+"""
+Round-robin scheduling shared by the simulation engines.
+"""
+
+from itertools import combinations
+from typing import Hashable, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+def round_robin(player_ids: Sequence[T]) -> List[List[Tuple[T, T]]]:
+    """
+    Greedily pack every pairing into rounds where no player plays twice.
+
+    Args:
+        player_ids: Players in registration order
+
+    Returns:
+        Rounds, each a list of (player_a, player_b) pairs
+    """
+    remaining = list(combinations(player_ids, 2))
+    rounds = []
+    full_round = len(player_ids) - 1  # No further pair fits once this many play
+
+    while remaining:
+        round_pairs = []
+        players_in_round = set()
+        deferred = []
+
+        for i, pair in enumerate(remaining):
+            p1, p2 = pair
+            if p1 in players_in_round or p2 in players_in_round:
+                deferred.append(pair)
+                continue
+            round_pairs.append(pair)
+            players_in_round.update(pair)
+            if len(players_in_round) >= full_round:
+                deferred.extend(remaining[i + 1:])
+                break
+
+        rounds.append(round_pairs)
+        remaining = deferred
+
+    return rounds
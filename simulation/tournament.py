@@ -0,0 +1,258 @@
+"""
+Strategy tournament runner.
+
+Plays many independent round-robin leagues between the real player
+strategies (agents/player_template/strategies) and aggregates how each
+strategy fares. Leagues are split into shards that run across a process
+pool; every shard returns a small TournamentStats that the parent merges
+as shards complete. League i is seeded from (seed, i) alone, so results
+do not depend on the number of workers or the shard size.
+
+Usage: python -m simulation.tournament random:2 adaptive:2 alternating \\
+           --leagues 10000 --workers 4 --seed 1
+"""
+
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "player_template"))
+
+from league_sdk.game_rules.even_odd import EvenOddGame
+from league_sdk.helpers import calculate_points
+from league_sdk.rng import DRAW_STREAM, derive_seed, new_league_seed, rng_stream
+from strategies import STRATEGY_CLASSES, get_strategy
+from .schedule import round_robin
+
+Z_95 = 1.96  # Normal quantile for 95% confidence intervals
+
+
+class TournamentStats:
+    """
+    Mergeable per-strategy totals over many leagues.
+
+    Each league contributes one sample per strategy: the total points and
+    number of league wins of that strategy's players. Totals are integers,
+    so merging shards in any order gives identical results.
+    """
+
+    def __init__(self, lineup: Sequence[str]):
+        self.lineup = list(lineup)
+        self.seed: Optional[int] = None
+        self.strategies = list(dict.fromkeys(self.lineup))
+        self.leagues = 0
+        self.points = {s: 0 for s in self.strategies}
+        self.points_sq = {s: 0 for s in self.strategies}
+        self.wins = {s: 0 for s in self.strategies}
+        self.rank_counts = {s: [0] * len(self.lineup) for s in self.strategies}
+
+    def add_league(self, ranking: Sequence[int], points: Sequence[int]) -> None:
+        """
+        Add one league's result.
+
+        Args:
+            ranking: Player indices from first to last place
+            points: Final points per player index
+        """
+        league_points = dict.fromkeys(self.strategies, 0)
+        for player, strategy in enumerate(self.lineup):
+            league_points[strategy] += points[player]
+        for strategy, total in league_points.items():
+            self.points[strategy] += total
+            self.points_sq[strategy] += total * total
+        for rank, player in enumerate(ranking):
+            self.rank_counts[self.lineup[player]][rank] += 1
+        self.wins[self.lineup[ranking[0]]] += 1
+        self.leagues += 1
+
+    def merge(self, other: "TournamentStats") -> None:
+        """Add another shard's totals."""
+        for s in self.strategies:
+            self.points[s] += other.points[s]
+            self.points_sq[s] += other.points_sq[s]
+            self.wins[s] += other.wins[s]
+            self.rank_counts[s] = [a + b for a, b in zip(self.rank_counts[s], other.rank_counts[s])]
+        self.leagues += other.leagues
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-strategy results, averaged per player.
+
+        Returns:
+            Strategy -> {players, mean_points, points_ci, win_probability,
+            win_ci, expected_rank, rank_distribution}
+        """
+        n = max(self.leagues, 1)
+        result = {}
+        for s in self.strategies:
+            k = self.lineup.count(s)
+            mean, half = _mean_ci(self.points[s], self.points_sq[s], n)
+            win_mean, win_half = _mean_ci(self.wins[s], self.wins[s], n)  # 0/1 samples
+            dist = [c / (n * k) for c in self.rank_counts[s]]
+            result[s] = {
+                "players": k,
+                "mean_points": mean / k,
+                "points_ci": ((mean - half) / k, (mean + half) / k),
+                "win_probability": win_mean / k,
+                "win_ci": (max(win_mean - win_half, 0.0) / k, min(win_mean + win_half, 1.0) / k),
+                "expected_rank": sum((r + 1) * p for r, p in enumerate(dist)),
+                "rank_distribution": dist,
+            }
+        return result
+
+
+def _mean_ci(total: int, total_sq: int, n: int) -> tuple:
+    """Sample mean and 95% CI half-width from a sum and sum of squares."""
+    mean = total / n
+    variance = max(total_sq / n - mean * mean, 0.0) * n / max(n - 1, 1)
+    return mean, Z_95 * math.sqrt(variance / n)
+
+
+def parse_lineup(specs: Sequence[str]) -> List[str]:
+    """
+    Expand "name" / "name:count" specs into one strategy name per player.
+
+    Raises:
+        ValueError: On unknown strategies, bad counts or fewer than 2 players
+    """
+    lineup = []
+    for spec in specs:
+        name, _, count = spec.partition(":")
+        if name not in STRATEGY_CLASSES:
+            raise ValueError(f"Unknown strategy: {name}")
+        if count and (not count.isdigit() or int(count) < 1):
+            raise ValueError(f"Invalid count in {spec!r}")
+        lineup.extend([name] * int(count or 1))
+    if len(lineup) < 2:
+        raise ValueError("A tournament needs at least 2 players")
+    return lineup
+
+
+def play_league(lineup: Sequence[str], seed: int, league: int, rounds: list) -> tuple:
+    """
+    Play one league with fresh strategy instances.
+
+    Strategies see the same calls as in a live league: choose() before
+    each match and update() with the opponent's choice afterwards.
+
+    Returns:
+        (ranking, points): player indices by final place, points per player
+    """
+    league_seed = derive_seed(seed, league)
+    players = [f"P{i + 1:02d}" for i in range(len(lineup))]
+    strategies = [
+        get_strategy(name, seed=derive_seed(league_seed, player))
+        for name, player in zip(lineup, players)
+    ]
+    game = EvenOddGame()
+    points = [0] * len(lineup)
+    wins = [0] * len(lineup)
+
+    for round_idx, pairs in enumerate(rounds):
+        for match_idx, (a, b) in enumerate(pairs):
+            match_id = f"R{round_idx + 1}M{match_idx + 1}"
+            choice_a = strategies[a].choose(match_id, players[b])
+            choice_b = strategies[b].choose(match_id, players[a])
+            outcome = game.determine_match_outcome(
+                players[a], choice_a, players[b], choice_b,
+                rng=rng_stream(league_seed, match_id, DRAW_STREAM),
+            )
+            for me, opp, choice, result in (
+                (a, b, choice_b, outcome.player_a_result),
+                (b, a, choice_a, outcome.player_b_result),
+            ):
+                points[me] += calculate_points(result)
+                wins[me] += result == "WIN"
+                strategies[me].update({
+                    "opponent_id": players[opp],
+                    "opponent_choice": choice,
+                    "result": result,
+                })
+
+    # Same order as LeagueSimulation.get_standings: points, wins, registration
+    ranking = sorted(range(len(lineup)), key=lambda p: (-points[p], -wins[p]))
+    return ranking, points
+
+
+def play_shard(lineup: Sequence[str], seed: int, start: int, stop: int) -> TournamentStats:
+    """Play leagues [start, stop) and return their totals (worker entry point)."""
+    rounds = round_robin(range(len(lineup)))
+    stats = TournamentStats(lineup)
+    for league in range(start, stop):
+        stats.add_league(*play_league(lineup, seed, league, rounds))
+    return stats
+
+
+def run_tournament(
+    lineup: Sequence[str],
+    leagues: int,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    shard_size: int = 500,
+) -> TournamentStats:
+    """
+    Run a tournament, sharded across a process pool when workers > 1.
+
+    Args:
+        lineup: One strategy name per player
+        leagues: Number of independent leagues
+        seed: Tournament seed (a fresh one is drawn when None)
+        workers: Worker processes (1 runs in-process)
+        shard_size: Leagues per shard
+
+    Returns:
+        Merged totals; stats.seed holds the seed used
+    """
+    seed = seed if seed is not None else new_league_seed()
+    shards = [(start, min(start + shard_size, leagues)) for start in range(0, leagues, shard_size)]
+    stats = TournamentStats(lineup)
+
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(min(workers, len(shards))) as pool:
+            futures = [pool.submit(play_shard, lineup, seed, a, b) for a, b in shards]
+            for future in as_completed(futures):
+                stats.merge(future.result())
+    else:
+        for a, b in shards:
+            stats.merge(play_shard(lineup, seed, a, b))
+
+    stats.seed = seed
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Command-line entry point."""
+    from .output import print_tournament
+
+    parser = argparse.ArgumentParser(description="Strategy tournament")
+    parser.add_argument("strategies", nargs="+", help="Strategy specs, e.g. random:2 adaptive")
+    parser.add_argument("--leagues", type=int, default=1000, help="Leagues to play")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shard-size", type=int, default=500, help="Leagues per worker task")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducibility")
+    args = parser.parse_args(argv)
+
+    try:
+        lineup = parse_lineup(args.strategies)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    stats = run_tournament(lineup, args.leagues, args.seed, args.workers, args.shard_size)
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary()
+    print_tournament(summary, stats.leagues)
+    print(f"  {stats.leagues:,} leagues in {elapsed:.2f}s with {args.workers} worker(s), "
+          f"seed {stats.seed}\n")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
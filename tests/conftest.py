@@ -0,0 +1,73 @@
+"""
+Shared pytest fixtures.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import JsonLogger, local_registry, mcp_server
+
+AGENTS = Path(__file__).parent.parent / "agents"
+# Agent directories use the same flat module names
+FLAT_MODULES = {
+    "main", "handlers", "state", "strategies", "scheduler", "standings",
+    "game_logic", "invitation_handler", "parity_handler",
+}
+
+
+def load_agent(directory: str):
+    """Import an agent's main module without clashing with the others."""
+    def flat() -> list[str]:
+        return [name for name in sys.modules if name.split(".")[0] in FLAT_MODULES]
+
+    saved = {name: sys.modules.pop(name) for name in flat()}
+    path = str(AGENTS / directory)
+    sys.path.insert(0, path)
+    try:
+        return importlib.import_module("main")
+    finally:
+        sys.path.remove(path)
+        for name in flat():
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+@pytest.fixture
+def tmp_logs(monkeypatch, tmp_path):
+    """Keep test servers' logs out of SHARED/logs."""
+    monkeypatch.setattr(
+        mcp_server, "JsonLogger",
+        lambda agent_type, agent_id, log_dir=None: JsonLogger(agent_type, agent_id, log_dir or str(tmp_path)),
+    )
+
+
+@pytest.fixture
+def agents(monkeypatch, tmp_path, tmp_logs):
+    """Manager, referee and player main modules logging under tmp_path."""
+    modules = {d: load_agent(d) for d in ("league_manager", "referee_template", "player_template")}
+    for module in modules.values():
+        monkeypatch.setattr(
+            module, "JsonLogger",
+            lambda agent_type, agent_id, log_dir=None: JsonLogger(agent_type, agent_id, log_dir or str(tmp_path)),
+        )
+    yield modules
+    local_registry.clear()
+
+
+@pytest.fixture
+def no_http(monkeypatch):
+    """Record (and refuse) every HTTP request."""
+    sent = []
+
+    async def refuse(client, request, **kwargs):
+        sent.append(str(request.url))
+        raise httpx.ConnectError("HTTP disabled in this test", request=request)
+
+    monkeypatch.setattr(httpx.AsyncClient, "send", refuse)
+    return sent
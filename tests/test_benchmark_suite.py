@@ -0,0 +1,141 @@
+"""
+Tests for the SDK benchmark suite and benchmark utilities.
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from benchmark_suite import (
+    BENCHMARKS,
+    BenchResult,
+    calibrate,
+    compare,
+    run_suite,
+    save_baseline,
+    server_load,
+)
+from league_sdk import JsonLogger, benchmark_concurrent, benchmark_sync
+
+
+def _result(name: str, p50: float) -> BenchResult:
+    return BenchResult(name, loops=8, samples=5, mean_us=p50, p50_us=p50, p95_us=p50, p99_us=p50)
+
+
+class TestMeasurement:
+    """Calibration, timing and memory passes."""
+
+    def test_calibrate_reaches_min_sample_time(self):
+        """Loops double until one sample is long enough."""
+        calls = []
+
+        def op(n: int) -> None:
+            calls.append(n)
+            sum(range(n * 100))
+
+        loops = calibrate(op, 0.001)
+        assert loops == calls[-1]
+        assert calls == [2 ** i for i in range(len(calls))]
+
+    def test_run_suite_subset(self):
+        """Every selected hot path runs and reports ordered percentiles."""
+        results = run_suite(list(BENCHMARKS), samples=3, min_sample_seconds=0.0001, memory=True)
+        assert [r.name for r in results] == list(BENCHMARKS)
+        for r in results:
+            assert 0 < r.p50_us <= r.p95_us <= r.p99_us
+            assert r.peak_kib is not None
+
+    def test_logs_stay_out_of_shared(self, monkeypatch):
+        """Servers, loggers and the load test write logs to temporary directories."""
+        log_dirs = []
+        init = JsonLogger.__init__
+
+        def record(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+            log_dirs.append(self._log_dir)
+
+        monkeypatch.setattr(JsonLogger, "__init__", record)
+        run_suite(["envelope_validation", "logger_write", "client_send_local"],
+                  samples=2, min_sample_seconds=0.0001)
+        asyncio.run(server_load(concurrency=2, requests=4))
+
+        assert len(log_dirs) == 4
+        assert all(d.is_relative_to(tempfile.gettempdir()) for d in log_dirs)
+
+    def test_timing_runs_untraced(self):
+        """benchmark_sync traces memory in one separate run only."""
+        traced = []
+        result = benchmark_sync(lambda: traced.append(tracemalloc.is_tracing()),
+                                num_runs=4, warmup=False)
+        assert traced == [False] * 4 + [True]
+        assert result.success_count == 4
+
+
+class TestBaselines:
+    """Saving and comparing baselines."""
+
+    def test_round_trip_and_regression(self, tmp_path):
+        """A saved baseline flags benchmarks slower than the threshold."""
+        path = tmp_path / "baseline.json"
+        save_baseline([_result("fast", 10.0), _result("slow", 10.0)], path)
+        baseline = json.loads(path.read_text())
+
+        rows = compare([_result("fast", 11.0), _result("slow", 14.0)], baseline, threshold=0.25)
+        assert {r["name"]: r["regressed"] for r in rows} == {"fast": False, "slow": True}
+        assert abs(rows[1]["change"] - 0.4) < 1e-9
+
+    def test_new_benchmarks_not_compared(self):
+        """Benchmarks missing from the baseline are skipped."""
+        assert compare([_result("new", 5.0)], {"benchmarks": {}}) == []
+
+
+class TestConcurrent:
+    """Concurrency-aware async benchmarks."""
+
+    def test_closed_loop_overlaps_calls(self):
+        """N workers keep N calls in flight."""
+        in_flight = []
+        peak = []
+
+        async def call():
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.002)
+            in_flight.pop()
+
+        result = asyncio.run(benchmark_concurrent(call, concurrency=8, requests=64, warmup=0))
+        assert result.mode == "closed"
+        assert result.requests == 64 and result.errors == 0
+        assert max(peak) == 8
+        assert result.latency_ms["p50"] >= 2
+        assert sum(b["count"] for b in result.histogram) == 64
+        assert result.histogram[-1]["le_ms"] == "+Inf"
+        json.dumps(result.to_dict(), allow_nan=False)  # Strict JSON: no Infinity
+
+    def test_open_loop_keeps_rate(self):
+        """Arrivals follow the target rate and errors are counted."""
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if len(calls) % 10 == 0:
+                raise RuntimeError("boom")
+
+        result = asyncio.run(benchmark_concurrent(call, rate=200, duration=0.25, warmup=0))
+        assert result.mode == "open" and result.requests == 50
+        assert result.errors == 5
+        assert 0.2 <= result.elapsed_seconds < 0.5
+        assert result.loop_lag_ms["count"] > 0
+
+    def test_server_load_over_asgi(self):
+        """MCPServer.app answers through the in-memory transport."""
+        result = asyncio.run(server_load(concurrency=4, requests=40))
+        assert result.requests == 40
+        assert result.errors == 0
+        assert result.throughput > 0
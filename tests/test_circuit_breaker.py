@@ -0,0 +1,222 @@
+"""
+Tests for sliding-window circuit breakers and the bounded registry.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import (
+    CircuitBreaker,
+    CircuitBreakerOpen,
+    CircuitBreakerRegistry,
+    CircuitConfig,
+    CircuitState,
+    MCPClient,
+    metrics_registry,
+)
+
+
+def breaker(**config) -> CircuitBreaker:
+    """Unnamed breaker with the given thresholds."""
+    return CircuitBreaker(CircuitConfig(**config))
+
+
+class TestSlidingWindow:
+    """Tests for opening on failure and slow-call rates."""
+
+    def test_opens_on_failure_rate(self):
+        """Failures open the circuit once they reach the rate over minimum_calls."""
+        circuit = breaker(window_size=10, minimum_calls=4, failure_rate_threshold=0.5)
+        circuit.record_failure()
+        circuit.record_failure()
+        circuit.record_success()
+        assert circuit.state == CircuitState.CLOSED  # Only 3 calls so far
+        circuit.record_success()
+        assert circuit.state == CircuitState.OPEN  # 2 of 4 failed
+
+    def test_scattered_failures_tolerated(self):
+        """Failures spread thinly over the window do not open it."""
+        circuit = breaker(window_size=4, minimum_calls=4, failure_rate_threshold=0.5)
+        for _ in range(10):
+            circuit.record_failure()
+            circuit.record_success()
+            circuit.record_success()
+            circuit.record_success()
+        assert circuit.state == CircuitState.CLOSED
+        assert circuit.failure_rate == 0.25
+
+    def test_old_outcomes_slide_out(self):
+        """Only the last window_size outcomes count."""
+        circuit = breaker(window_size=3, minimum_calls=3, failure_rate_threshold=0.9)
+        circuit.record_failure()
+        circuit.record_failure()
+        for _ in range(3):
+            circuit.record_success()
+        assert circuit.failure_rate == 0
+        assert circuit.get_status()["calls"] == 3
+
+    def test_opens_on_slow_calls(self):
+        """Successful but slow calls open the circuit at the slow-call rate."""
+        circuit = breaker(minimum_calls=3, slow_call_seconds=1.0, slow_call_rate_threshold=0.6)
+        circuit.record_success(2.0)
+        circuit.record_success(0.1)
+        circuit.record_success(1.5)
+        assert circuit.state == CircuitState.OPEN
+
+
+class TestHalfOpen:
+    """Tests for recovery probing."""
+
+    def opened(self, **config) -> CircuitBreaker:
+        circuit = breaker(minimum_calls=1, timeout_seconds=0.02, **config)
+        circuit.record_failure()
+        assert not circuit.can_execute()
+        time.sleep(0.03)
+        return circuit
+
+    def test_probes_limited(self):
+        """Half-open admits half_open_max_calls concurrent probes."""
+        circuit = self.opened(half_open_max_calls=2)
+        (allowed, probe), (again, _) = circuit.try_acquire(), circuit.try_acquire()
+        assert allowed and again and probe is not None
+        assert circuit.state == CircuitState.HALF_OPEN
+        assert not circuit.can_execute()
+        circuit.release(probe)
+        assert circuit.can_execute()
+
+    def test_release_needs_a_probe(self):
+        """A call admitted while closed frees no slot when it ends half-open."""
+        circuit = breaker(minimum_calls=1, timeout_seconds=0.02)
+        allowed, closed_call = circuit.try_acquire()
+        assert allowed and closed_call is None
+        circuit.record_failure()  # Another call opens the circuit
+        time.sleep(0.03)
+        assert circuit.can_execute()  # The one probe slot is taken
+        circuit.release(closed_call)
+        assert not circuit.can_execute()
+
+    def test_stale_probe_ignored(self):
+        """A probe from an earlier half-open period frees nothing in the next."""
+        circuit = self.opened()
+        _, stale = circuit.try_acquire()
+        circuit.record_failure()  # Reopens
+        time.sleep(0.03)
+        assert circuit.can_execute()
+        circuit.release(stale)
+        assert not circuit.can_execute()
+
+    def test_successful_probes_close(self):
+        """success_threshold successful probes close the circuit."""
+        circuit = self.opened(success_threshold=2)
+        for _ in range(2):
+            allowed, probe = circuit.try_acquire()
+            assert allowed
+            circuit.record_success(0.01)
+            circuit.release(probe)
+        assert circuit.state == CircuitState.CLOSED
+        assert circuit.get_status()["calls"] == 0
+
+    def test_slow_probe_reopens(self):
+        """A slow probe counts as failed."""
+        circuit = self.opened(slow_call_seconds=1.0)
+        assert circuit.can_execute()
+        circuit.record_success(5.0)
+        assert circuit.state == CircuitState.OPEN
+
+
+class TestLegacyThresholds:
+    """Tests for the consecutive-failure keyword arguments."""
+
+    def test_constructor_keywords(self):
+        """failure_threshold failures in a row open the circuit, fewer do not."""
+        circuit = CircuitBreaker(failure_threshold=3, success_threshold=1, timeout_seconds=0.02)
+        assert circuit.config.timeout_seconds == 0.02
+        for _ in range(5):
+            circuit.record_failure()
+            circuit.record_failure()
+            circuit.record_success(60.0)  # Slow calls never counted before
+        assert circuit.state == CircuitState.CLOSED
+        for _ in range(3):
+            circuit.record_failure()
+        assert circuit.state == CircuitState.OPEN
+        time.sleep(0.03)
+        assert circuit.can_execute() and circuit.can_execute()  # No probe limit
+        circuit.record_success()
+        assert circuit.state == CircuitState.CLOSED
+
+    def test_registry_keywords(self):
+        """get() keywords set the thresholds of a new breaker."""
+        registry = CircuitBreakerRegistry()
+        circuit = registry.get("http://legacy.test/mcp", failure_threshold=2, timeout_seconds=5)
+        assert (circuit.config.minimum_calls, circuit.config.timeout_seconds) == (2, 5)
+        assert registry.get("http://legacy.test/mcp") is circuit
+        assert registry.get("http://new.test/mcp").config == CircuitConfig()
+
+
+class TestRegistry:
+    """Tests for per-endpoint configuration and eviction."""
+
+    def test_per_endpoint_config(self):
+        """Configured endpoints get their own thresholds, others the default."""
+        registry = CircuitBreakerRegistry(CircuitConfig(minimum_calls=7))
+        registry.configure("http://slow.test/mcp", CircuitConfig(slow_call_seconds=60))
+        assert registry.get("http://slow.test/mcp").config.slow_call_seconds == 60
+        assert registry.get("http://other.test/mcp").config.minimum_calls == 7
+
+    def test_bounded_least_recently_used(self):
+        """Past max_breakers the least recently used breaker is dropped."""
+        registry = CircuitBreakerRegistry(max_breakers=2)
+        first = registry.get("http://a.test/mcp")
+        registry.get("http://b.test/mcp")
+        first.can_execute()  # a used after b
+        registry.get("http://c.test/mcp")
+        assert len(registry) == 2
+        assert set(registry.get_all_status()) == {"http://a.test/mcp", "http://c.test/mcp"}
+        gauge = metrics_registry.get("circuit_breaker_state")
+        assert ("http://b.test/mcp",) not in gauge._children
+
+    def test_idle_evicted_first(self):
+        """Every idle breaker goes when the bound is reached."""
+        registry = CircuitBreakerRegistry(max_breakers=3, idle_seconds=0.02)
+        for name in ("a", "b", "c"):
+            registry.get(f"http://{name}.test/mcp")
+        time.sleep(0.03)
+        registry.get("http://d.test/mcp")
+        assert list(registry.get_all_status()) == ["http://d.test/mcp"]
+
+
+class TestClientProbes:
+    """Tests for MCPClient honouring the half-open probe limit."""
+
+    def test_one_probe_at_a_time(self, monkeypatch):
+        """While a probe is in flight, other sends fail fast."""
+        registry = CircuitBreakerRegistry(CircuitConfig(minimum_calls=1, timeout_seconds=0))
+        monkeypatch.setattr(MCPClient, "_circuit_registry", registry)
+        endpoint = "http://probe.test/mcp"
+        registry.get(endpoint).record_failure()
+
+        async def transport(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"jsonrpc": "2.0", "result": {}, "id": 1})
+
+        client = MCPClient("referee:PROBE")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+
+        async def race():
+            return await asyncio.gather(
+                client.send(endpoint, "LEAGUE_QUERY", {}),
+                client.send(endpoint, "LEAGUE_QUERY", {}),
+                return_exceptions=True,
+            )
+
+        probe, refused = asyncio.run(race())
+        assert probe["result"] == {}
+        assert isinstance(refused, CircuitBreakerOpen)
+        assert registry.get(endpoint).get_status()["probes_in_flight"] == 0
@@ -0,0 +1,59 @@
+"""
+Unit tests for consistent hash ring sharding.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk.consistent_hash import ConsistentHashRing
+
+
+MATCH_IDS = [f"R{r}M{m}" for r in range(1, 51) for m in range(1, 11)]
+
+
+class TestConsistentHashRing:
+    """Tests for match-to-referee sharding."""
+
+    def test_empty_ring_returns_none(self):
+        """Empty ring owns nothing."""
+        assert ConsistentHashRing().get_node("R1M1") is None
+
+    def test_assignment_is_deterministic(self):
+        """Same nodes give the same owner regardless of insertion order."""
+        ring_a = ConsistentHashRing(["REF01", "REF02", "REF03"])
+        ring_b = ConsistentHashRing(["REF03", "REF01", "REF02"])
+        for match_id in MATCH_IDS:
+            assert ring_a.get_node(match_id) == ring_b.get_node(match_id)
+
+    def test_all_nodes_receive_matches(self):
+        """Matches spread over every referee in the pool."""
+        ring = ConsistentHashRing(["REF01", "REF02", "REF03", "REF04"])
+        owners = {ring.get_node(m) for m in MATCH_IDS}
+        assert owners == {"REF01", "REF02", "REF03", "REF04"}
+
+    def test_adding_node_only_moves_keys_to_new_node(self):
+        """A new referee only takes matches, others keep theirs."""
+        ring = ConsistentHashRing(["REF01", "REF02"])
+        before = {m: ring.get_node(m) for m in MATCH_IDS}
+        ring.add_node("REF03")
+        moved = [m for m in MATCH_IDS if ring.get_node(m) != before[m]]
+        assert moved
+        assert all(ring.get_node(m) == "REF03" for m in moved)
+        assert len(moved) < len(MATCH_IDS) / 2
+
+    def test_remove_node(self):
+        """Removed referee no longer owns any match."""
+        ring = ConsistentHashRing(["REF01", "REF02"])
+        ring.remove_node("REF01")
+        assert "REF01" not in ring
+        assert {ring.get_node(m) for m in MATCH_IDS} == {"REF02"}
+
+    def test_sync_matches_pool(self):
+        """Sync adds and removes nodes to match the pool."""
+        ring = ConsistentHashRing(["REF01", "REF02"])
+        ring.sync(["REF02", "REF03"])
+        assert ring.nodes == ["REF02", "REF03"]
+        assert len(ring) == 2
@@ -0,0 +1,139 @@
+"""
+Unit tests for the endpoint directory cache.
+"""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import MCPClient, MCPServer, generate_token
+from league_sdk.endpoint_directory import EndpointDirectory
+
+
+REF01 = "http://127.0.0.1:8001/mcp"
+
+
+@pytest.fixture
+def clock():
+    """Controllable monotonic clock."""
+    return [1000.0]
+
+
+@pytest.fixture
+def directory(clock):
+    """Directory with a 10 second TTL driven by the fake clock."""
+    d = EndpointDirectory(ttl_seconds=10)
+    d._clock = lambda: clock[0]
+    return d
+
+
+class TestEndpointDirectory:
+    """Tests for endpoint resolution and invalidation."""
+
+    def test_register_and_resolve(self, directory):
+        """Registered endpoint resolves by agent ID."""
+        directory.register("REF01", REF01)
+        assert directory.resolve("REF01") == REF01
+        assert directory.resolve("REF02") is None
+
+    def test_entries_expire_after_ttl(self, directory, clock):
+        """Entries disappear once their TTL passes."""
+        directory.register("REF01", REF01)
+        clock[0] += 11
+        assert directory.resolve("REF01") is None
+
+    def test_no_ttl_never_expires(self, clock):
+        """Directories without TTL keep entries until invalidated."""
+        d = EndpointDirectory(ttl_seconds=None)
+        d._clock = lambda: clock[0]
+        d.register("P01", "http://127.0.0.1:8101/mcp")
+        clock[0] += 10_000
+        assert "P01" in d
+
+    def test_observe_envelope(self, directory):
+        """Sender's advertised endpoint is learned from an envelope."""
+        directory.observe({"sender": "referee:REF01", "contact_endpoint": REF01})
+        assert directory.resolve("REF01") == REF01
+
+    def test_invalidate_endpoint(self, directory):
+        """Connection failure drops every agent cached at that endpoint."""
+        directory.update({"REF01": REF01, "P01": "http://127.0.0.1:8101/mcp"})
+        directory.invalidate_endpoint(REF01)
+        assert directory.snapshot() == {"P01": "http://127.0.0.1:8101/mcp"}
+
+    def test_resolve_or_fetch_only_fetches_on_miss(self, directory):
+        """Fetcher is called once on a miss, never on a hit."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return {"REF02": "http://127.0.0.1:8002/mcp"}
+
+        async def run():
+            first = await directory.resolve_or_fetch("REF02", fetch)
+            second = await directory.resolve_or_fetch("REF02", fetch)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == "http://127.0.0.1:8002/mcp"
+        assert len(calls) == 1
+
+    def test_observe_keeps_pinned_entry(self, directory):
+        """Registered (pinned) endpoints are not replaced by envelopes."""
+        directory.register("P01", "http://127.0.0.1:8101/mcp", pinned=True)
+        directory.observe({"sender": "player:P01", "contact_endpoint": "http://evil.test/mcp"})
+        assert directory.resolve("P01") == "http://127.0.0.1:8101/mcp"
+
+
+@pytest.mark.usefixtures("tmp_logs")
+class TestServerLearning:
+    """Tests for which envelopes may teach MCPServer an endpoint."""
+
+    P01 = "http://127.0.0.1:8101/mcp"
+    EVIL = "http://127.0.0.1:9999/mcp"
+
+    @pytest.fixture
+    def manager(self):
+        """Manager-like server with P01 and P02 registered."""
+        server = MCPServer("league_manager", "SPOOF", port=8000)
+        server.directory = EndpointDirectory(ttl_seconds=None)
+        server.tokens = {pid: generate_token() for pid in ("P01", "P02")}
+        for pid, token in server.tokens.items():
+            server.register_auth_token(f"player:{pid}", token)
+        server.directory.register("P01", self.P01, pinned=True)
+
+        async def query(params: dict) -> dict:
+            return {"status": "OK"}
+
+        server.register_handler("LEAGUE_QUERY", query)
+        server.register_handler("QUERY_STANDINGS_REQUEST", query)
+        return server
+
+    def send(self, server: MCPServer, method: str, sender: str, token=None, endpoint=EVIL) -> dict:
+        client = MCPClient(sender, auth_token=token, contact_endpoint=endpoint)
+        request = {"jsonrpc": "2.0", "method": method, "id": 1,
+                   "params": client._build_envelope(method)}
+        return asyncio.run(server.dispatch(request))
+
+    def test_unauthenticated_sender_ignored(self, manager):
+        """A message needing no auth cannot claim another agent's endpoint."""
+        assert "result" in self.send(manager, "LEAGUE_QUERY", "player:P01")
+        self.send(manager, "LEAGUE_QUERY", "player:P07")
+        assert manager.directory.resolve("P01") == self.P01
+        assert manager.directory.resolve("P07") is None
+
+    def test_spoofed_sender_cannot_replace_registration(self, manager):
+        """P02's valid token does not let it speak for P01."""
+        self.send(manager, "QUERY_STANDINGS_REQUEST", "player:P01", manager.tokens["P02"])
+        assert manager.directory.resolve("P01") == self.P01
+
+    def test_authenticated_sender_learned(self, manager):
+        """A proven sender's new endpoint is learned (if not pinned)."""
+        moved = "http://127.0.0.1:8102/mcp"
+        self.send(manager, "QUERY_STANDINGS_REQUEST", "player:P02", manager.tokens["P02"], moved)
+        assert manager.directory.resolve("P02") == moved
+        self.send(manager, "QUERY_STANDINGS_REQUEST", "player:P01", manager.tokens["P01"])
+        assert manager.directory.resolve("P01") == self.P01
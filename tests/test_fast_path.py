@@ -0,0 +1,109 @@
+"""
+Invitation fast path between a real referee and real players: the join
+ack and parity choice ride on the invitation response, so no
+GAME_JOIN_ACK or CHOOSE_PARITY_CALL round trips are made.
+"""
+
+import asyncio
+
+import pytest
+
+
+def count_calls(server, message_type: str) -> list:
+    """Wrap a server's handler to record the match of every call."""
+    handler = server._handlers[message_type]
+    calls = []
+
+    async def counted(params: dict) -> dict:
+        calls.append(params.get("match_id"))
+        return await handler(params)
+
+    server.register_handler(message_type, counted)
+    return calls
+
+
+@pytest.fixture
+def match(agents, no_http, tmp_path):
+    """Referee REF81 and players P81 (always even) and P82 (always odd)."""
+    referee = agents["referee_template"].RefereeAgent("REF81", 9380)
+    referee.server.serve_in_process()
+    referee.join_acks = count_calls(referee.server, "GAME_JOIN_ACK")
+    players = []
+    for n, strategy in ((1, "deterministic_even"), (2, "deterministic_odd")):
+        player = agents["player_template"].PlayerAgent(f"P8{n}", 9380 + n, strategy_name=strategy)
+        player.state._state_file = tmp_path / f"P8{n}_state.json"
+        player.server.directory.register("REF81", referee.endpoint)  # For the legacy join ack
+        player.server.serve_in_process()
+        player.parity_calls = count_calls(player.server, "CHOOSE_PARITY_CALL")
+        players.append(player)
+    return referee, players
+
+
+async def play(referee, players, match_id: str) -> dict:
+    player_a, player_b = ({"id": p.player_id, "endpoint": p.endpoint} for p in players)
+    return await referee.orchestrator.conduct_match(match_id, "R1", player_a, player_b)
+
+
+class TestInvitationFastPath:
+    """Tests for a referee and players completing matches in-process."""
+
+    @pytest.mark.parametrize("fast_path", [True, False])
+    def test_match_round_trip(self, match, no_http, fast_path):
+        """Both flag settings finish the match; only the fast path skips the calls."""
+        referee, players = match
+        referee.orchestrator.invitation_handler.offer_fast_path = fast_path
+
+        result = asyncio.run(play(referee, players, "M1"))
+
+        assert result["winner_id"] in ("P81", "P82")  # Even vs odd never draws
+        assert (result["player_a_choice"], result["player_b_choice"]) == ("even", "odd")
+        expected_calls = [] if fast_path else ["M1"]
+        assert all(p.parity_calls == expected_calls for p in players)
+        assert referee.join_acks == ([] if fast_path else ["M1", "M1"])
+        assert referee.active_matches == {}
+        assert all(p.handlers._choices == {} for p in players)
+        assert no_http == []
+
+    def test_spoofed_join_ack_choice_ignored(self, match):
+        """A parity choice on an asynchronous ack does not replace the player's own."""
+        referee, players = match
+        referee.orchestrator.invitation_handler.offer_fast_path = False
+        invite = players[0].server._handlers["GAME_INVITATION"]
+
+        async def invite_and_spoof(params: dict) -> dict:
+            await referee.handlers.handle_game_join_ack({
+                "match_id": params["match_id"],
+                "sender": "player:P81",
+                "status": "ACCEPTED",
+                "parity_choice": "odd",
+            })
+            return await invite(params)
+
+        players[0].server.register_handler("GAME_INVITATION", invite_and_spoof)
+
+        result = asyncio.run(play(referee, players, "M1"))
+
+        assert result["player_a_choice"] == "even"
+        assert players[0].parity_calls == ["M1"]
+
+    def test_aborted_match_choice_dropped(self, match):
+        """A choice from a match that never got GAME_OVER goes with the next invitation."""
+        referee, players = match
+        handlers = players[0].handlers
+
+        async def abandon_then_play():
+            await handlers.handle_game_invitation({
+                "match_id": "M0",
+                "opponent_id": "P82",
+                "role_in_match": "PLAYER_A",
+                "sender": "referee:REF81",
+                "ack_in_response": True,
+                "parity_in_response": True,
+            })
+            assert handlers._choices == {"M0": "even"}  # Referee gave up on M0
+            return await play(referee, players, "M1")
+
+        result = asyncio.run(abandon_then_play())
+
+        assert "error" not in result
+        assert handlers._choices == {}
@@ -8,7 +8,15 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
 
-from league_sdk.game_rules.even_odd import EvenOddGame, determine_winner
+from league_sdk.game_rules.even_odd import (
+    EvenOddGame,
+    OUTCOME_TABLE,
+    RESULT_NAMES,
+    WINNER_A,
+    NO_WINNER,
+    determine_outcomes,
+    determine_winner,
+)
 
 
 class TestEvenOddGameLogic:
@@ -89,3 +97,63 @@ class TestEvenOddGameLogic:
         assert result_a == "WIN"
         assert result_b == "LOSS"
         assert winner == "player_a"
+
+
+class TestBatchOutcomes:
+    """Tests for the batch outcome API."""
+
+    def test_table_matches_single_match_rules(self):
+        """Every table row agrees with determine_match_outcome."""
+        game = EvenOddGame()
+        choices = ("even", "odd")
+        for index, (res_a, res_b, winner, pts_a, pts_b) in enumerate(OUTCOME_TABLE):
+            a, b, drawn = choices[index >> 2 & 1], choices[index >> 1 & 1], 2 + (index & 1)
+            outcome = game.determine_match_outcome("A", a, "B", b, drawn)
+            assert RESULT_NAMES[res_a] == outcome.player_a_result
+            assert RESULT_NAMES[res_b] == outcome.player_b_result
+            assert outcome.winner_id == {NO_WINNER: None, WINNER_A: "A"}.get(winner, "B")
+            assert (pts_a, pts_b) in {(3, 0), (0, 3), (1, 1)}
+
+    def test_list_inputs(self):
+        """String choices with given numbers return lists of codes."""
+        outcome = determine_outcomes(["even", "odd", "odd"], ["odd", "odd", "even"], [4, 7, 2])
+        assert len(outcome) == 3
+        assert [RESULT_NAMES[r] for r in outcome.result_a] == ["WIN", "DRAW", "LOSS"]
+        assert outcome.points_a == [3, 1, 0]
+        assert outcome.points_b == [0, 1, 3]
+
+    def test_draws_numbers_in_range(self):
+        """Omitted numbers are drawn from the configured range."""
+        outcome = determine_outcomes([0] * 200, [1] * 200, min_number=5, max_number=6)
+        assert set(outcome.drawn_numbers) <= {5, 6}
+        assert all(w != NO_WINNER for w in outcome.winner)
+
+    def test_invalid_choices_rejected(self):
+        """Anything but even/odd or 0/1 raises ValueError on every path."""
+        game = EvenOddGame()
+        for bad in ("EVEN", "", 2, None):
+            with pytest.raises(ValueError):
+                game.determine_match_outcome("A", bad, "B", "even", 2)
+        with pytest.raises(ValueError):
+            determine_winner("even", "Odd", 3)
+        with pytest.raises(ValueError):
+            determine_outcomes(["even", "odd"], ["odd", 2], [4, 7])
+
+    def test_invalid_array_choices_rejected(self):
+        """Array inputs are validated too."""
+        np = pytest.importorskip("numpy")
+        drawn = np.array([4, 7])
+        for bad in (np.array(["even", "EVEN"]), np.array([0, 2]), np.array(["odd", "x"], dtype=object)):
+            with pytest.raises(ValueError):
+                determine_outcomes(bad, np.array([0, 1]), drawn)
+        outcome = determine_outcomes(np.array(["odd", 1], dtype=object), np.array([0, 0]), drawn)
+        assert outcome.winner.tolist() == [1, 0]
+
+    def test_array_inputs(self):
+        """NumPy bit arrays of any shape are evaluated element-wise."""
+        np = pytest.importorskip("numpy")
+        a = np.array([[0, 1], [1, 0]])
+        b = np.array([[1, 1], [0, 0]])
+        outcome = determine_outcomes(a, b, np.array([[4, 7], [2, 3]]))
+        assert outcome.points_a.tolist() == [[3, 1], [0, 1]]
+        assert outcome.winner.tolist() == [[0, -1], [1, -1]]
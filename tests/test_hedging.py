@@ -0,0 +1,172 @@
+"""
+Tests for hedged requests and server-side duplicate suppression.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import (
+    CircuitBreakerRegistry,
+    HedgePolicy,
+    MCPClient,
+    MCPServer,
+    hedged,
+    metrics_registry,
+)
+
+
+def slow_then_fast(delays: list[float], fail_first: bool = False):
+    """Call factory whose n-th invocation sleeps delays[n]."""
+    calls = []
+
+    async def call():
+        n = len(calls)
+        calls.append(n)
+        await asyncio.sleep(delays[n])
+        if fail_first and n == 0:
+            raise ConnectionError("primary failed")
+        return n
+
+    return call, calls
+
+
+class TestHedged:
+    """Tests for the hedged() helper."""
+
+    def test_slow_primary_hedged(self):
+        """A copy starts after the delay and its earlier answer wins."""
+        call, calls = slow_then_fast([1.0, 0.01])
+        hedges = []
+        start = time.perf_counter()
+        result, hedge_won = asyncio.run(hedged(call, 0.02, on_hedge=lambda: hedges.append(1)))
+        assert (result, hedge_won) == (1, True)
+        assert time.perf_counter() - start < 0.5
+        assert hedges == [1]
+
+    def test_fast_primary_not_hedged(self):
+        """No copy is sent when the primary answers within the delay."""
+        call, calls = slow_then_fast([0.0, 0.0])
+        assert asyncio.run(hedged(call, 0.1)) == (0, False)
+        assert calls == [0]
+
+    def test_failed_primary_waits_for_copy(self):
+        """After the copy is sent, a failing primary does not end the call."""
+        call, _ = slow_then_fast([0.03, 0.06], fail_first=True)
+        assert asyncio.run(hedged(call, 0.01)) == (1, True)
+
+    def test_early_failure_raised(self):
+        """A primary failing before the delay is raised without a copy."""
+        call, calls = slow_then_fast([0.0], fail_first=True)
+        with pytest.raises(ConnectionError):
+            asyncio.run(hedged(call, 0.1))
+        assert calls == [0]
+
+
+class TestHedgePolicy:
+    """Tests for the percentile-based hedge delay."""
+
+    def test_delay_follows_p95(self):
+        """The initial delay is used until enough samples exist."""
+        policy = HedgePolicy({"CHOOSE_PARITY_CALL"}, initial_delay=0.05, min_samples=20,
+                             min_delay=0.001, max_delay=1.0)
+        assert policy.applies("CHOOSE_PARITY_CALL") and not policy.applies("GAME_OVER")
+        for ms in range(1, 20):
+            policy.observe("CHOOSE_PARITY_CALL", ms / 1000)
+        assert policy.delay("CHOOSE_PARITY_CALL") == 0.05
+        for ms in range(20, 101):
+            policy.observe("CHOOSE_PARITY_CALL", ms / 1000)
+        assert policy.delay("CHOOSE_PARITY_CALL") == pytest.approx(0.095)
+
+    def test_delay_clamped(self):
+        """Percentiles outside [min_delay, max_delay] are clamped."""
+        policy = HedgePolicy({"X"}, min_samples=1, min_delay=0.01, max_delay=0.5)
+        policy.observe("X", 0.0001)
+        assert policy.delay("X") == 0.01
+        policy = HedgePolicy({"X"}, min_samples=1, min_delay=0.01, max_delay=0.5)
+        policy.observe("X", 9)
+        assert policy.delay("X") == 0.5
+
+
+@pytest.mark.usefixtures("tmp_logs")
+class TestDuplicates:
+    """Tests for hedged copies reaching the server."""
+
+    @pytest.fixture
+    def player(self):
+        """Player server whose parity handler is slow and counts calls."""
+        server = MCPServer("players", "HEDGE", port=8150)
+        server.calls = 0
+
+        async def choose(params: dict) -> dict:
+            server.calls += 1
+            await asyncio.sleep(0.05)
+            return {"parity_choice": "even", "call": server.calls}
+
+        server.register_handler("CHOOSE_PARITY_CALL", choose)
+        return server
+
+    def test_in_flight_copy_shares_response(self, player):
+        """Two requests with one id run the handler once."""
+        envelope = MCPClient("referee:REF01")._build_envelope("CHOOSE_PARITY_CALL")
+        request = {"jsonrpc": "2.0", "method": "CHOOSE_PARITY_CALL", "params": envelope, "id": "r1"}
+        before = metrics_registry.get("mcp_server_duplicate_requests_total") \
+            .labels("players:HEDGE", "CHOOSE_PARITY_CALL").value
+
+        async def both():
+            return await asyncio.gather(player.dispatch(request), player.dispatch(dict(request)))
+
+        first, second = asyncio.run(both())
+        assert first == second
+        assert first["result"]["call"] == 1
+        assert player.calls == 1
+        assert metrics_registry.get("mcp_server_duplicate_requests_total") \
+            .labels("players:HEDGE", "CHOOSE_PARITY_CALL").value - before == 1
+
+    def test_distinct_ids_not_merged(self, player):
+        """Different request ids are handled independently."""
+        client = MCPClient("referee:REF01")
+
+        async def both():
+            requests = [
+                {"jsonrpc": "2.0", "method": "CHOOSE_PARITY_CALL", "id": i,
+                 "params": client._build_envelope("CHOOSE_PARITY_CALL")}
+                for i in ("a", "b")
+            ]
+            return await asyncio.gather(*(player.dispatch(r) for r in requests))
+
+        asyncio.run(both())
+        assert player.calls == 2
+
+    def test_client_hedges_stalled_connection(self, player, monkeypatch):
+        """A stalled first attempt is overtaken by the hedge copy."""
+        monkeypatch.setattr(MCPClient, "_circuit_registry", CircuitBreakerRegistry())
+        ids = []
+
+        async def transport(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            ids.append(body["id"])
+            if len(ids) == 1:
+                await asyncio.sleep(1.0)  # Stalled connection
+            return httpx.Response(200, json=await player.dispatch(body))
+
+        hedge = HedgePolicy({"CHOOSE_PARITY_CALL"}, initial_delay=0.02)
+        client = MCPClient("referee:REF01", hedge=hedge)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        won = metrics_registry.get("mcp_client_hedges_total") \
+            .labels("referee:REF01", "CHOOSE_PARITY_CALL", "hedge")
+        before = won.value
+
+        start = time.perf_counter()
+        response = asyncio.run(client.send("http://p.test/mcp", "CHOOSE_PARITY_CALL", {}))
+        assert time.perf_counter() - start < 0.5
+        assert response["result"]["parity_choice"] == "even"
+        assert len(ids) == 2 and ids[0] == ids[1]
+        assert won.value - before == 1
@@ -0,0 +1,209 @@
+"""
+Tests for the idempotency cache replaying retried requests.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import (
+    CircuitBreakerRegistry,
+    MCPClient,
+    MCPServer,
+    ResponseCache,
+    generate_token,
+    metrics_registry,
+)
+
+
+class TestResponseCache:
+    """Tests for TTL and LRU eviction."""
+
+    def test_entries_expire(self):
+        """Responses are not replayed after the TTL."""
+        cache = ResponseCache(ttl_seconds=0.02)
+        cache.put("k", {"result": 1})
+        assert cache.get("k") == {"result": 1}
+        time.sleep(0.03)
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self):
+        """Over capacity, the entry unused the longest goes first."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", {"result": "a"})
+        cache.put("b", {"result": "b"})
+        cache.get("a")
+        cache.put("c", {"result": "c"})
+        assert cache.get("b") is None
+        assert cache.get("a") and cache.get("c")
+
+    def test_zero_size_disables(self):
+        """max_entries=0 stores nothing."""
+        cache = ResponseCache(max_entries=0)
+        cache.put("a", {"result": "a"})
+        assert cache.get("a") is None
+
+
+@pytest.mark.usefixtures("tmp_logs")
+class TestServerReplay:
+    """Tests for MCPServer answering repeated requests from the cache."""
+
+    @pytest.fixture
+    def manager(self):
+        """Manager whose result handler counts reports (and can fail once)."""
+        server = MCPServer("league_manager", "IDEMPOTENT", port=8000)
+        server.token = generate_token()
+        server.register_auth_token("REF01", server.token)
+        server.register_auth_token("REF02", server.token)
+        server.reports = []
+        server.fail_next = False
+
+        async def report(params: dict) -> dict:
+            if server.fail_next:
+                server.fail_next = False
+                raise RuntimeError("standings busy")
+            server.reports.append(params["match_id"])
+            return {"status": "RECORDED", "count": len(server.reports)}
+
+        server.register_handler("MATCH_RESULT_REPORT", report)
+        return server
+
+    def request(self, manager: MCPServer, request_id: str, sender: str = "referee:REF01") -> dict:
+        client = MCPClient(sender, auth_token=manager.token)
+        envelope = client._build_envelope("MATCH_RESULT_REPORT", match_id="R1M1")
+        return {"jsonrpc": "2.0", "method": "MATCH_RESULT_REPORT", "params": envelope, "id": request_id}
+
+    def replayed(self) -> float:
+        return metrics_registry.get("mcp_server_replayed_responses_total") \
+            .labels("league_manager:IDEMPOTENT", "MATCH_RESULT_REPORT").value
+
+    def test_repeat_replayed(self, manager):
+        """The same request id from the same sender is handled once."""
+        request = self.request(manager, "req-1")
+        before = self.replayed()
+
+        async def twice():
+            return await manager.dispatch(request), await manager.dispatch(dict(request))
+
+        first, second = asyncio.run(twice())
+        assert first == second
+        assert manager.reports == ["R1M1"]
+        assert self.replayed() - before == 1
+
+    def test_id_scoped_per_sender(self, manager):
+        """Two senders reusing one id are both handled."""
+        async def both():
+            await manager.dispatch(self.request(manager, "req-3"))
+            await manager.dispatch(self.request(manager, "req-3", sender="referee:REF02"))
+
+        asyncio.run(both())
+        assert manager.reports == ["R1M1", "R1M1"]
+
+    def test_id_scoped_per_method(self, manager):
+        """One sender reusing an id for another message type gets that message's answer."""
+        async def query(params: dict) -> dict:
+            return {"status": "ANSWERED"}
+
+        manager.register_handler("LEAGUE_QUERY", query)
+        client = MCPClient("referee:REF01", auth_token=manager.token)
+        other = {
+            "jsonrpc": "2.0", "method": "LEAGUE_QUERY", "id": "req-4",
+            "params": client._build_envelope("LEAGUE_QUERY", query_type="standings"),
+        }
+
+        async def both():
+            return await manager.dispatch(self.request(manager, "req-4")), await manager.dispatch(other)
+
+        report, answer = asyncio.run(both())
+        assert report["result"]["status"] == "RECORDED"
+        assert answer["result"] == {"status": "ANSWERED"}
+
+    def test_errors_not_cached(self, manager):
+        """A request that failed in the handler runs again when retried."""
+        request = self.request(manager, "req-2")
+        manager.fail_next = True
+
+        async def twice():
+            return await manager.dispatch(request), await manager.dispatch(request)
+
+        first, second = asyncio.run(twice())
+        assert first["error"]["code"] == -32603
+        assert second["result"]["status"] == "RECORDED"
+
+    def test_cancelled_first_copy(self, manager):
+        """Copies waiting on a cancelled request get an error, then run for real."""
+        started = asyncio.Event()
+
+        async def slow_report(params: dict) -> dict:
+            started.set()
+            await asyncio.sleep(10)
+
+        manager.register_handler("MATCH_RESULT_REPORT", slow_report)
+        request = self.request(manager, "req-4")
+
+        async def cancel_first():
+            first = asyncio.create_task(manager.dispatch(request))
+            await started.wait()
+            copy = asyncio.create_task(manager.dispatch(dict(request)))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await copy
+
+        response = asyncio.run(cancel_first())
+        assert response["error"]["code"] == -32603
+        assert manager._pending == {}
+
+    def test_replays_skip_rate_limit(self):
+        """Repeats of one request do not use up the sender's budget."""
+        server = MCPServer("league_manager", "LIMITED", port=8000, rate_limit=2)
+        handled = []
+
+        async def query(params: dict) -> dict:
+            handled.append(params["sender"])
+            return {"status": "OK"}
+
+        server.register_handler("LEAGUE_QUERY", query)
+        client = MCPClient("player:P01")
+        envelope = client._build_envelope("LEAGUE_QUERY")
+
+        async def send(request_id: str) -> dict:
+            return await server.dispatch(
+                {"jsonrpc": "2.0", "method": "LEAGUE_QUERY", "params": dict(envelope), "id": request_id}
+            )
+
+        async def run():
+            return [await send("q-1") for _ in range(5)] + [await send("q-2"), await send("q-3")]
+
+        responses = asyncio.run(run())
+        assert all("result" in r for r in responses[:6])
+        assert responses[6]["error"]["code"] == -32000
+        assert len(handled) == 2
+
+    def test_client_retry_after_lost_response(self, manager, monkeypatch):
+        """A retry after the first response was lost does not double-count."""
+        monkeypatch.setattr(MCPClient, "_circuit_registry", CircuitBreakerRegistry())
+        attempts = []
+
+        async def transport(request: httpx.Request) -> httpx.Response:
+            response = await manager.dispatch(json.loads(request.content))
+            attempts.append(response)
+            if len(attempts) == 1:
+                return httpx.Response(502)  # Handled, but the answer never arrived
+            return httpx.Response(200, json=response)
+
+        client = MCPClient("referee:REF01", auth_token=manager.token, backoff_seconds=0.001)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        response = asyncio.run(client.send("http://lm.test/mcp", "MATCH_RESULT_REPORT",
+                                           {"match_id": "R1M1"}))
+
+        assert len(attempts) == 2
+        assert manager.reports == ["R1M1"]
+        assert response["result"]["count"] == 1
@@ -0,0 +1,147 @@
+"""
+Full league over the in-process transport: real manager, referee and
+player agents in one process, no HTTP.
+"""
+
+import asyncio
+
+
+def test_full_league_without_http(agents, no_http, tmp_path):
+    """Registration, every match and result reporting stay in-process."""
+    manager_module = agents["league_manager"]
+    referee_module = agents["referee_template"]
+    player_module = agents["player_template"]
+
+    async def run():
+        manager = manager_module.LeagueManager()
+        manager.server.serve_in_process()
+        referee = referee_module.RefereeAgent("REF91", 9290)
+        referee.server.serve_in_process()
+        players = []
+        for n in range(1, 5):
+            player = player_module.PlayerAgent(f"P9{n}", 9190 + n, seed=n)
+            player.state._state_file = tmp_path / f"P9{n}_state.json"
+            player.server.serve_in_process()
+            players.append(player)
+
+        assert await referee.register_with_manager()
+        for player in players:
+            assert await player.register_with_manager()
+        await manager.start_league()
+
+        for _ in range(400):
+            if sum(s["played"] for s in manager.standings.get_standings()) == 12:
+                break
+            await asyncio.sleep(0.05)
+        return manager, players
+
+    manager, players = asyncio.run(run())
+
+    standings = manager.standings.get_standings()
+    assert [s["played"] for s in standings] == [3, 3, 3, 3]  # Round robin of 6 matches
+    assert sum(s["points"] for s in standings) in range(12, 19)
+    assert all(len(p.state.history) == 3 for p in players)
+    assert no_http == []
+
+
+def test_killed_referee_matches_still_reported(agents, no_http, tmp_path):
+    """A referee that dies after accepting matches gets them again on restart."""
+    manager_module = agents["league_manager"]
+    referee_module = agents["referee_template"]
+    player_module = agents["player_template"]
+
+    async def run():
+        manager = manager_module.LeagueManager()
+        manager.server.serve_in_process()
+        reports = []
+        record = manager.server._handlers["MATCH_RESULT_REPORT"]
+
+        async def counted(params: dict) -> dict:
+            reports.append(params["match_id"])
+            return await record(params)
+
+        manager.server.register_handler("MATCH_RESULT_REPORT", counted)
+
+        # Accepts its matches, then dies before playing them
+        killed = referee_module.RefereeAgent("REF91", 9290)
+        killed.server.serve_in_process()
+        accepted = []
+
+        async def accept_and_die(params: dict) -> dict:
+            accepted.append(params["match_id"])
+            return {"status": "ACCEPTED"}
+
+        killed.server.register_handler("START_MATCH", accept_and_die)
+        players = []
+        for n in range(1, 5):
+            player = player_module.PlayerAgent(f"P9{n}", 9190 + n, seed=n)
+            player.state._state_file = tmp_path / f"P9{n}_state.json"
+            player.server.serve_in_process()
+            players.append(player)
+
+        assert await killed.register_with_manager()
+        for player in players:
+            assert await player.register_with_manager()
+        await manager.start_league()
+        assert sorted(accepted) == ["R1M1", "R1M2"]
+
+        restarted = referee_module.RefereeAgent("REF91", 9290)
+        restarted.server.serve_in_process()
+        assert await restarted.register_with_manager()
+
+        for _ in range(400):
+            if len(reports) == 6:
+                break
+            await asyncio.sleep(0.05)
+        return manager, reports
+
+    manager, reports = asyncio.run(run())
+
+    assert sorted(reports[:2]) == ["R1M1", "R1M2"]
+    assert len(set(reports)) == len(reports) == 6
+    assert [s["played"] for s in manager.standings.get_standings()] == [3, 3, 3, 3]
+    assert no_http == []
+
+
+def test_start_match_endpoints_come_from_manager(agents, no_http, tmp_path):
+    """Player endpoints in START_MATCH are ignored in favour of the manager's."""
+    async def run():
+        manager = agents["league_manager"].LeagueManager()
+        manager.server.serve_in_process()
+        reports = []
+        record = manager.server._handlers["MATCH_RESULT_REPORT"]
+
+        async def counted(params: dict) -> dict:
+            reports.append(params["match_id"])
+            return await record(params)
+
+        manager.server.register_handler("MATCH_RESULT_REPORT", counted)
+        referee = agents["referee_template"].RefereeAgent("REF91", 9290)
+        referee.server.serve_in_process()
+        assert await referee.register_with_manager()  # Before the players: cache misses
+        players = []
+        for n in range(1, 3):
+            player = agents["player_template"].PlayerAgent(f"P9{n}", 9190 + n, seed=n)
+            player.state._state_file = tmp_path / f"P9{n}_state.json"
+            player.server.serve_in_process()
+            assert await player.register_with_manager()
+            players.append(player)
+
+        await referee.handlers.handle_match_assignment({
+            "match_id": "R1M1", "round_id": "ROUND_1", "player_a": "P91", "player_b": "P92",
+            "player_a_endpoint": "http://10.0.0.66:9191/mcp",
+            "player_b_endpoint": "http://10.0.0.66:9192/mcp",
+        })
+        for _ in range(100):
+            if reports:
+                break
+            await asyncio.sleep(0.05)
+        return referee, players, reports
+
+    referee, players, reports = asyncio.run(run())
+
+    assert reports == ["R1M1"]
+    assert [referee.server.directory.resolve(p.player_id) for p in players] == [
+        p.endpoint for p in players
+    ]
+    assert no_http == []
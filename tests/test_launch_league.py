@@ -0,0 +1,97 @@
+"""
+Tests for the league process supervisor.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from launch_league import AgentProcess, LeagueLauncher
+
+
+def _launcher(tmp_path, **kwargs) -> LeagueLauncher:
+    return LeagueLauncher(log_dir=tmp_path, **kwargs)
+
+
+class TestCommands:
+    """Agent command lines."""
+
+    def test_agents_in_start_order(self, tmp_path):
+        """Manager first, then referees, then players."""
+        launcher = _launcher(tmp_path, referees=2, players=3)
+        names = [a.name for a in launcher.agents]
+        assert names == ["MANAGER", "REF01", "REF02", "P01", "P02", "P03"]
+        assert [a.port for a in launcher.referees] == [8001, 8002]
+        assert [a.port for a in launcher.players] == [8101, 8102, 8103]
+
+    def test_manager_waits_for_every_player(self, tmp_path):
+        """The manager's minimum is the launched player count."""
+        launcher = _launcher(tmp_path, players=5, seed=7, start_delay=1)
+        cmd = launcher.manager.command
+        assert cmd[cmd.index("--min-players") + 1] == "5"
+        assert cmd[cmd.index("--start-delay") + 1] == "1"
+        assert cmd[cmd.index("--seed") + 1] == "7"
+
+    def test_strategies_and_seeds_per_player(self, tmp_path):
+        """Strategies cycle and each player gets its own seed."""
+        launcher = _launcher(tmp_path, players=3, strategies=["random", "adaptive"], seed=10)
+        commands = [p.command for p in launcher.players]
+        assert [c[c.index("--strategy") + 1] for c in commands] == ["random", "adaptive", "random"]
+        assert [c[c.index("--seed") + 1] for c in commands] == ["10", "11", "12"]
+
+
+class TestSupervision:
+    """Restart and shutdown with stand-in processes."""
+
+    def test_restarts_crashed_agent(self, tmp_path):
+        """A crashing agent is restarted up to max_restarts times."""
+        launcher = _launcher(tmp_path, referees=0, players=0, max_restarts=2)
+        launcher.manager = AgentProcess("MANAGER", [sys.executable, "-c", "raise SystemExit(3)"], 0)
+        launcher._spawn(launcher.manager)
+
+        asyncio.run(launcher.supervise(duration=10))
+        launcher.stop()
+
+        assert launcher.manager.restarts == 2
+        assert launcher.manager.process.returncode == 3
+
+    def test_manager_restart_restarts_dependents(self, tmp_path, monkeypatch):
+        """Referees and players are restarted to register with a new manager."""
+        launcher = _launcher(tmp_path, referees=1, players=1)
+        sleeper = [sys.executable, "-c", "import time; time.sleep(60)"]
+        launcher.manager = AgentProcess("MANAGER", [sys.executable, "-c", "raise SystemExit(3)"], 0)
+        launcher.referees = [AgentProcess("REF01", sleeper, 0)]
+        launcher.players = [AgentProcess("P01", sleeper, 0)]
+        for agent in launcher.agents:
+            launcher._spawn(agent)
+        first = [a.process for a in launcher.agents]
+        launcher.manager.command = sleeper  # Stays up once restarted
+
+        async def healthy(agents):
+            pass
+
+        monkeypatch.setattr(launcher, "_wait_healthy", healthy)
+        asyncio.run(launcher.supervise(duration=1.5))
+        try:
+            assert [a.restarts for a in launcher.agents] == [1, 0, 0]
+            assert all(a.running for a in launcher.agents)
+            assert all(a.process is not old for a, old in zip(launcher.agents, first))
+            assert first[1].poll() is not None and first[2].poll() is not None
+        finally:
+            launcher.stop(grace_seconds=2)
+
+    def test_stop_terminates_running_agents(self, tmp_path):
+        """stop() ends agents that are still running."""
+        launcher = _launcher(tmp_path, referees=0, players=0)
+        launcher.manager = AgentProcess(
+            "MANAGER", [sys.executable, "-c", "import time; time.sleep(60)"], 0
+        )
+        launcher._spawn(launcher.manager)
+        assert launcher.manager.running
+
+        launcher.stop(grace_seconds=2)
+
+        assert not launcher.manager.running
+        assert (tmp_path / "MANAGER.out").exists()
@@ -0,0 +1,111 @@
+"""
+Tests for the synthetic-player load generator.
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from league_sdk import MCPClient, MCPServer, generate_token, local_registry, percentile, summarize
+from load_generator import LoadGenerator, latency_sampler
+
+pytestmark = pytest.mark.usefixtures("tmp_logs")
+
+MANAGER = "http://127.0.0.1:8000/mcp"
+
+
+@pytest.fixture
+def generator():
+    """Two synthetic players reachable in-process, plus a stub manager."""
+    manager = MCPServer("league_manager", "MANAGER", port=8000)
+
+    async def register(params: dict) -> dict:
+        return {"status": "REGISTERED", "auth_token": generate_token()}
+
+    manager.register_handler("LEAGUE_REGISTER_REQUEST", register)
+    manager.serve_in_process()
+    gen = LoadGenerator(2, MANAGER, seed=1)
+    for player in gen.players.values():
+        player.server.serve_in_process()
+    yield gen
+    local_registry.clear()
+
+
+def referee_send(gen: LoadGenerator, player_id: str, message_type: str, payload: dict) -> dict:
+    """Send a referee message to a synthetic player."""
+    client = MCPClient("referee:REF01", max_retries=1)
+    return asyncio.run(client.send(gen.players[player_id].server.endpoint, message_type, payload))
+
+
+class TestStats:
+    """Tests for latency summaries."""
+
+    def test_nearest_rank_percentiles(self):
+        """Percentiles pick actual sample values."""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([], 50) == 0.0
+
+    def test_summarize(self):
+        """Summary reports count, mean and tail."""
+        s = summarize([3.0, 1.0, 2.0])
+        assert s["count"] == 3 and s["mean"] == 2.0 and s["max"] == 3.0 and s["p50"] == 2.0
+
+
+class TestLatencySampler:
+    """Tests for latency distribution specs."""
+
+    def test_specs(self):
+        """Specs are milliseconds; samplers return seconds."""
+        rng = random.Random(0)
+        assert latency_sampler("none", rng)() == 0.0
+        assert latency_sampler("fixed:20", rng)() == 0.02
+        assert 0.005 <= latency_sampler("uniform:5:10", rng)() <= 0.01
+        assert latency_sampler("exponential:10", rng)() >= 0
+
+    @pytest.mark.parametrize("spec", ["gauss:1", "fixed", "uniform:1", "fixed:x"])
+    def test_invalid_specs(self, spec):
+        """Malformed specs fail loudly."""
+        with pytest.raises(ValueError):
+            latency_sampler(spec, random.Random())
+
+
+class TestSyntheticPlayers:
+    """Tests for the synthetic player protocol."""
+
+    def test_register_and_play(self, generator):
+        """Players register, join with an early choice and finish the league."""
+        asyncio.run(generator._register_all())
+        assert len(generator.stats.registration_ms) == 2
+
+        for player_id, opponent in (("P0001", "P0002"), ("P0002", "P0001")):
+            ack = referee_send(generator, player_id, "GAME_INVITATION", {
+                "match_id": "R1M1", "opponent_id": opponent,
+                "ack_in_response": True, "parity_in_response": True,
+            })["result"]
+            assert ack["message_type"] == "GAME_JOIN_ACK"
+            assert ack["parity_choice"] in ("even", "odd")
+
+        for player_id in ("P0001", "P0002"):
+            referee_send(generator, player_id, "GAME_OVER", {"match_id": "R1M1", "result": "DRAW"})
+
+        report = generator.stats.report(2)
+        assert generator.done.is_set()
+        assert report["matches_completed"] == report["matches_invited"] == 1
+        assert report["match_ms"]["count"] == 2
+        assert report["referees"]["REF01"]["matches_completed"] == 1
+
+    def test_injected_errors(self, generator):
+        """A failure rate of 1 turns every response into an error."""
+        generator.error_rate = 1.0
+        response = referee_send(generator, "P0001", "CHOOSE_PARITY_CALL", {"match_id": "R1M1"})
+        assert response["error"]["code"] == -32603
+        assert generator.stats.report(2)["errors"]["injected_errors"] == 1
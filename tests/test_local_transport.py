@@ -0,0 +1,80 @@
+"""
+Unit tests for the in-process transport.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import MCPClient, MCPServer, generate_token, local_registry
+
+pytestmark = pytest.mark.usefixtures("tmp_logs")
+
+MANAGER = "http://127.0.0.1:8000/mcp"
+
+
+@pytest.fixture
+def manager():
+    """In-process manager that stores what it receives."""
+    server = MCPServer("league_manager", "MANAGER", port=8000, rate_limit=3)
+    server.received = []
+
+    async def handle(params: dict) -> dict:
+        server.received.append(params)
+        return {"status": "OK", "standings": server.received[-1:]}
+
+    server.register_handler("LEAGUE_QUERY", handle)
+    server.register_handler("MATCH_RESULT_REPORT", handle)
+    yield server.serve_in_process()
+    local_registry.clear()
+
+
+def send(client: MCPClient, message_type: str, payload: dict) -> dict:
+    """Send one message synchronously."""
+    return asyncio.run(client.send(MANAGER, message_type, payload))
+
+
+class TestLocalTransport:
+    """Tests for in-process delivery through MCPClient."""
+
+    def test_dispatches_without_network(self, manager):
+        """Registered endpoint is served by the local server."""
+        response = send(MCPClient("player:P01"), "LEAGUE_QUERY", {"query_type": "stats"})
+        assert response["result"]["status"] == "OK"
+        assert manager.received[0]["query_type"] == "stats"
+
+    def test_auth_enforced(self, manager):
+        """Protected messages still require a valid token."""
+        response = send(MCPClient("referee:REF01"), "MATCH_RESULT_REPORT", {})
+        assert response["error"]["code"] == -32001
+
+        token = generate_token()
+        manager.register_auth_token("REF01", token)
+        response = send(MCPClient("referee:REF01", token), "MATCH_RESULT_REPORT", {})
+        assert response["result"]["status"] == "OK"
+
+    def test_rate_limit_enforced(self, manager):
+        """Per-sender rate limit applies as over HTTP."""
+        client = MCPClient("player:P01")
+        codes = [
+            send(client, "LEAGUE_QUERY", {"query_type": "stats"}).get("error", {}).get("code")
+            for _ in range(4)
+        ]
+        assert codes == [None, None, None, -32000]
+
+    def test_messages_are_copied(self, manager):
+        """Handlers never share objects with the sender."""
+        payload = {"query_type": "stats", "agent_ids": ["P01"]}
+        response = send(MCPClient("player:P01"), "LEAGUE_QUERY", payload)
+        manager.received[0]["agent_ids"].append("P02")
+        assert payload["agent_ids"] == ["P01"]
+        assert response["result"]["standings"][0]["agent_ids"] == ["P01"]
+
+    def test_unregistered_falls_back_to_network(self, manager):
+        """Unregistering removes the endpoint from local delivery."""
+        local_registry.unregister(MANAGER)
+        assert MANAGER not in local_registry
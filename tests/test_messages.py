@@ -12,6 +12,8 @@ from league_sdk.schemas_base import MessageEnvelope, PlayerMeta
 from league_sdk.schemas import (
     LeagueRegisterRequest,
     LeagueRegisterResponse,
+    GameInvitation,
+    GameJoinAck,
     ChooseParityResponse,
     GameOver,
 )
@@ -121,3 +123,30 @@ class TestGameMessages:
         assert game_over.message_type == "GAME_OVER"
         assert game_over.result == "WIN"
         assert game_over.points_earned == 3
+
+    def test_invitation_fast_path_defaults_off(self):
+        """Invitations only opt into the fast path explicitly."""
+        invitation = GameInvitation(
+            sender="referee:REF01",
+            timestamp=utc_now(),
+            conversation_id=generate_uuid(),
+            match_id="R1M1",
+            round_id="ROUND_1",
+            opponent_id="P02",
+            role_in_match="PLAYER_A",
+            response_deadline=utc_now(),
+        )
+        assert invitation.ack_in_response is False
+        assert invitation.parity_in_response is False
+
+    def test_join_ack_with_early_choice(self):
+        """Inline join ack may carry the parity choice."""
+        ack = GameJoinAck(
+            sender="players:P01",
+            timestamp=utc_now(),
+            conversation_id=generate_uuid(),
+            match_id="R1M1",
+            parity_choice="odd",
+        )
+        assert ack.status == "ACCEPTED"
+        assert ack.parity_choice == "odd"
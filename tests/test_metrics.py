@@ -0,0 +1,169 @@
+"""
+Unit tests for the metrics registry and its SDK instrumentation.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import (
+    CircuitBreakerRegistry,
+    CircuitConfig,
+    MCPClient,
+    MCPServer,
+    MetricsRegistry,
+    asgi_client,
+    local_registry,
+    metrics_registry,
+)
+from league_sdk.circuit_breaker import CircuitBreakerOpen
+from league_sdk.metrics import Metric
+
+MANAGER = "http://127.0.0.1:8000/mcp"
+
+
+def value(name: str, *labels: str) -> float:
+    """Current value of one counter/gauge child in the global registry."""
+    return metrics_registry.get(name).labels(*labels).value
+
+
+class TestRegistry:
+    """Tests for metric families and text rendering."""
+
+    def test_counter_and_gauge_render(self):
+        """Samples carry escaped labels and HELP/TYPE headers."""
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs", ("kind",)).labels('a"b').inc(2)
+        registry.gauge("depth", "Depth").set(1.5)
+
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a\\"b"} 2' in text
+        assert "depth 1.5" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Each le bucket counts observations at or below it."""
+        registry = MetricsRegistry()
+        hist = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+        for v in (0.05, 0.1, 0.5, 5):
+            hist.observe(v)
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_count 4" in lines
+
+    def test_type_conflict_rejected(self):
+        """A name cannot be reused for another metric type."""
+        registry = MetricsRegistry()
+        registry.counter("x", "X")
+        with pytest.raises(ValueError):
+            registry.gauge("x", "X")
+
+    def test_metric_base_is_abstract(self):
+        """Only the concrete metric types can be created."""
+        with pytest.raises(TypeError):
+            Metric("z", "Z")
+
+    def test_wrong_label_count_rejected(self):
+        """labels() requires one value per declared label."""
+        counter = MetricsRegistry().counter("y_total", "Y", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.labels("only-one")
+
+
+@pytest.mark.usefixtures("tmp_logs")
+class TestInstrumentation:
+    """Tests for metrics recorded by server, client and circuit breakers."""
+
+    @pytest.fixture
+    def manager(self):
+        """In-process manager with a tiny rate limit."""
+        server = MCPServer("league_manager", "METRICS", port=8000, rate_limit=2)
+
+        async def handle(params: dict) -> dict:
+            return {"status": "OK"}
+
+        server.register_handler("LEAGUE_QUERY", handle)
+        server.register_handler("MATCH_RESULT_REPORT", handle)
+        yield server.serve_in_process()
+        local_registry.clear()
+
+    def test_server_statuses(self, manager):
+        """Requests are counted by method and outcome."""
+        agent = "league_manager:METRICS"
+        before = {
+            s: value("mcp_server_requests_total", agent, m, s)
+            for m, s in [("LEAGUE_QUERY", "ok"), ("MATCH_RESULT_REPORT", "auth_failed"),
+                         ("LEAGUE_QUERY", "rate_limited"), ("unknown", "unknown_method")]
+        }
+
+        async def run():
+            player = MCPClient("player:P01")
+            await player.send(MANAGER, "LEAGUE_QUERY", {})
+            await MCPClient("referee:REF01").send(MANAGER, "MATCH_RESULT_REPORT", {})
+            await MCPClient("player:P02").send(MANAGER, "NOT_A_MESSAGE", {})
+            await player.send(MANAGER, "LEAGUE_QUERY", {})
+            await player.send(MANAGER, "LEAGUE_QUERY", {})  # Third within the window
+
+        asyncio.run(run())
+        assert value("mcp_server_requests_total", agent, "LEAGUE_QUERY", "ok") - before["ok"] == 2
+        assert value("mcp_server_requests_total", agent, "MATCH_RESULT_REPORT", "auth_failed") \
+            - before["auth_failed"] == 1
+        assert value("mcp_server_requests_total", agent, "LEAGUE_QUERY", "rate_limited") \
+            - before["rate_limited"] == 1
+        assert value("mcp_server_requests_total", agent, "unknown", "unknown_method") \
+            - before["unknown_method"] == 1
+        assert value("mcp_server_requests_in_flight", agent) == 0
+
+    def test_metrics_endpoint(self, manager):
+        """GET /metrics serves the registry in Prometheus text format."""
+        async def scrape():
+            await MCPClient("player:P01").send(MANAGER, "LEAGUE_QUERY", {})
+            async with asgi_client(manager.app) as client:
+                return await client.get("/metrics")
+
+        response = asyncio.run(scrape())
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE mcp_server_request_duration_seconds histogram" in response.text
+        assert 'mcp_client_requests_total{sender="player:P01",method="LEAGUE_QUERY",outcome="ok"}' \
+            in response.text
+
+    def test_client_circuit_open_counted(self, monkeypatch):
+        """Sends refused by an open circuit are counted separately."""
+        registry = CircuitBreakerRegistry()
+        monkeypatch.setattr(MCPClient, "_circuit_registry", registry)
+        endpoint = "http://127.0.0.1:9/mcp"
+        registry.configure(endpoint, CircuitConfig(minimum_calls=1))
+        breaker = registry.get(endpoint)
+        breaker.record_failure()
+        before = value("mcp_client_requests_total", "player:P09", "LEAGUE_QUERY", "circuit_open")
+
+        with pytest.raises(CircuitBreakerOpen):
+            asyncio.run(MCPClient("player:P09").send(endpoint, "LEAGUE_QUERY", {}))
+
+        after = value("mcp_client_requests_total", "player:P09", "LEAGUE_QUERY", "circuit_open")
+        assert after - before == 1
+        assert value("circuit_breaker_state", endpoint) == 2
+
+    def test_circuit_state_gauge_follows_transitions(self):
+        """Named breakers export state and transition counts."""
+        endpoint = "http://breaker.test/mcp"
+        registry = CircuitBreakerRegistry(CircuitConfig(minimum_calls=1, timeout_seconds=0))
+        breaker = registry.get(endpoint)
+        opened = value("circuit_breaker_transitions_total", endpoint, "OPEN")
+
+        breaker.record_failure()
+        assert value("circuit_breaker_state", endpoint) == 2
+        assert breaker.can_execute()  # Timeout 0: straight to HALF_OPEN
+        assert value("circuit_breaker_state", endpoint) == 1
+        breaker.record_success()
+        breaker.record_success()
+        assert value("circuit_breaker_state", endpoint) == 0
+        assert value("circuit_breaker_transitions_total", endpoint, "OPEN") - opened == 1
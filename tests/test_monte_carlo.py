@@ -0,0 +1,55 @@
+"""
+Tests for the vectorized Monte Carlo simulator.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("numpy")
+
+from simulation.monte_carlo import DEFAULT_STRATEGIES, MonteCarloSimulator
+
+
+class TestMonteCarloSimulator:
+    """Tests for batch league simulation."""
+
+    def test_seed_reproducible(self):
+        """Same seed gives identical summaries."""
+        first = MonteCarloSimulator(DEFAULT_STRATEGIES, seed=3).simulate(5000)
+        second = MonteCarloSimulator(DEFAULT_STRATEGIES, seed=3).simulate(5000)
+        assert first == second
+
+    def test_distributions_are_consistent(self):
+        """Rank distributions sum to one and expected ranks to 1+..+n."""
+        summary = MonteCarloSimulator(DEFAULT_STRATEGIES, seed=1).simulate(20_000, 7_000)
+        for s in summary.values():
+            assert sum(s["rank_distribution"]) == pytest.approx(1.0)
+            assert s["win_probability"] == s["rank_distribution"][0]
+        assert sum(s["expected_rank"] for s in summary.values()) == pytest.approx(10.0)
+
+    def test_even_vs_odd_is_fair(self):
+        """Opposite fixed choices win half the time and always decide the match."""
+        summary = MonteCarloSimulator(
+            ["deterministic_even", "deterministic_odd"], seed=5
+        ).simulate(40_000)
+        assert summary["deterministic_even"]["win_probability"] == pytest.approx(0.5, abs=0.02)
+        assert summary["deterministic_even"]["mean_points"] + summary[
+            "deterministic_odd"
+        ]["mean_points"] == pytest.approx(3.0)
+
+    def test_same_choice_always_draws(self):
+        """Identical fixed choices draw; rank ties break by registration order."""
+        summary = MonteCarloSimulator(["deterministic_odd"] * 2, seed=0).simulate(1000)
+        s = summary["deterministic_odd"]
+        assert s["players"] == 2
+        assert s["mean_points"] == 1.0
+        assert s["rank_distribution"] == [0.5, 0.5]
+
+    def test_unknown_strategy_rejected(self):
+        """Typos in strategy names fail loudly."""
+        with pytest.raises(ValueError):
+            MonteCarloSimulator(["random", "randon"])
@@ -0,0 +1,132 @@
+"""
+Tests for the per-message-type sampling profiler.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import MCPClient, MCPServer, SamplingProfiler, asgi_client, local_registry
+from league_sdk.profiler import collapse_stack
+
+MANAGER = "http://127.0.0.1:8000/mcp"
+
+
+def spin(seconds: float) -> None:
+    """Busy-wait on the CPU (sleeping would not be sampled)."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.fixture
+def manager(tmp_logs, tmp_path):
+    """In-process manager with a CPU-heavy and a cheap handler."""
+    server = MCPServer("league_manager", "PROFILED", port=8000, enable_rate_limiting=False)
+    server.profiler.output_dir = tmp_path / "profiles"
+
+    async def slow_query(params: dict) -> dict:
+        spin(0.03)
+        return {"status": "OK"}
+
+    async def heartbeat(params: dict) -> dict:
+        spin(0.03)
+        return {"status": "OK"}
+
+    server.register_handler("LEAGUE_QUERY", slow_query)
+    server.register_handler("AGENT_HEARTBEAT", heartbeat)
+    yield server.serve_in_process()
+    local_registry.clear()
+
+
+class TestAdminEndpoint:
+    """Tests for toggling profiling at runtime over /admin/profile."""
+
+    def test_profile_one_message_type(self, manager):
+        """Only the requested type is sampled and written as collapsed stacks."""
+        async def session():
+            async with asgi_client(manager.app) as admin:
+                started = await admin.post(
+                    "/admin/profile", json={"message_type": "LEAGUE_QUERY", "interval_ms": 1}
+                )
+                client = MCPClient("player:P01")
+                for _ in range(4):
+                    await client.send(MANAGER, "LEAGUE_QUERY", {})
+                    await client.send(MANAGER, "AGENT_HEARTBEAT", {})
+                status = (await admin.get("/admin/profile")).json()
+                stopped = (await admin.delete("/admin/profile")).json()
+            return started.json(), status, stopped
+
+        started, status, stopped = asyncio.run(session())
+        assert started["active"] and started["message_type"] == "LEAGUE_QUERY"
+        assert status["requests"] == {"LEAGUE_QUERY": 4}
+        assert not stopped["active"]
+        assert list(stopped["files"]) == ["LEAGUE_QUERY"]
+
+        lines = Path(stopped["files"]["LEAGUE_QUERY"]).read_text().splitlines()
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert "slow_query (test_profiler.py:" in stack
+        assert all("heartbeat" not in line for line in lines)
+
+    def test_second_start_rejected(self, manager):
+        """Starting while a session runs is a conflict."""
+        async def session():
+            async with asgi_client(manager.app) as admin:
+                await admin.post("/admin/profile", json={})
+                second = await admin.post("/admin/profile", json={})
+                await admin.delete("/admin/profile")
+            return second
+
+        assert asyncio.run(session()).status_code == 409
+
+    def test_remote_clients_forbidden(self, manager):
+        """Admin endpoints only answer loopback clients."""
+        async def call():
+            transport = httpx.ASGITransport(app=manager.app, client=("10.1.2.3", 4000))
+            async with httpx.AsyncClient(transport=transport, base_url="http://asgi") as remote:
+                return await remote.post("/admin/profile", json={})
+
+        assert asyncio.run(call()).status_code == 403
+        assert not manager.profiler.active
+
+
+class TestSamplingProfiler:
+    """Tests for the profiler itself."""
+
+    def test_sample_rate_and_duration(self, tmp_path):
+        """A fractional rate skips requests; duration stops the session."""
+        profiler = SamplingProfiler("P", tmp_path)
+
+        async def run():
+            profiler.start(sample_rate=0.5, duration=0.05)
+            profiler._rng.seed(1)
+            picked = 0
+            for _ in range(200):
+                labelled = profiler.enter("GAME_OVER")
+                picked += labelled
+                profiler.exit(labelled)
+            await asyncio.sleep(0.1)
+            return picked
+
+        picked = asyncio.run(run())
+        assert 70 < picked < 130
+        assert not profiler.active
+
+    def test_collapse_stack_outermost_first(self):
+        """Frames are ordered root to leaf and named by function."""
+        def inner():
+            return collapse_stack(sys._getframe())
+
+        def outer():
+            return inner()
+
+        frames = outer().split(";")
+        assert frames[-1].startswith("inner (test_profiler.py:")
+        assert frames[-2].startswith("outer (test_profiler.py:")
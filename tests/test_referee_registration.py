@@ -0,0 +1,73 @@
+"""
+Referee registration with self-chosen IDs on a real League Manager.
+"""
+
+import asyncio
+
+
+def test_taken_referee_id_rejected(agents, no_http):
+    """A second process claiming a registered ID is refused; the first keeps it."""
+    manager = agents["league_manager"].LeagueManager()
+    manager.server.serve_in_process()
+    first = agents["referee_template"].RefereeAgent("REF05", 9505)
+    impostor = agents["referee_template"].RefereeAgent("REF05", 9506)
+    for referee in (first, impostor):
+        referee.server.serve_in_process()
+
+    async def register():
+        return await first.register_with_manager(), await impostor.register_with_manager()
+
+    assert asyncio.run(register()) == (True, False)
+    entry = manager.registered_referees["REF05"]
+    assert (entry["endpoint"], entry["auth_token"]) == (first.endpoint, first.auth_token)
+    assert manager.server.directory.resolve("REF05") == first.endpoint
+    assert not impostor.auth_token
+
+
+def test_restarted_referee_takes_its_id_back(agents, no_http):
+    """The same ID on the same endpoint re-registers and can report again."""
+    manager = agents["league_manager"].LeagueManager()
+    manager.server.serve_in_process()
+    reports = []
+    record = manager.server._handlers["MATCH_RESULT_REPORT"]
+
+    async def counted(params: dict) -> dict:
+        reports.append(params["match_id"])
+        return await record(params)
+
+    manager.server.register_handler("MATCH_RESULT_REPORT", counted)
+    result = {
+        "match_id": "R1M1", "round_id": "ROUND_1", "player_a_id": "P01", "player_b_id": "P02",
+        "winner_id": None, "player_a_result": "DRAW", "player_b_result": "DRAW",
+    }
+
+    async def crash_and_restart():
+        crashed = agents["referee_template"].RefereeAgent("REF05", 9505)
+        crashed.server.serve_in_process()
+        assert await crashed.register_with_manager()
+        restarted = agents["referee_template"].RefereeAgent("REF05", 9505)
+        restarted.server.serve_in_process()
+        assert await restarted.register_with_manager()
+        await restarted.handlers._report_result(result)
+        await crashed.handlers._report_result(dict(result, match_id="R1M2"))  # Stale token
+        return crashed, restarted
+
+    crashed, restarted = asyncio.run(crash_and_restart())
+    assert restarted.auth_token != crashed.auth_token
+    assert manager.registered_referees["REF05"]["auth_token"] == restarted.auth_token
+    assert reports == ["R1M1"]
+
+
+def test_sequential_ids_skip_chosen_ones(agents, no_http):
+    """Referees without a REF id get the next ID nobody has taken."""
+    manager = agents["league_manager"].LeagueManager()
+    handlers = manager.handlers
+
+    def register(sender: str, port: int) -> dict:
+        params = {"sender": sender, "referee_meta": {"contact_endpoint": f"http://127.0.0.1:{port}/mcp"}}
+        return asyncio.run(handlers.handle_referee_registration(params))
+
+    assert register("referee:REF01", 9601)["status"] == "REGISTERED"
+    assert register("anonymous", 9602)["referee_id"] == "REF02"
+    assert register("referee:REF03", 9603)["status"] == "REGISTERED"
+    assert register("anonymous", 9604)["referee_id"] == "REF04"
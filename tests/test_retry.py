@@ -0,0 +1,160 @@
+"""
+Tests for MCPClient retry policy: jittered backoff, deadlines and budgets.
+"""
+
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import (
+    CircuitBreakerRegistry,
+    DeadlineExceeded,
+    MCPClient,
+    RetryBudget,
+    RetryBudgetRegistry,
+    backoff_delay,
+    metrics_registry,
+)
+from league_sdk import mcp_client
+
+ENDPOINT = "http://retry.test/mcp"
+
+
+def abandoned(reason: str) -> float:
+    """Current count of abandoned retries for the test sender."""
+    return metrics_registry.get("mcp_client_retries_abandoned_total") \
+        .labels("referee:RETRY", "CHOOSE_PARITY_CALL", reason).value
+
+
+@pytest.fixture
+def flaky(monkeypatch):
+    """Client whose HTTP transport fails `failures` times, then answers."""
+    monkeypatch.setattr(MCPClient, "_circuit_registry", CircuitBreakerRegistry())
+    monkeypatch.setattr(MCPClient, "_retry_budgets", RetryBudgetRegistry())
+    monkeypatch.setattr(mcp_client, "backoff_delay", lambda attempt, base, cap: 0.01)
+
+    def make(failures: int, status: int = 503, **kwargs) -> tuple[MCPClient, list]:
+        calls = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            calls.append(time.time())
+            if len(calls) <= failures:
+                if status:
+                    return httpx.Response(status)
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"ok": True}, "id": 1})
+
+        client = MCPClient("referee:RETRY", **kwargs)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        return client, calls
+
+    return make
+
+
+class TestBackoff:
+    """Tests for the backoff and budget primitives."""
+
+    def test_full_jitter_range(self):
+        """Delays are spread over [0, min(cap, base * 2**n)]."""
+        rng = random.Random(7)
+        delays = [backoff_delay(3, 0.5, 8, rng) for _ in range(500)]
+        assert 0 <= min(delays) < 0.5
+        assert 3.5 < max(delays) <= 4.0
+        assert max(backoff_delay(10, 0.5, 8, rng) for _ in range(100)) <= 8
+
+    def test_budget_refills_over_time(self):
+        """A spent bucket allows retries again after refilling."""
+        budget = RetryBudget(capacity=2, refill_per_second=50)
+        assert budget.try_acquire() and budget.try_acquire()
+        assert not budget.try_acquire()
+        time.sleep(0.05)
+        assert budget.try_acquire()
+
+
+class TestBudgetRegistry:
+    """Tests for bounding the per-endpoint budgets."""
+
+    def test_least_recently_used_evicted(self):
+        """Past max_budgets the least recently used budget and its gauge go."""
+        registry = RetryBudgetRegistry(max_budgets=2)
+        first = registry.get("http://a.test/mcp")
+        registry.get("http://b.test/mcp").try_acquire()
+        first.try_acquire()  # a used after b
+        registry.get("http://c.test/mcp")
+        assert len(registry) == 2
+        gauge = metrics_registry.get("mcp_client_retry_budget_tokens")
+        assert ("http://b.test/mcp",) not in gauge._children
+        assert ("http://a.test/mcp",) in gauge._children
+
+    def test_idle_evicted_first(self):
+        """Every idle budget goes when the bound is reached."""
+        registry = RetryBudgetRegistry(max_budgets=3, idle_seconds=0.02)
+        for name in ("a", "b", "c"):
+            registry.get(f"http://{name}.test/mcp")
+        time.sleep(0.03)
+        budget = registry.get("http://d.test/mcp")
+        assert len(registry) == 1
+        assert registry.get("http://d.test/mcp") is budget
+
+
+class TestClientRetries:
+    """Tests for MCPClient.send retry behaviour over HTTP."""
+
+    def test_server_errors_retried_until_success(self, flaky):
+        """5xx responses are retried and the final response returned."""
+        client, calls = flaky(failures=2)
+        response = asyncio.run(client.send(ENDPOINT, "CHOOSE_PARITY_CALL", {}))
+        assert response["result"] == {"ok": True}
+        assert len(calls) == 3
+
+    def test_client_errors_not_retried(self, flaky):
+        """4xx responses fail immediately."""
+        client, calls = flaky(failures=5, status=400)
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(client.send(ENDPOINT, "CHOOSE_PARITY_CALL", {}))
+        assert len(calls) == 1
+
+    def test_expired_payload_deadline_skips_call(self, flaky):
+        """A deadline field already in the past fails without sending."""
+        client, calls = flaky(failures=0)
+        payload = {"deadline": "2020-01-01T00:00:00Z"}
+        with pytest.raises(DeadlineExceeded):
+            asyncio.run(client.send(ENDPOINT, "CHOOSE_PARITY_CALL", payload))
+        assert calls == []
+
+    def test_retry_abandoned_at_deadline(self, flaky, monkeypatch):
+        """A retry whose backoff would end past the deadline is not made."""
+        monkeypatch.setattr(mcp_client, "backoff_delay", lambda attempt, base, cap: 0.5)
+        client, calls = flaky(failures=5, status=0)
+        before = abandoned("deadline")
+
+        with pytest.raises(DeadlineExceeded) as raised:
+            asyncio.run(client.send(
+                ENDPOINT, "CHOOSE_PARITY_CALL", {}, deadline=time.time() + 0.2
+            ))
+        assert len(calls) == 1
+        assert isinstance(raised.value.__cause__, httpx.ConnectError)
+        assert abandoned("deadline") - before == 1
+
+    def test_retry_budget_shared_per_endpoint(self, flaky, monkeypatch):
+        """Once an endpoint's budget is spent, failures are not retried."""
+        monkeypatch.setattr(MCPClient, "_retry_budgets", RetryBudgetRegistry(1, 0))
+        before = abandoned("budget")
+
+        first, first_calls = flaky(failures=5)
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(first.send(ENDPOINT, "CHOOSE_PARITY_CALL", {}))
+        second, second_calls = flaky(failures=5)
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(second.send(ENDPOINT, "CHOOSE_PARITY_CALL", {}))
+
+        assert len(first_calls) == 2  # One retry, then the bucket is empty
+        assert len(second_calls) == 1
+        assert abandoned("budget") - before == 2
@@ -0,0 +1,60 @@
+"""
+Unit tests for deterministic random streams.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "player_template"))
+
+from league_sdk.game_rules import EvenOddGame
+from league_sdk.rng import DRAW_STREAM, derive_seed, rng_stream
+from strategies import get_strategy
+
+
+class TestRngStreams:
+    """Tests for seed derivation and stream independence."""
+
+    def test_derive_seed_is_stable(self):
+        """Derived seeds never change across processes or versions."""
+        assert derive_seed(42, "R1M1", "draw") == 18230106268531852886
+
+    def test_labels_separate_streams(self):
+        """Different labels give different streams; same labels replay."""
+        draws = lambda *labels: [rng_stream(7, *labels).random() for _ in range(3)]
+        assert draws("R1M1", "P01") == draws("R1M1", "P01")
+        assert draws("R1M1", "P01") != draws("R1M1", "P02")
+        assert draws("R1M1", "P01") != draws("R1M2", "P01")
+
+    def test_unseeded_stream(self):
+        """No seed gives a private, unseeded stream."""
+        assert rng_stream(None, "R1M1") is not rng_stream(None, "R1M1")
+
+    def test_match_draw_replays(self):
+        """A referee draw can be replayed from (league seed, match_id)."""
+        game = EvenOddGame()
+        first = [game.draw_number(rng_stream(99, f"R1M{i}", DRAW_STREAM)) for i in range(20)]
+        again = [game.draw_number(rng_stream(99, f"R1M{i}", DRAW_STREAM)) for i in range(20)]
+        assert first == again
+        assert len(set(first)) > 1
+
+
+class TestSeededStrategies:
+    """Tests for seeded player strategies."""
+
+    def test_random_strategy_replays_per_match(self):
+        """Seeded strategies choose the same for a match, whatever the order."""
+        forward = get_strategy("random", seed=5)
+        backward = get_strategy("random", seed=5)
+        matches = [f"R{i}M1" for i in range(30)]
+        picks = {m: forward.choose(m, "P02") for m in matches}
+        assert {m: backward.choose(m, "P02") for m in reversed(matches)} == picks
+        assert set(picks.values()) == {"even", "odd"}
+
+    def test_adaptive_fallback_is_seeded(self):
+        """Adaptive strategy's random fallback uses the seeded stream."""
+        a, b = get_strategy("adaptive", seed=1), get_strategy("adaptive", seed=1)
+        assert [a.choose(f"M{i}", "P02") for i in range(10)] == [
+            b.choose(f"M{i}", "P02") for i in range(10)
+        ]
@@ -0,0 +1,204 @@
+"""
+Tests for the league simulation engine.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "player_template"))
+
+from strategies import get_strategy
+from simulation import JsonlSink, LeagueSimulation, MatchLog, Player, RingBufferSink
+
+STRATEGIES = ["random", "deterministic_even", "alternating", "adaptive"]
+OUTCOME_KEYS = ["match_id", "choice_a", "choice_b", "drawn_number", "winner", "referee"]
+
+
+@pytest.fixture
+def two_cpus(monkeypatch):
+    """Let parallel leagues use the pool even on a single-CPU machine."""
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+
+def run(parallel: bool, seed: int = 42, players: int = 6, **kwargs) -> LeagueSimulation:
+    """Run a small league (parallel ones on the pool, however small)."""
+    kwargs.setdefault("min_parallel_matches", 1)
+    sim = LeagueSimulation(parallel=parallel, seed=seed, max_workers=2, **kwargs)
+    sim.register_referee("REF01")
+    sim.register_referee("REF02")
+    for i in range(players):
+        sim.register_player(f"P{i + 1:02d}", f"Bot{i}", STRATEGIES[i % len(STRATEGIES)])
+    sim.generate_schedule()
+    sim.run_league()
+    return sim
+
+
+def outcomes(sim: LeagueSimulation) -> list:
+    """Comparable view of the match results."""
+    return [[m[k] for k in OUTCOME_KEYS] for m in sim.match_results]
+
+
+class TestSimulationDeterminism:
+    """Tests for seeded, mode-independent results."""
+
+    def test_same_seed_replays(self, capsys):
+        """Two sequential runs with one seed are identical."""
+        assert outcomes(run(False)) == outcomes(run(False))
+
+    @pytest.mark.usefixtures("two_cpus")
+    def test_parallel_matches_sequential(self, capsys):
+        """Process pool produces the same league as sequential play."""
+        sequential, parallel = run(False), run(True)
+        assert outcomes(parallel) == outcomes(sequential)
+        assert parallel.get_standings() == sequential.get_standings()
+
+    def test_seed_changes_outcomes(self, capsys):
+        """Different seeds draw different numbers."""
+        draws = lambda sim: [m["drawn_number"] for m in sim.match_results]
+        assert draws(run(False, seed=1)) != draws(run(False, seed=2))
+
+
+class TestQuietMode:
+    """Tests for headless runs and event sinks."""
+
+    def test_quiet_prints_nothing(self, capsys):
+        """Quiet mode neither prints nor keeps an activity log."""
+        sim = run(False, quiet=True)
+        assert capsys.readouterr().out == ""
+        assert sim.activity_log == []
+        assert outcomes(sim) == outcomes(run(False))
+
+    def test_ring_buffer_is_bounded(self):
+        """Ring sink keeps only the latest events."""
+        sink = RingBufferSink(maxlen=5)
+        run(False, quiet=True, sink=sink)
+        events = sink.snapshot()
+        assert len(events) == 5
+        assert events[-1]["event"] == "LEAGUE_COMPLETED"
+
+    def test_jsonl_sink(self, tmp_path, capsys):
+        """JSONL sink receives the same events as the activity log."""
+        path = tmp_path / "events.jsonl"
+        with JsonlSink(path) as sink:
+            sim = run(False, sink=sink)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [e["event"] for e in lines] == [e["event"] for e in sim.activity_log]
+        assert sum(e["event"] == "MATCH_COMPLETED" for e in lines) == 15
+
+
+class TestSimulationStats:
+    """Tests for performance reporting."""
+
+    @pytest.mark.usefixtures("two_cpus")
+    def test_parallel_stats(self, capsys):
+        """Parallel runs report workers and speedup."""
+        stats = run(True).get_performance_stats()
+        assert stats["parallel_mode"] is True
+        assert stats["workers"] == 2
+        assert stats["total_matches"] == 15
+        assert stats["speedup_vs_sequential"] > 0
+
+    @pytest.mark.parametrize("cpus, min_matches, reason", [
+        (1, 1, "single CPU"),
+        (4, 64, "rounds under 64 matches"),
+    ])
+    def test_parallel_falls_back(self, monkeypatch, capsys, cpus, min_matches, reason):
+        """The pool is skipped where it cannot pay off, with the same results."""
+        monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+        sim = run(True, min_parallel_matches=min_matches)
+        stats = sim.get_performance_stats()
+        assert (stats["parallel_mode"], stats["workers"]) == (False, 1)
+        assert stats["parallel_skipped"] == reason
+        assert outcomes(sim) == outcomes(run(False))
+
+
+class TestSimulatedPlayer:
+    """Tests for the simulated player."""
+
+    def test_choice_does_not_mutate_state(self):
+        """Choosing is pure; recording the match advances alternation."""
+        player, opponent = Player("P01", "Alt", "alternating"), Player("P02", "Opp", "random", 1)
+        assert player.choose_parity(opponent, "M1") == player.choose_parity(opponent, "M1") == "even"
+        player.record_result("WIN", opponent, "odd")
+        assert player.choose_parity(opponent, "M2") == "odd"
+
+    def test_slotted(self):
+        """Players carry no per-instance __dict__."""
+        assert not hasattr(Player("P01", "Bot", "random"), "__dict__")
+
+    def test_matches_production_strategy(self):
+        """Simulated players choose exactly as the live player's strategy."""
+        player, opponent = Player("P01", "Ada", "adaptive", seed=9), Player("P02", "Opp", "random", 1)
+        live = get_strategy("adaptive", seed=9)
+        for i, choice in enumerate(["odd", "odd", "even", "even", "even"]):
+            match_id = f"R{i + 1}M1"
+            assert player.choose_parity(opponent, match_id) == live.choose(match_id, "P02")
+            player.record_result("DRAW", opponent, choice)
+            live.update({"opponent_id": "P02", "opponent_choice": choice, "result": "DRAW"})
+        assert player.choose_parity(opponent, "R9M1") == "even"
+
+    def test_adaptive_window(self):
+        """The compact per-opponent window forgets choices past the strategy's window."""
+        player = Player("P01", "Ada", "adaptive", seed=9)
+        live = get_strategy("adaptive", seed=9)
+        opponents = [Player(f"P0{i}", "Opp", "random", i) for i in (2, 7)]
+        choices = ["odd"] * 9 + ["even"] * 6 + ["odd", "even", "even", "odd", "odd", "odd"]
+        for i, choice in enumerate(choices):
+            for opponent in opponents:
+                match_id = f"R{i + 1}{opponent.player_id}"
+                assert player.choose_parity(opponent, match_id) == live.choose(match_id, opponent.player_id)
+                player.record_result("DRAW", opponent, choice)
+                live.update({"opponent_id": opponent.player_id, "opponent_choice": choice})
+        assert len(player._windows) == 8  # Two bytes per opponent index
+        assert player._strategy._opponent_history == {}
+
+    def test_choose_many(self):
+        """Batch choices equal one-at-a-time choices."""
+        for strategy in ["random", "deterministic_odd", "alternating", "adaptive"]:
+            player = Player("P01", "Bot", strategy, seed=3)
+            match_ids = ["M1", "M2", "M3"]
+            opponents = [Player(f"P0{i}", "Opp", "random", i) for i in (2, 3, 4)]
+            assert player.choose_many(opponents, match_ids) == [
+                player.choose_parity(o, m) for o, m in zip(opponents, match_ids)
+            ]
+
+
+class TestMatchLog:
+    """Tests for compact match records."""
+
+    def test_round_trip(self, capsys):
+        """Records expand back to what each MATCH_COMPLETED event reported."""
+        sim = run(False)
+        events = [e for e in sim.activity_log if e["event"] == "MATCH_COMPLETED"]
+        assert len(sim.match_results) == len(events) == 15
+        for match, event in zip(sim.match_results, events):
+            winner = match["winner"] or "DRAW"
+            assert event["message"] == (
+                f"{match['match_id']}: {match['player_a']} vs {match['player_b']} -> {winner}"
+            )
+            assert event["choices"] == f"{match['choice_a']}/{match['choice_b']}"
+            assert event["drawn_number"] == match["drawn_number"]
+
+    def test_record_fields(self):
+        """Choices, draw, winner and results survive packing."""
+        log = MatchLog(["P01", "P02"], ["REF01"])
+        log.append({"choice_a": "odd", "choice_b": "even", "drawn_number": 7},
+                   round_num=2, match_num=1, player_a=0, player_b=1, referee=0)
+        assert log[0] == {
+            "match_id": "R2M1", "player_a": "P01", "player_b": "P02",
+            "choice_a": "odd", "choice_b": "even", "drawn_number": 7,
+            "winner": "P01", "result_a": "WIN", "result_b": "LOSS",
+            "round_num": 2, "referee": "REF01",
+        }
+        assert log.nbytes() == 19
+
+    def test_memory_benchmark(self):
+        """Packed records use far less memory than result dicts."""
+        from simulation.memory_benchmark import run as measure
+        report = measure(players=40, matches=2000)
+        assert report["bytes_per_match"] * 10 < report["bytes_per_match_dict"]
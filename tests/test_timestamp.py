@@ -8,7 +8,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
 
-from league_sdk.helpers import validate_utc
+from league_sdk.helpers import parse_utc, validate_utc
 
 
 class TestUTCTimestampValidation:
@@ -37,3 +37,18 @@ class TestUTCTimestampValidation:
     def test_none_timestamp(self):
         """Reject None timestamp."""
         assert validate_utc(None) is False
+
+
+class TestParseUTC:
+    """Tests for converting UTC timestamps to epoch seconds."""
+
+    def test_both_utc_forms_parse_equal(self):
+        """Z suffix and +00:00 give the same instant."""
+        assert parse_utc("2025-01-15T10:30:00Z") == parse_utc("2025-01-15T10:30:00+00:00")
+        assert parse_utc("1970-01-01T00:01:00Z") == 60.0
+
+    def test_invalid_returns_none(self):
+        """Non-UTC, malformed and missing values are not deadlines."""
+        assert parse_utc("2025-01-15T10:30:00+02:00") is None
+        assert parse_utc("soon") is None
+        assert parse_utc(None) is None
@@ -0,0 +1,57 @@
+"""
+Tests for the strategy tournament runner.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from simulation.tournament import parse_lineup, run_tournament
+
+LINEUP = ["random", "random", "adaptive", "alternating"]
+
+
+class TestLineup:
+    """Tests for strategy spec parsing."""
+
+    def test_counts_expand(self):
+        """name:count repeats a strategy; bare names count once."""
+        assert parse_lineup(["random:2", "adaptive"]) == ["random", "random", "adaptive"]
+
+    @pytest.mark.parametrize("specs", [["nope", "random"], ["random:0", "adaptive"], ["random"]])
+    def test_invalid_specs(self, specs):
+        """Unknown strategies, bad counts and single players are rejected."""
+        with pytest.raises(ValueError):
+            parse_lineup(specs)
+
+
+class TestTournament:
+    """Tests for sharded tournament runs."""
+
+    def test_sharding_does_not_change_results(self):
+        """Worker count and shard size never change the aggregate."""
+        inline = run_tournament(LINEUP, 60, seed=4, workers=1, shard_size=60).summary()
+        pooled = run_tournament(LINEUP, 60, seed=4, workers=2, shard_size=7).summary()
+        assert pooled == inline
+
+    def test_summary_is_consistent(self):
+        """Rank distributions sum to one and CIs bracket the means."""
+        stats = run_tournament(LINEUP, 200, seed=1)
+        assert stats.leagues == 200 and stats.seed == 1
+        summary = stats.summary()
+        assert summary["random"]["players"] == 2
+        for s in summary.values():
+            assert sum(s["rank_distribution"]) == pytest.approx(1.0)
+            assert s["win_probability"] == pytest.approx(s["rank_distribution"][0])
+            assert s["points_ci"][0] <= s["mean_points"] <= s["points_ci"][1]
+            assert s["win_ci"][0] <= s["win_probability"] <= s["win_ci"][1]
+
+    def test_even_vs_odd_is_fair(self):
+        """Fixed opposite choices split the wins evenly."""
+        summary = run_tournament(["deterministic_even", "deterministic_odd"], 2000, seed=2).summary()
+        assert summary["deterministic_even"]["win_probability"] == pytest.approx(0.5, abs=0.05)
+        assert summary["deterministic_even"]["mean_points"] + summary[
+            "deterministic_odd"]["mean_points"] == pytest.approx(3.0)
@@ -0,0 +1,137 @@
+"""
+Tests for trace propagation and the trace report tool.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from league_sdk import JsonLogger, MCPClient, MCPServer, Span, local_registry
+from league_sdk.tracing import current_context, extract, inject
+from trace_report import group_traces, load_spans, render_waterfall, span_stats
+
+MANAGER = "http://127.0.0.1:8000/mcp"
+
+
+class TestSpans:
+    """Tests for span nesting and envelope propagation helpers."""
+
+    def test_nested_spans_share_trace(self, tmp_path):
+        """A child span records its parent's id and the same trace id."""
+        logger = JsonLogger("test", "T", str(tmp_path))
+        with Span(logger, "outer") as outer:
+            with Span(logger, "inner", match_id="R1M1") as inner:
+                assert current_context() == inner.context
+            assert current_context() == outer.context
+        assert current_context() is None
+
+        spans = {s["span"]: s for s in load_spans([tmp_path])}
+        assert spans["inner"]["trace_id"] == spans["outer"]["trace_id"]
+        assert spans["inner"]["parent_span_id"] == spans["outer"]["span_id"]
+        assert spans["outer"]["parent_span_id"] is None
+        assert spans["inner"]["match_id"] == "R1M1"
+
+    def test_root_span_starts_new_trace(self, tmp_path):
+        """root=True ignores the active span."""
+        logger = JsonLogger("test", "T", str(tmp_path))
+        with Span(logger, "outer") as outer:
+            with Span(logger, "next", root=True) as root:
+                assert root.context.trace_id != outer.context.trace_id
+
+    def test_error_recorded(self, tmp_path):
+        """An exception leaving the span is recorded on it."""
+        logger = JsonLogger("test", "T", str(tmp_path))
+        with pytest.raises(KeyError):
+            with Span(logger, "failing"):
+                raise KeyError("x")
+        assert load_spans([tmp_path])[0]["error"] == "KeyError"
+
+    def test_inject_extract_roundtrip(self, tmp_path):
+        """The active context survives an envelope round trip."""
+        envelope = {}
+        inject(envelope)
+        assert envelope == {}  # Nothing active
+
+        with Span(JsonLogger("test", "T", str(tmp_path)), "send") as span:
+            inject(envelope)
+        assert extract(envelope) == span.context
+        assert extract({"trace_id": 5}) is None
+
+
+@pytest.mark.usefixtures("tmp_logs")
+class TestPropagation:
+    """Tests for trace context crossing MCPClient -> MCPServer."""
+
+    def test_handler_continues_trace(self, tmp_path):
+        """The handler runs inside a handle:<method> span of the caller's trace."""
+        seen = []
+        server = MCPServer("league_manager", "TRACE", port=8000)
+
+        async def handle(params: dict) -> dict:
+            seen.append(current_context())
+            return {"status": "OK"}
+
+        server.register_handler("LEAGUE_QUERY", handle)
+        server.serve_in_process()
+        logger = JsonLogger("player", "P01", str(tmp_path))
+
+        async def run():
+            with Span(logger, "query") as span:
+                await MCPClient("player:P01").send(MANAGER, "LEAGUE_QUERY", {"match_id": "R1M1"})
+            await MCPClient("player:P01").send(MANAGER, "LEAGUE_QUERY", {})
+            return span.context
+
+        try:
+            caller = asyncio.run(run())
+        finally:
+            local_registry.clear()
+
+        assert seen[0].trace_id == caller.trace_id
+        assert seen[1] is None  # Untraced request: no span, no context
+
+        (trace,) = group_traces(load_spans([tmp_path]))
+        names = [(depth, span["span"]) for depth, span in trace.tree()]
+        assert names == [(0, "query"), (1, "handle:LEAGUE_QUERY")]
+        assert trace.match_id == "R1M1"
+
+
+class TestReport:
+    """Tests for assembling spans into waterfalls and percentiles."""
+
+    SPANS = [
+        {"trace_id": "t1", "span_id": "a", "parent_span_id": None, "span": "start_match",
+         "start": 100.0, "duration_ms": 40.0, "agent_id": "LM", "match_id": "R1M1"},
+        {"trace_id": "t1", "span_id": "c", "parent_span_id": "b", "span": "join_wait",
+         "start": 100.02, "duration_ms": 10.0, "agent_id": "REF01"},
+        {"trace_id": "t1", "span_id": "b", "parent_span_id": "a", "span": "match",
+         "start": 100.01, "duration_ms": 30.0, "agent_id": "REF01"},
+        {"trace_id": "t1", "span_id": "d", "parent_span_id": "lost", "span": "handle:GAME_OVER",
+         "start": 100.035, "duration_ms": 1.0, "agent_id": "P01"},
+        {"trace_id": "t2", "span_id": "e", "parent_span_id": None, "span": "join_wait",
+         "start": 200.0, "duration_ms": 20.0, "agent_id": "REF02", "match_id": "R1M2"},
+    ]
+
+    def test_tree_orders_by_parent_then_start(self):
+        """Children follow their parent; orphans are shown as roots."""
+        first, second = group_traces(self.SPANS)
+        assert [s["span"] for _, s in first.tree()] == [
+            "start_match", "match", "join_wait", "handle:GAME_OVER",
+        ]
+        assert [d for d, _ in first.tree()] == [0, 1, 2, 0]
+        assert first.duration_ms == pytest.approx(40.0)
+        assert second.match_id == "R1M2"
+
+    def test_waterfall_and_stats(self):
+        """Waterfall lists every span; stats aggregate by span name."""
+        text = render_waterfall(group_traces(self.SPANS)[0])
+        assert text.startswith("Match R1M1")
+        assert "    join_wait" in text
+
+        stats = span_stats(self.SPANS)
+        assert stats["join_wait"]["count"] == 2
+        assert stats["join_wait"]["max"] == 20.0
@@ -0,0 +1,100 @@
+"""
+Tests for the event-loop lag watchdog.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import JsonLogger, LoopWatchdog, MCPClient, MCPServer, local_registry, metrics_registry
+
+MANAGER = "http://127.0.0.1:8000/mcp"
+
+
+def lag_records(log_file: Path) -> list[dict]:
+    """LOOP_LAG records written to a log file."""
+    if not log_file.exists():
+        return []
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    return [r for r in records if r["event_type"] == "LOOP_LAG"]
+
+
+async def watched(watchdog: LoopWatchdog, body) -> None:
+    """Run `body` with the watchdog active, then let it report."""
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.02)
+        await body()
+        await asyncio.sleep(0.05)
+    finally:
+        await watchdog.stop()
+
+
+@pytest.mark.usefixtures("tmp_logs")
+class TestServerWatchdog:
+    """Tests for stalls caused by blocking handlers."""
+
+    def test_blocking_handler_reported(self, tmp_path):
+        """The stall names the handler and samples the blocking frame."""
+        server = MCPServer("league_manager", "WATCHED", port=8000)
+
+        async def blocking_query(params: dict) -> dict:
+            time.sleep(0.2)  # Synchronous work on the event loop
+            return {"status": "OK"}
+
+        server.register_handler("LEAGUE_QUERY", blocking_query)
+        server.serve_in_process()
+        watchdog = server.enable_watchdog(threshold_ms=50, interval_ms=5)
+        assert server.enable_watchdog() is watchdog
+
+        async def query():
+            await MCPClient("player:P01").send(MANAGER, "LEAGUE_QUERY", {})
+
+        try:
+            asyncio.run(watched(watchdog, query))
+        finally:
+            local_registry.clear()
+
+        (record,) = lag_records(tmp_path / "WATCHED.log.jsonl")
+        assert record["task"] == "LEAGUE_QUERY"
+        assert record["lag_ms"] >= 100
+        assert record["samples"][0]["stack"][-1].endswith("in blocking_query")
+        stalls = metrics_registry.get("event_loop_stalls_total")
+        assert stalls.labels("league_manager:WATCHED", "LEAGUE_QUERY").value >= 1
+
+
+class TestLoopWatchdog:
+    """Tests for the watchdog outside a server."""
+
+    def test_unlabelled_task_named_by_coroutine(self, tmp_path):
+        """Tasks not started by a request are labelled by coroutine name."""
+        watchdog = LoopWatchdog(JsonLogger("test", "W", str(tmp_path)), "test:W", 50, 5)
+
+        async def busy_task():
+            time.sleep(0.15)
+
+        async def body():
+            await asyncio.create_task(busy_task())
+
+        asyncio.run(watched(watchdog, body))
+        (record,) = lag_records(tmp_path / "W.log.jsonl")
+        assert record["task"].endswith("busy_task")
+
+    def test_quiet_loop_not_reported(self, tmp_path):
+        """Lag under the threshold is measured but not logged."""
+        watchdog = LoopWatchdog(JsonLogger("test", "Q", str(tmp_path)), "test:Q", 100, 5)
+        lag = metrics_registry.get("event_loop_lag_seconds").labels("test:Q")
+
+        async def body():
+            await asyncio.sleep(0.05)
+
+        asyncio.run(watched(watchdog, body))
+        assert lag_records(tmp_path / "Q.log.jsonl") == []
+        assert lag.count > 0
+        assert not watchdog.running
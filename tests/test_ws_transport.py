@@ -0,0 +1,221 @@
+"""
+Unit tests for the WebSocket peer transport.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import (
+    CircuitBreakerRegistry,
+    MCPClient,
+    MCPServer,
+    generate_token,
+    generate_uuid,
+    utc_now,
+)
+from league_sdk.ws_transport import PEER_TOKEN_HEADER, WebSocketPeer, websocket_url
+
+pytestmark = pytest.mark.usefixtures("tmp_logs")
+
+
+def envelope(message_type: str) -> dict:
+    """Minimal valid envelope."""
+    return {
+        "protocol": "league.v2",
+        "message_type": message_type,
+        "sender": "player:P01",
+        "timestamp": utc_now(),
+        "conversation_id": generate_uuid(),
+    }
+
+
+def make_server(agent_id: str, port: int) -> MCPServer:
+    """Server whose ECHO handler reports who answered."""
+    server = MCPServer("referee", agent_id, port=port)
+
+    async def echo(params: dict) -> dict:
+        await asyncio.sleep(0.01)
+        return {"answered_by": agent_id, "n": params.get("n")}
+
+    server.register_handler("ECHO", echo)
+    return server
+
+
+def peer_pair(server_a: MCPServer, server_b: MCPServer):
+    """Two peers joined by in-memory queues."""
+    a_to_b, b_to_a = asyncio.Queue(), asyncio.Queue()
+    peer_a = WebSocketPeer(a_to_b.put, b_to_a.get, server_a.dispatch)
+    peer_b = WebSocketPeer(b_to_a.put, a_to_b.get, server_b.dispatch)
+    return peer_a, peer_b
+
+
+class TestWebSocketPeer:
+    """Tests for request correlation over one connection."""
+
+    def test_concurrent_requests_in_both_directions(self):
+        """Interleaved requests each get their own response."""
+        server_a, server_b = make_server("A", 9001), make_server("B", 9002)
+
+        async def run():
+            peer_a, peer_b = peer_pair(server_a, server_b)
+            tasks = [asyncio.create_task(p.run()) for p in (peer_a, peer_b)]
+            calls = [
+                peer.request({
+                    "jsonrpc": "2.0", "method": "ECHO", "id": f"{i}",
+                    "params": {**envelope("ECHO"), "n": i},
+                })
+                for i, peer in enumerate([peer_a, peer_b] * 5)
+            ]
+            responses = await asyncio.gather(*calls)
+            for task in tasks:
+                task.cancel()
+            return responses
+
+        responses = asyncio.run(run())
+        for i, response in enumerate(responses):
+            assert response["id"] == f"{i}"
+            assert response["result"]["n"] == i
+            assert response["result"]["answered_by"] == ("B" if i % 2 == 0 else "A")
+
+    def test_close_fails_pending_requests(self):
+        """In-flight requests raise ConnectionError when the peer closes."""
+        server = make_server("A", 9001)
+
+        async def run():
+            outbox, inbox = asyncio.Queue(), asyncio.Queue()
+            peer = WebSocketPeer(outbox.put, inbox.get, server.dispatch)
+            pending = asyncio.create_task(peer.request({"jsonrpc": "2.0", "id": "1"}))
+            await asyncio.sleep(0)
+            await peer.close()
+            with pytest.raises(ConnectionError):
+                await pending
+            assert peer.closed
+
+        asyncio.run(run())
+
+    def test_client_routes_through_peer(self):
+        """MCPClient uses a registered peer instead of HTTP."""
+        server_a, server_b = make_server("A", 9001), make_server("B", 9002)
+
+        async def run():
+            peer_a, peer_b = peer_pair(server_a, server_b)
+            tasks = [asyncio.create_task(p.run()) for p in (peer_a, peer_b)]
+            client = MCPClient("player:P01", peers={server_b.endpoint: peer_a})
+            response = await client.send(server_b.endpoint, "ECHO", {"n": 7})
+            for task in tasks:
+                task.cancel()
+            return response
+
+        assert asyncio.run(run())["result"] == {"answered_by": "B", "n": 7}
+
+    def test_send_failure_falls_back_to_http(self, monkeypatch):
+        """A peer whose socket fails mid-send is dropped for HTTP."""
+        monkeypatch.setattr(MCPClient, "_circuit_registry", CircuitBreakerRegistry())
+        endpoint = "http://127.0.0.1:9002/mcp"
+        posted = []
+
+        async def broken_send(text: str) -> None:
+            raise RuntimeError("Cannot call send once a close message has been sent")
+
+        def transport(request: httpx.Request) -> httpx.Response:
+            posted.append(request.url)
+            return httpx.Response(200, json={"jsonrpc": "2.0", "result": {"via": "http"}, "id": 1})
+
+        async def run():
+            peer = WebSocketPeer(broken_send, asyncio.Queue().get, make_server("A", 9001).dispatch)
+            client = MCPClient("player:P01", peers={endpoint: peer})
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+            return peer, await client.send(endpoint, "ECHO", {})
+
+        peer, response = asyncio.run(run())
+        assert response["result"] == {"via": "http"}
+        assert len(posted) == 1
+        assert peer.closed
+
+    def test_websocket_url(self):
+        """HTTP /mcp endpoints map to ws /ws URLs."""
+        url = websocket_url("http://127.0.0.1:8001/mcp", "http://127.0.0.1:8101/mcp")
+        assert url.startswith("ws://127.0.0.1:8001/ws?endpoint=http%3A%2F%2F")
+
+
+class TestWebSocketRoute:
+    """Tests for the server's /ws endpoint."""
+
+    def test_dispatch_and_peer_registration(self):
+        """Requests over /ws are dispatched and the peer is registered."""
+        server = make_server("A", 9001)
+        client = TestClient(server.app)
+        caller = "http://127.0.0.1:8101/mcp"
+
+        token = server.grant_peer(caller)
+
+        with client.websocket_connect(
+            websocket_url(server.endpoint, caller), headers={PEER_TOKEN_HEADER: token}
+        ) as ws:
+            ws.send_json({
+                "jsonrpc": "2.0", "method": "ECHO", "id": "x",
+                "params": {**envelope("ECHO"), "n": 3},
+            })
+            response = ws.receive_json()
+            assert caller in server.peers
+
+        assert response == {"jsonrpc": "2.0", "result": {"answered_by": "A", "n": 3}, "id": "x"}
+
+    def test_invalid_envelope_rejected(self):
+        """WebSocket requests get the same validation as HTTP ones."""
+        server = make_server("A", 9001)
+        with TestClient(server.app).websocket_connect("/ws") as ws:
+            ws.send_json({"jsonrpc": "2.0", "method": "ECHO", "id": "y", "params": {}})
+            assert ws.receive_json()["error"]["code"] == -32602
+
+    def test_unproven_caller_not_routed(self):
+        """Without a valid token the socket serves requests but gets no traffic."""
+        server = make_server("A", 9001)
+        victim = "http://127.0.0.1:8101/mcp"
+        server.grant_peer(victim)  # Issued to the real owner, not this caller
+        url = websocket_url(server.endpoint, victim)
+
+        with TestClient(server.app).websocket_connect(url, headers={PEER_TOKEN_HEADER: "x" * 32}) as ws:
+            ws.send_json({"jsonrpc": "2.0", "method": "ECHO", "id": "z",
+                          "params": {**envelope("ECHO"), "n": 1}})
+            assert ws.receive_json()["result"]["n"] == 1
+            assert victim not in server.peers
+
+    def test_auth_token_proves_registered_endpoint(self):
+        """An auth token binds the socket only to its owner's registered endpoint."""
+        server = make_server("A", 9001)
+        token = generate_token()
+        server.register_auth_token("player:P01", token)
+        server.directory.register("P01", "http://127.0.0.1:8101/mcp", pinned=True)
+        client = TestClient(server.app)
+        headers = {PEER_TOKEN_HEADER: token}
+
+        with client.websocket_connect(
+            websocket_url(server.endpoint, "http://127.0.0.1:8000/mcp"), headers=headers
+        ):
+            assert not server.peers  # Not P01's endpoint
+        with client.websocket_connect(
+            websocket_url(server.endpoint, "http://127.0.0.1:8101/mcp"), headers=headers
+        ):
+            assert "http://127.0.0.1:8101/mcp" in server.peers
+
+    def test_live_peer_not_replaced(self):
+        """A second socket claiming a connected endpoint does not take it over."""
+        server = make_server("A", 9001)
+        caller = "http://127.0.0.1:8101/mcp"
+        client = TestClient(server.app)
+        url = websocket_url(server.endpoint, caller)
+
+        with client.websocket_connect(url, headers={PEER_TOKEN_HEADER: server.grant_peer(caller)}):
+            live = server.peers[caller]
+            with client.websocket_connect(
+                url, headers={PEER_TOKEN_HEADER: server.grant_peer(caller)}
+            ):
+                assert server.peers[caller] is live
@@ -0,0 +1,435 @@
+"""
+Benchmark suite for the SDK hot paths, with regression baselines.
+
+Each benchmark is calibrated so one timed sample runs long enough to be
+measured reliably (doubling the inner loop count, as timeit.autorange
+does), then timed over many samples with the garbage collector paused.
+Results are per-operation p50/p95/p99 latencies. Memory is measured in
+a separate tracemalloc pass (--memory) so tracing never distorts the
+timings.
+
+Baselines are plain JSON. --compare fails (exit code 1) when a
+benchmark's median is more than --threshold slower than the baseline.
+
+--concurrency / --rate instead load MCPServer.app through an in-memory
+ASGI transport and report throughput, latency histogram and event-loop
+lag (league_sdk.benchmark_concurrent).
+
+Usage: python tools/benchmark_suite.py --save baseline.json
+       python tools/benchmark_suite.py --compare baseline.json --threshold 0.25
+       python tools/benchmark_suite.py --concurrency 50 --requests 5000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "SHARED"))
+sys.path.insert(0, str(ROOT / "agents" / "league_manager"))
+
+from league_sdk import (
+    ConcurrencyResult,
+    JsonLogger,
+    MCPClient,
+    MCPServer,
+    RateLimiter,
+    StandingsRepository,
+    asgi_client,
+    benchmark_concurrent,
+    generate_uuid,
+    local_registry,
+    print_concurrency_result,
+    summarize,
+    utc_now,
+)
+from scheduler import Scheduler
+from standings import StandingsManager
+
+# A benchmark setup receives a scratch directory and returns op(n), which
+# performs n operations of the measured kind.
+Setup = Callable[[Path], Callable[[int], None]]
+
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark setup under `name`."""
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@dataclass
+class BenchResult:
+    """Per-operation timing (and optionally memory) of one benchmark."""
+
+    name: str
+    loops: int
+    samples: int
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    peak_kib: Optional[float] = None
+
+
+# --- Hot paths --------------------------------------------------------------
+
+def _envelope(message_type: str = "GAME_OVER") -> dict:
+    return {
+        "protocol": "league.v2",
+        "message_type": message_type,
+        "sender": "referee:REF01",
+        "timestamp": utc_now(),
+        "conversation_id": "bench",
+    }
+
+
+@benchmark("envelope_validation")
+def _envelope_validation(scratch: Path) -> Callable[[int], None]:
+    server = MCPServer("player", "BENCH", enable_rate_limiting=False, log_dir=str(scratch))
+    validate = server._validate_envelope
+    params = _envelope()
+
+    def op(n: int) -> None:
+        for _ in range(n):
+            validate(params)
+    return op
+
+
+@benchmark("rate_limiter")
+def _rate_limiter(scratch: Path) -> Callable[[int], None]:
+    limiter = RateLimiter()
+    senders = [f"player:P{i:02d}" for i in range(16)]
+
+    def op(n: int) -> None:
+        for i in range(n):
+            limiter.is_allowed(senders[i & 15])
+    return op
+
+
+@benchmark("logger_write")
+def _logger_write(scratch: Path) -> Callable[[int], None]:
+    logger = JsonLogger("referee", "BENCH", log_dir=str(scratch))
+
+    def op(n: int) -> None:
+        for _ in range(n):
+            logger.message_received("GAME_OVER", "referee:REF01")
+    return op
+
+
+@benchmark("standings_update_sort")
+def _standings(scratch: Path) -> Callable[[int], None]:
+    standings = StandingsManager()
+    players = [f"P{i:02d}" for i in range(1, 51)]
+    for player_id in players:
+        standings.register_player(player_id)
+    results = ("WIN", "DRAW", "LOSS")
+
+    def op(n: int) -> None:
+        for i in range(n):
+            standings.update_result(players[i % 50], results[i % 3])
+            standings.get_standings()
+    return op
+
+
+@benchmark("scheduler_generate_16")
+def _scheduler(scratch: Path) -> Callable[[int], None]:
+    scheduler = Scheduler()
+    players = [f"P{i:02d}" for i in range(1, 17)]
+
+    def op(n: int) -> None:
+        for _ in range(n):
+            scheduler.generate_schedule(players)
+    return op
+
+
+@benchmark("repository_write")
+def _repository_write(scratch: Path) -> Callable[[int], None]:
+    repo = StandingsRepository(str(scratch))
+    players = [f"P{i:02d}" for i in range(1, 17)]
+
+    def op(n: int) -> None:
+        for i in range(n):
+            repo.update_player(players[i & 15], "WIN")
+    return op
+
+
+@benchmark("client_send_local")
+def _client_send(scratch: Path) -> Callable[[int], None]:
+    server = MCPServer("player", "BENCH", port=8999, enable_rate_limiting=False, log_dir=str(scratch))
+
+    async def game_over(params: dict) -> dict:
+        return {"status": "ok"}
+
+    server.register_handler("GAME_OVER", game_over)
+    server.serve_in_process()
+    client = MCPClient("referee:REF01")
+    loop = asyncio.new_event_loop()
+
+    async def send(n: int) -> None:
+        for _ in range(n):
+            await client.send(server.endpoint, "GAME_OVER", {})
+
+    def op(n: int) -> None:
+        loop.run_until_complete(send(n))
+    return op
+
+
+# --- Measurement ------------------------------------------------------------
+
+def calibrate(op: Callable[[int], None], min_sample_seconds: float) -> int:
+    """Smallest power-of-two loop count whose run takes min_sample_seconds."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        op(loops)
+        if time.perf_counter() - start >= min_sample_seconds or loops >= 1 << 24:
+            return loops
+        loops *= 2
+
+
+def time_op(
+    op: Callable[[int], None],
+    samples: int = 30,
+    min_sample_seconds: float = 0.005,
+) -> tuple[int, list[float]]:
+    """
+    Time op over calibrated samples with the garbage collector paused.
+
+    Returns:
+        (loops per sample, per-operation seconds for each sample)
+    """
+    loops = calibrate(op, min_sample_seconds)
+    per_op = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            start = time.perf_counter()
+            op(loops)
+            per_op.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return loops, per_op
+
+
+def peak_memory(op: Callable[[int], None], loops: int) -> float:
+    """Peak traced allocation, in KiB, of one sample of `loops` operations."""
+    tracemalloc.start()
+    try:
+        op(loops)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(
+    names: Optional[list[str]] = None,
+    samples: int = 30,
+    min_sample_seconds: float = 0.005,
+    memory: bool = False,
+) -> list[BenchResult]:
+    """
+    Run the selected benchmarks (all by default).
+
+    Timing for every benchmark completes before any memory pass starts.
+    Console output of the measured code (the logger echoes every record)
+    goes to os.devnull, so printing is still paid for but not shown.
+    """
+    results = []
+    ops = {}
+    with (
+        tempfile.TemporaryDirectory() as scratch,
+        open(os.devnull, "w") as devnull,
+        contextlib.redirect_stdout(devnull),
+    ):
+        try:
+            for name in names or list(BENCHMARKS):
+                op = ops[name] = BENCHMARKS[name](Path(scratch) / name)
+                loops, per_op = time_op(op, samples, min_sample_seconds)
+                s = summarize(t * 1e6 for t in per_op)
+                results.append(BenchResult(
+                    name, loops, samples, s["mean"], s["p50"], s["p95"], s["p99"]
+                ))
+            if memory:
+                for result in results:
+                    result.peak_kib = peak_memory(ops[result.name], result.loops)
+        finally:
+            local_registry.clear()
+    return results
+
+
+async def server_load(
+    concurrency: int = 50,
+    rate: Optional[float] = None,
+    requests: int = 2000,
+    duration: Optional[float] = None,
+) -> ConcurrencyResult:
+    """
+    Load an MCPServer's HTTP app with GAME_OVER requests over an in-memory
+    ASGI transport (routing, JSON parsing, validation, dispatch, logging).
+
+    Args mirror benchmark_concurrent.
+    """
+    with (
+        tempfile.TemporaryDirectory() as scratch,
+        open(os.devnull, "w") as devnull,
+        contextlib.redirect_stdout(devnull),
+    ):
+        server = MCPServer("player", "LOAD", enable_rate_limiting=False, log_dir=scratch)
+
+        async def game_over(params: dict) -> dict:
+            return {"status": "ok"}
+
+        server.register_handler("GAME_OVER", game_over)
+
+        async with asgi_client(server.app) as client:
+            async def mcp_game_over() -> None:
+                response = await client.post("/mcp", json={
+                    "jsonrpc": "2.0",
+                    "method": "GAME_OVER",
+                    "params": _envelope(),
+                    "id": generate_uuid(),  # Repeated ids would be replayed from cache
+                })
+                if "error" in response.json():
+                    raise RuntimeError(response.json()["error"]["message"])
+
+            return await benchmark_concurrent(
+                mcp_game_over,
+                concurrency=concurrency, rate=rate, requests=requests, duration=duration,
+            )
+
+
+# --- Baselines --------------------------------------------------------------
+
+def save_baseline(results: list[BenchResult], path: Path) -> None:
+    """Write results and the environment they were measured on as JSON."""
+    data = {
+        "created": utc_now(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": {r.name: asdict(r) for r in results},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict,
+    threshold: float = 0.25,
+    metric: str = "p50_us",
+) -> list[dict]:
+    """
+    Compare results to a baseline.
+
+    Args:
+        results: Current results
+        baseline: Data written by save_baseline
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+        metric: Result field compared
+
+    Returns:
+        One row per benchmark present in both: {name, baseline, current,
+        change, regressed}
+    """
+    rows = []
+    for r in results:
+        base = baseline.get("benchmarks", {}).get(r.name)
+        if not base or not base.get(metric):
+            continue
+        current = getattr(r, metric)
+        change = current / base[metric] - 1
+        rows.append({
+            "name": r.name,
+            "baseline": base[metric],
+            "current": current,
+            "change": change,
+            "regressed": change > threshold,
+        })
+    return rows
+
+
+def print_results(results: list[BenchResult], comparison: Optional[list[dict]] = None) -> None:
+    """Print results, with baseline changes when given."""
+    changes = {row["name"]: row for row in comparison or []}
+    print("\n" + "=" * 86)
+    print("  SDK BENCHMARKS (per operation)")
+    print("=" * 86)
+    print(f"  {'Benchmark':<24} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9} "
+          f"{'loops':>8} {'peak KiB':>9}  {'vs base':>8}")
+    print(f"  {'-' * 82}")
+    for r in results:
+        peak = f"{r.peak_kib:9.1f}" if r.peak_kib is not None else f"{'-':>9}"
+        row = changes.get(r.name)
+        delta = f"{row['change']:+8.0%}{' !' if row['regressed'] else ''}" if row else ""
+        print(f"  {r.name:<24} {r.p50_us:9.2f} {r.p95_us:9.2f} {r.p99_us:9.2f} "
+              f"{r.loops:8d} {peak}  {delta}")
+    print("=" * 86 + "\n")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point; returns the exit code."""
+    parser = argparse.ArgumentParser(description="SDK hot-path benchmarks")
+    parser.add_argument("benchmarks", nargs="*", help=f"Subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--samples", type=int, default=30, help="Timed samples per benchmark")
+    parser.add_argument("--min-sample-ms", type=float, default=5.0,
+                        help="Calibrate loops so one sample takes at least this long")
+    parser.add_argument("--memory", action="store_true",
+                        help="Add a separate tracemalloc pass after timing")
+    parser.add_argument("--save", type=Path, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="Baseline to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before failing (fraction, default 0.25)")
+    parser.add_argument("--metric", choices=["p50_us", "p95_us", "p99_us", "mean_us"],
+                        default="p50_us", help="Statistic compared against the baseline")
+    load = parser.add_argument_group("server load (MCPServer.app over in-memory ASGI)")
+    load.add_argument("--concurrency", type=int, help="Closed loop with N concurrent clients")
+    load.add_argument("--rate", type=float, help="Open loop at this many requests per second")
+    load.add_argument("--requests", type=int, default=2000, help="Requests to send")
+    load.add_argument("--duration", type=float, help="Seconds to run instead of --requests")
+    args = parser.parse_args(argv)
+
+    if args.concurrency or args.rate:
+        print_concurrency_result(asyncio.run(server_load(
+            args.concurrency or 1, args.rate, args.requests, args.duration
+        )))
+        return 0
+
+    unknown = [name for name in args.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results = run_suite(args.benchmarks, args.samples, args.min_sample_ms / 1000, args.memory)
+    comparison = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        comparison = compare(results, baseline, args.threshold, args.metric)
+    print_results(results, comparison)
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"  Baseline saved to {args.save}\n")
+    regressed = [row["name"] for row in comparison or [] if row["regressed"]]
+    if regressed:
+        print(f"  REGRESSION ({args.metric} > +{args.threshold:.0%}): {', '.join(regressed)}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
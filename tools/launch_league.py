@@ -0,0 +1,323 @@
+"""
+Process supervisor for a whole league on one machine.
+
+Starts the League Manager, N referees and M players as subprocesses,
+waiting on each stage's /health endpoints instead of fixed sleeps,
+restarts agents that crash, and shuts everything down cleanly on
+Ctrl+C / SIGTERM (players first, manager last). Agents register only at
+startup, so a restarted manager (which starts with empty tables) is
+followed by a restart of every referee and player; a restarted referee
+re-registers on its own endpoint and the manager re-sends it the
+unreported matches of the current round. Agent output goes to
+one file per agent so a 100-agent league does not flood the terminal.
+
+Usage: python tools/launch_league.py --referees 4 --players 96 --seed 1
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "SHARED"))
+
+import httpx
+from league_sdk import get_config
+
+AGENTS_DIR = ROOT / "agents"
+DEFAULT_STRATEGIES = ["random", "deterministic_even", "alternating", "adaptive"]
+
+
+@dataclass
+class AgentProcess:
+    """One supervised agent subprocess."""
+
+    name: str
+    command: list[str]
+    port: int
+    host: str = "127.0.0.1"
+    process: Optional[subprocess.Popen] = None
+    restarts: int = 0
+    output: Optional[IO] = field(default=None, repr=False)
+
+    @property
+    def health_url(self) -> str:
+        return f"http://{self.host}:{self.port}/health"
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+
+class LeagueLauncher:
+    """Starts, watches and stops every agent of a league."""
+
+    def __init__(
+        self,
+        referees: int = 2,
+        players: int = 4,
+        strategies: Optional[list[str]] = None,
+        seed: Optional[int] = None,
+        start_delay: int = 2,
+        transport: str = "http",
+        log_dir: Optional[Path] = None,
+        max_restarts: int = 3,
+        ready_timeout: float = 60.0,
+        referee_base_port: int = 8001,
+        player_base_port: int = 8101,
+        watchdog_ms: Optional[float] = None,
+    ):
+        """
+        Initialize launcher.
+
+        Args:
+            referees: Number of referees
+            players: Number of players (the manager waits for all of them)
+            strategies: Player strategies, assigned round-robin
+            seed: League seed; players get seed + index
+            start_delay: Manager's countdown once every player registered
+            transport: Player transport ("http" or "websocket")
+            log_dir: Directory for per-agent output files
+            max_restarts: Restarts allowed per agent before giving up
+            ready_timeout: Seconds each stage may take to become healthy
+            referee_base_port: Port of the first referee
+            player_base_port: Port of the first player
+            watchdog_ms: Enable every agent's event-loop watchdog at this threshold
+        """
+        manager = get_config().agents.get("league_manager", {})
+        python = sys.executable
+        self.log_dir = log_dir or ROOT / "SHARED" / "logs" / "launcher"
+        self.max_restarts = max_restarts
+        self.ready_timeout = ready_timeout
+        self._stopping = False
+        strategies = strategies or DEFAULT_STRATEGIES
+
+        manager_cmd = [
+            python, str(AGENTS_DIR / "league_manager" / "main.py"),
+            "--min-players", str(players), "--start-delay", str(start_delay),
+        ]
+        if seed is not None:
+            manager_cmd += ["--seed", str(seed)]
+        self.manager = AgentProcess(
+            "MANAGER", manager_cmd, manager.get("port", 8000), manager.get("host", "127.0.0.1")
+        )
+
+        self.referees = [
+            AgentProcess(referee_id, [
+                python, str(AGENTS_DIR / "referee_template" / "main.py"),
+                "--id", referee_id, "--port", str(referee_base_port + i),
+            ], referee_base_port + i)
+            for i, referee_id in enumerate(f"REF{i + 1:02d}" for i in range(referees))
+        ]
+
+        self.players = []
+        for i in range(players):
+            player_id = f"P{i + 1:02d}"
+            command = [
+                python, str(AGENTS_DIR / "player_template" / "main.py"),
+                "--id", player_id, "--port", str(player_base_port + i),
+                "--strategy", strategies[i % len(strategies)], "--transport", transport,
+            ]
+            if seed is not None:
+                command += ["--seed", str(seed + i)]
+            self.players.append(AgentProcess(player_id, command, player_base_port + i))
+
+        if watchdog_ms is not None:
+            for agent in self.agents:
+                agent.command += ["--watchdog-ms", str(watchdog_ms)]
+
+    @property
+    def agents(self) -> list[AgentProcess]:
+        """Every agent, in start order."""
+        return [self.manager, *self.referees, *self.players]
+
+    def _spawn(self, agent: AgentProcess) -> None:
+        """Start (or restart) one agent, appending to its output file."""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if agent.output is None:
+            agent.output = open(self.log_dir / f"{agent.name}.out", "a", encoding="utf-8")
+        agent.process = subprocess.Popen(
+            agent.command,
+            stdout=agent.output,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            start_new_session=True,  # Ctrl+C reaches the launcher only
+        )
+
+    async def _wait_healthy(self, agents: list[AgentProcess]) -> None:
+        """
+        Poll /health until every agent answers.
+
+        Raises:
+            RuntimeError: If an agent exits or the stage times out
+        """
+        pending = list(agents)
+        deadline = time.monotonic() + self.ready_timeout
+        async with httpx.AsyncClient(timeout=1.0) as client:
+            while pending:
+                for agent in pending:
+                    if not agent.running:
+                        raise RuntimeError(
+                            f"{agent.name} exited during startup (see {self.log_dir / agent.name}.out)"
+                        )
+                results = await asyncio.gather(
+                    *(client.get(a.health_url) for a in pending), return_exceptions=True
+                )
+                pending = [
+                    a for a, r in zip(pending, results)
+                    if isinstance(r, Exception) or r.status_code != 200
+                ]
+                if pending and time.monotonic() > deadline:
+                    names = ", ".join(a.name for a in pending[:5])
+                    raise RuntimeError(f"Not healthy after {self.ready_timeout}s: {names}")
+                if pending:
+                    await asyncio.sleep(0.1)
+
+    async def start(self) -> float:
+        """
+        Start the manager, then referees, then players, each stage once
+        the previous one is healthy.
+
+        Returns:
+            Seconds until every agent was healthy
+        """
+        started = time.monotonic()
+        for stage in ([self.manager], self.referees, self.players):
+            for agent in stage:
+                self._spawn(agent)
+            await self._wait_healthy(stage)
+            print(f"  {len(stage)} agent(s) healthy: {stage[0].name}"
+                  f"{' .. ' + stage[-1].name if len(stage) > 1 else ''}")
+        return time.monotonic() - started
+
+    async def supervise(self, duration: Optional[float] = None) -> None:
+        """
+        Restart crashed agents until stopped, the manager gives up, or
+        `duration` seconds pass.
+
+        Once a restarted manager is healthy, every referee and player is
+        restarted too so they register with it again; those restarts do
+        not count against their own limit.
+        """
+        deadline = time.monotonic() + duration if duration else None
+        while not self._stopping and (deadline is None or time.monotonic() < deadline):
+            for agent in self.agents:
+                if agent.running or self._stopping:
+                    continue
+                code = agent.process.returncode if agent.process else None
+                if agent.restarts >= self.max_restarts:
+                    if agent is self.manager:
+                        print(f"  MANAGER exited ({code}) too often; stopping league")
+                        return
+                    continue
+                agent.restarts += 1
+                print(f"  {agent.name} exited ({code}); restart {agent.restarts}/{self.max_restarts}")
+                self._spawn(agent)
+                if agent is self.manager:
+                    await self._restart_dependents()
+                    break
+            await asyncio.sleep(0.5)
+
+    async def _restart_dependents(self) -> None:
+        """Restart referees and players so they register with a new manager."""
+        try:
+            await self._wait_healthy([self.manager])
+        except RuntimeError:
+            return  # Crashed again; the next supervision pass handles it
+        print("  Restarting referees and players to register with the new manager")
+        dependents = [*self.referees, *self.players]
+        self._terminate(dependents)
+        for stage in (self.referees, self.players):
+            for agent in stage:
+                self._spawn(agent)
+            try:
+                await self._wait_healthy(stage)
+            except RuntimeError as e:
+                print(f"  {e}")  # Crashed agents are picked up by supervision
+
+    def _terminate(self, agents: list[AgentProcess], grace_seconds: float = 5.0) -> None:
+        """Terminate agents, killing any still alive after the grace period."""
+        running = [a for a in agents if a.running]
+        for agent in running:
+            agent.process.terminate()
+        deadline = time.monotonic() + grace_seconds
+        for agent in running:
+            try:
+                agent.process.wait(max(deadline - time.monotonic(), 0.1))
+            except subprocess.TimeoutExpired:
+                agent.process.kill()
+                agent.process.wait()
+
+    def stop(self, grace_seconds: float = 5.0) -> None:
+        """Terminate players, then referees, then the manager."""
+        self._stopping = True
+        for stage in (self.players, self.referees, [self.manager]):
+            self._terminate(stage, grace_seconds)
+        for agent in self.agents:
+            if agent.output:
+                agent.output.close()
+                agent.output = None
+
+    async def run(self, duration: Optional[float] = None) -> None:
+        """Start everything, supervise, and always shut down cleanly."""
+        loop = asyncio.get_running_loop()
+        supervisor: Optional[asyncio.Task] = None
+
+        def request_stop() -> None:
+            self._stopping = True
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, request_stop)
+        try:
+            elapsed = await self.start()
+            print(f"  League of {len(self.agents)} agents ready in {elapsed:.1f}s "
+                  f"(output in {self.log_dir})")
+            supervisor = asyncio.create_task(self.supervise(duration))
+            await supervisor
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+            self.stop()
+            print("  All agents stopped")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Launch a whole league")
+    parser.add_argument("--referees", type=int, default=2)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--strategies", nargs="+", default=DEFAULT_STRATEGIES,
+                        help="Player strategies, assigned round-robin")
+    parser.add_argument("--seed", type=int, default=None, help="League seed")
+    parser.add_argument("--start-delay", type=int, default=2,
+                        help="Manager countdown once all players registered (s)")
+    parser.add_argument("--transport", choices=["http", "websocket"], default="http")
+    parser.add_argument("--log-dir", type=Path, default=None)
+    parser.add_argument("--max-restarts", type=int, default=3)
+    parser.add_argument("--ready-timeout", type=float, default=60.0)
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Stop after this many seconds (default: until Ctrl+C)")
+    parser.add_argument("--watchdog-ms", type=float, default=None,
+                        help="Log event-loop stalls longer than this in every agent")
+    args = parser.parse_args(argv)
+
+    launcher = LeagueLauncher(
+        args.referees, args.players, args.strategies, args.seed, args.start_delay,
+        args.transport, args.log_dir, args.max_restarts, args.ready_timeout,
+        watchdog_ms=args.watchdog_ms,
+    )
+    try:
+        asyncio.run(launcher.run(args.duration))
+    except RuntimeError as e:
+        sys.exit(f"  Launch failed: {e}")
+
+
+if __name__ == "__main__":
+    main()
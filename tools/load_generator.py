@@ -0,0 +1,469 @@
+"""
+Full-protocol load generator with synthetic players.
+
+Runs N lightweight players in one asyncio process against a running
+League Manager and referees. Every player has its own MCPServer (so
+envelope validation and rate limiting are the real ones) but they share
+one HTTP listener, multiplexed by path: /<player_id>/mcp. Players
+register, join matches and choose parity after a latency drawn from a
+configurable distribution, and can be made to fail or hang on purpose.
+
+The report covers registration latency at the manager, match latency
+(invitation received to GAME_OVER received) and throughput overall and
+per referee, and error counts.
+
+Set league.auto_start.min_players_to_start to N so the league starts
+once every synthetic player has registered.
+
+Usage: python tools/load_generator.py --players 50 --latency exponential:20 \\
+           --error-rate 0.01 --timeout-rate 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from league_sdk import MCPServer, MCPClient, JsonLogger, get_config, summarize
+
+
+def latency_sampler(spec: str, rng: random.Random) -> Callable[[], float]:
+    """
+    Parse a latency distribution spec (milliseconds) into a sampler.
+
+    Specs: "none", "fixed:MS", "uniform:LOW:HIGH", "exponential:MEAN",
+    "lognormal:MEDIAN:SIGMA".
+
+    Returns:
+        Function returning a delay in seconds
+
+    Raises:
+        ValueError: On unknown or malformed specs
+    """
+    kind, *args = spec.split(":")
+    try:
+        values = [float(a) for a in args]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}") from None
+
+    samplers = {
+        ("none", 0): lambda: 0.0,
+        ("fixed", 1): lambda: values[0],
+        ("uniform", 2): lambda: rng.uniform(values[0], values[1]),
+        ("exponential", 1): lambda: rng.expovariate(1 / values[0]) if values[0] > 0 else 0.0,
+        ("lognormal", 2): lambda: values[0] * rng.lognormvariate(0, values[1]),
+    }
+    sampler = samplers.get((kind, len(values)))
+    if sampler is None:
+        raise ValueError(f"Invalid latency spec: {spec}")
+    return lambda: sampler() / 1000
+
+
+class _SilentLogger(JsonLogger):
+    """Logger for synthetic players: records are dropped, the report is the output."""
+
+    def __init__(self, agent_id: str):
+        self.agent_type = "players"
+        self.agent_id = agent_id
+
+    def _write(self, record: dict[str, Any]) -> None:
+        pass
+
+    def info(self, event_type: str, message: str, **kwargs: Any) -> None:
+        pass
+
+
+class LoadStats:
+    """Counters and latency samples collected during a run."""
+
+    def __init__(self):
+        self.registration_ms: list[float] = []
+        self.registration_errors = 0
+        self.invitations = 0
+        self.parity_calls = 0
+        self.game_overs = 0
+        self.injected_errors = 0
+        self.injected_timeouts = 0
+        self.match_ms: list[float] = []
+        self.referee_ms: dict[str, list[float]] = defaultdict(list)
+        self.referee_invited: dict[str, set] = defaultdict(set)
+        self.referee_finished: dict[str, set] = defaultdict(set)
+        self.first_invitation: Optional[float] = None
+        self.last_game_over: Optional[float] = None
+        self.last_activity = time.perf_counter()
+
+    def invited(self, referee_id: str, match_id: str) -> None:
+        now = time.perf_counter()
+        self.invitations += 1
+        self.referee_invited[referee_id].add(match_id)
+        if self.first_invitation is None:
+            self.first_invitation = now
+        self.last_activity = now
+
+    def finished(self, referee_id: str, match_id: str, started: Optional[float]) -> None:
+        now = time.perf_counter()
+        self.game_overs += 1
+        self.referee_finished[referee_id].add(match_id)
+        if started is not None:
+            elapsed_ms = (now - started) * 1000
+            self.match_ms.append(elapsed_ms)
+            self.referee_ms[referee_id].append(elapsed_ms)
+        self.last_game_over = self.last_activity = now
+
+    @property
+    def matches_completed(self) -> int:
+        return sum(len(m) for m in self.referee_finished.values())
+
+    def report(self, players: int) -> dict:
+        """Build the run report."""
+        span = (
+            self.last_game_over - self.first_invitation
+            if self.first_invitation is not None and self.last_game_over is not None
+            else 0.0
+        )
+        invited = sum(len(m) for m in self.referee_invited.values())
+        return {
+            "players": players,
+            "registered": len(self.registration_ms),
+            "registration_ms": summarize(self.registration_ms),
+            "matches_invited": invited,
+            "matches_completed": self.matches_completed,
+            "throughput_matches_per_s": self.matches_completed / span if span else 0.0,
+            "match_ms": summarize(self.match_ms),
+            "errors": {
+                "registration_failures": self.registration_errors,
+                "matches_without_game_over": invited - self.matches_completed,
+                "injected_errors": self.injected_errors,
+                "injected_timeouts": self.injected_timeouts,
+            },
+            "referees": {
+                referee_id: {
+                    "matches_invited": len(self.referee_invited[referee_id]),
+                    "matches_completed": len(self.referee_finished[referee_id]),
+                    "match_ms": summarize(self.referee_ms[referee_id]),
+                }
+                for referee_id in sorted(self.referee_invited)
+            },
+        }
+
+
+def _referee_id(params: dict) -> str:
+    """Referee ID from a "referee:REF01"-style sender."""
+    return params.get("sender", "").split(":")[-1]
+
+
+class SyntheticPlayer:
+    """One protocol-complete player without state files or console output."""
+
+    def __init__(self, player_id: str, endpoint: str, generator: "LoadGenerator"):
+        self.player_id = player_id
+        self.generator = generator
+        self.stats = generator.stats
+        self.server = MCPServer("players", player_id, generator.host, generator.port)
+        self.server.endpoint = endpoint
+        self.server.logger = _SilentLogger(player_id)
+        self.auth_token = ""
+        self._started: dict[str, float] = {}  # match_id -> invitation time
+
+        for message_type, handler in {
+            "GAME_INVITATION": self.handle_invitation,
+            "CHOOSE_PARITY_CALL": self.handle_choose_parity,
+            "GAME_OVER": self.handle_game_over,
+            "ROUND_ANNOUNCEMENT": self.handle_notification,
+            "LEAGUE_STANDINGS_UPDATE": self.handle_notification,
+            "LEAGUE_COMPLETED": self.handle_league_completed,
+        }.items():
+            self.server.register_handler(message_type, handler)
+
+    async def register(self, manager_endpoint: str) -> bool:
+        """Register with the League Manager, recording the round trip."""
+        client = MCPClient(
+            f"player:{self.player_id}", contact_endpoint=self.server.endpoint, max_retries=1
+        )
+        start = time.perf_counter()
+        try:
+            response = await client.send(
+                manager_endpoint,
+                "LEAGUE_REGISTER_REQUEST",
+                {
+                    "player_meta": {
+                        "display_name": f"Load {self.player_id}",
+                        "version": "1.0.0",
+                        "protocol_version": "league.v2",
+                        "game_types": ["even_odd"],
+                        "contact_endpoint": self.server.endpoint,
+                    }
+                },
+            )
+            result = response.get("result", {})
+            if result.get("status") != "REGISTERED":
+                raise RuntimeError(f"Registration rejected: {response.get('error') or result}")
+            self.auth_token = result.get("auth_token", "")
+            self.stats.registration_ms.append((time.perf_counter() - start) * 1000)
+            return True
+        except Exception:
+            self.stats.registration_errors += 1
+            return False
+        finally:
+            await client.close()
+
+    async def _respond(self) -> None:
+        """Wait the configured latency, then inject a failure if drawn."""
+        await asyncio.sleep(self.generator.latency())
+        roll = self.generator.rng.random()
+        if roll < self.generator.error_rate:
+            self.stats.injected_errors += 1
+            raise RuntimeError("Injected failure")
+        if roll < self.generator.error_rate + self.generator.timeout_rate:
+            self.stats.injected_timeouts += 1
+            await asyncio.sleep(self.generator.hang_seconds)
+
+    def _choice(self) -> str:
+        return self.generator.rng.choice(["even", "odd"])
+
+    async def handle_invitation(self, params: dict) -> dict:
+        """Join the match, with an early parity choice when allowed."""
+        match_id = params.get("match_id")
+        self._started[match_id] = time.perf_counter()
+        self.stats.invited(_referee_id(params), match_id)
+        await self._respond()
+
+        if not params.get("ack_in_response"):
+            return {"status": "RECEIVED"}  # Legacy referees need a separate ACK
+        ack = self.server.build_response(
+            "GAME_JOIN_ACK",
+            conversation_id=params.get("conversation_id"),
+            match_id=match_id,
+            status="ACCEPTED",
+        )
+        if params.get("parity_in_response") and self.generator.early_choice:
+            ack["parity_choice"] = self._choice()
+        return ack
+
+    async def handle_choose_parity(self, params: dict) -> dict:
+        """Answer a parity call."""
+        self.stats.parity_calls += 1
+        await self._respond()
+        return self.server.build_response(
+            "CHOOSE_PARITY_RESPONSE",
+            conversation_id=params.get("conversation_id"),
+            match_id=params.get("match_id"),
+            parity_choice=self._choice(),
+        )
+
+    async def handle_game_over(self, params: dict) -> dict:
+        """Record the finished match."""
+        match_id = params.get("match_id")
+        self.stats.finished(_referee_id(params), match_id, self._started.pop(match_id, None))
+        self.generator.check_done()
+        return {"status": "RECEIVED"}
+
+    async def handle_notification(self, params: dict) -> dict:
+        return {"status": "RECEIVED"}
+
+    async def handle_league_completed(self, params: dict) -> dict:
+        self.generator.done.set()
+        return {"status": "RECEIVED"}
+
+
+class LoadGenerator:
+    """Runs synthetic players behind one shared HTTP listener."""
+
+    def __init__(
+        self,
+        players: int,
+        manager_endpoint: str,
+        host: str = "127.0.0.1",
+        port: int = 8900,
+        latency: str = "none",
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        hang_seconds: float = 35.0,
+        early_choice: bool = True,
+        seed: Optional[int] = None,
+        register_concurrency: int = 50,
+    ):
+        """
+        Initialize load generator.
+
+        Args:
+            players: Number of synthetic players
+            manager_endpoint: League Manager MCP endpoint
+            host: Listener host
+            port: Listener port shared by every player
+            latency: Response latency spec (see latency_sampler)
+            error_rate: Fraction of responses that fail with an error
+            timeout_rate: Fraction of responses that hang past deadlines
+            hang_seconds: How long a hanging response waits
+            early_choice: Send parity with the join ACK when allowed
+            seed: Seed for latencies, failures and choices
+            register_concurrency: Registrations in flight at once
+        """
+        self.host = host
+        self.port = port
+        self.manager_endpoint = manager_endpoint
+        self.rng = random.Random(seed)
+        self.latency = latency_sampler(latency, self.rng)
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.early_choice = early_choice
+        self.register_concurrency = register_concurrency
+        self.stats = LoadStats()
+        self.done = asyncio.Event()
+        self.expected_matches = players * (players - 1) // 2
+
+        self.players = {
+            player_id: SyntheticPlayer(player_id, f"http://{host}:{port}/{player_id}/mcp", self)
+            for player_id in (f"P{i + 1:04d}" for i in range(players))
+        }
+        self.app = FastAPI(title="Load generator")
+
+        @self.app.post("/{player_id}/mcp")
+        async def player_endpoint(player_id: str, request: Request) -> JSONResponse:
+            player = self.players.get(player_id)
+            if player is None:
+                return JSONResponse({"error": "unknown player"}, status_code=404)
+            try:
+                body = await request.json()
+            except Exception:
+                return JSONResponse(player.server._error_response(None, -32700, "Parse error"))
+            return JSONResponse(await player.server.dispatch(body))
+
+        @self.app.get("/health")
+        async def health() -> dict[str, Any]:
+            return {"status": "healthy", "players": len(self.players)}
+
+    def check_done(self) -> None:
+        """Finish once every expected match has reported GAME_OVER."""
+        if self.stats.matches_completed >= self.expected_matches:
+            self.done.set()
+
+    async def _register_all(self) -> None:
+        semaphore = asyncio.Semaphore(self.register_concurrency)
+
+        async def register(player: SyntheticPlayer) -> None:
+            async with semaphore:
+                await player.register(self.manager_endpoint)
+
+        await asyncio.gather(*(register(p) for p in self.players.values()))
+
+    async def _wait(self, duration: float, idle_timeout: float) -> None:
+        """Wait for completion, a quiet period after play started, or the cap."""
+        deadline = time.perf_counter() + duration
+        while not self.done.is_set() and time.perf_counter() < deadline:
+            if (
+                self.stats.first_invitation is not None
+                and time.perf_counter() - self.stats.last_activity > idle_timeout
+            ):
+                return
+            try:
+                await asyncio.wait_for(self.done.wait(), 0.5)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, duration: float = 600.0, idle_timeout: float = 40.0) -> dict:
+        """
+        Serve, register every player and collect stats until the league ends.
+
+        Args:
+            duration: Hard cap on the run, in seconds
+            idle_timeout: Stop this long after the last invitation/GAME_OVER
+
+        Returns:
+            Report from LoadStats.report
+        """
+        server = uvicorn.Server(uvicorn.Config(
+            self.app, host=self.host, port=self.port, log_level="warning",
+            limit_concurrency=None, backlog=4096,
+        ))
+        serve_task = asyncio.create_task(server.serve())
+        while not server.started:
+            if serve_task.done():
+                await serve_task  # Surface bind errors
+            await asyncio.sleep(0.01)
+
+        try:
+            await self._register_all()
+            await self._wait(duration, idle_timeout)
+        finally:
+            server.should_exit = True
+            await serve_task
+        return self.stats.report(len(self.players))
+
+
+def print_report(report: dict) -> None:
+    """Print a run report."""
+    def line(label: str, s: dict) -> str:
+        return (f"  {label:<22}{s['count']:>7}{s['p50']:>10.1f}{s['p95']:>10.1f}"
+                f"{s['p99']:>10.1f}{s['max']:>10.1f}")
+
+    print(f"\n{'='*70}")
+    print(f"  LOAD REPORT ({report['registered']}/{report['players']} players registered)")
+    print(f"{'='*70}")
+    print(f"  {'Latency (ms)':<22}{'N':>7}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    print(f"  {'-'*67}")
+    print(line("Registration", report["registration_ms"]))
+    print(line("Match", report["match_ms"]))
+    for referee_id, r in report["referees"].items():
+        print(line(f"Match via {referee_id}", r["match_ms"]))
+    print(f"\n  Matches: {report['matches_completed']}/{report['matches_invited']} completed, "
+          f"{report['throughput_matches_per_s']:.1f} matches/s")
+    print("  Errors:  " + ", ".join(f"{k}={v}" for k, v in report["errors"].items()))
+    print(f"{'='*70}\n")
+
+
+def main(argv: Optional[list[str]] = None) -> dict:
+    """Command-line entry point."""
+    config = get_config()
+    default_manager = config.agents.get("league_manager", {}).get(
+        "endpoint", "http://127.0.0.1:8000/mcp"
+    )
+
+    parser = argparse.ArgumentParser(description="League load generator")
+    parser.add_argument("--players", type=int, default=20, help="Synthetic players")
+    parser.add_argument("--manager", default=default_manager, help="League Manager endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900, help="Shared player listener port")
+    parser.add_argument("--latency", default="none",
+                        help="none | fixed:MS | uniform:LO:HI | exponential:MEAN | lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of failed responses")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of hung responses")
+    parser.add_argument("--hang-seconds", type=float, default=35.0, help="Duration of a hang")
+    parser.add_argument("--no-early-choice", action="store_true",
+                        help="Wait for CHOOSE_PARITY_CALL instead of choosing at join")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--duration", type=float, default=600.0, help="Maximum run time (s)")
+    parser.add_argument("--idle-timeout", type=float, default=40.0,
+                        help="Stop after this many seconds without match traffic")
+    parser.add_argument("--json", default=None, help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        generator = LoadGenerator(
+            args.players, args.manager, args.host, args.port, args.latency,
+            args.error_rate, args.timeout_rate, args.hang_seconds,
+            not args.no_early_choice, args.seed,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = asyncio.run(generator.run(args.duration, args.idle_timeout))
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Per-match trace waterfalls from agent JSONL logs.
+
+Every agent writes finished spans to its log as SPAN records carrying
+trace_id, span_id, parent_span_id, start (epoch seconds) and duration_ms.
+The League Manager starts one trace per match (start_match) and the
+trace id travels in every envelope, so collecting SPAN records from all
+agents' logs and grouping them by trace id reassembles each match:
+
+    start_match                 LM      manager -> START_MATCH
+      handle:START_MATCH        REF01
+        match                   REF01
+          invitation            REF01   GAME_INVITATION to both players
+            handle:GAME_INVITATION  P01 / P02
+          join_wait             REF01
+          parity_collection     REF01
+          winner_determination  REF01
+          game_over             REF01
+        result_report           REF01   MATCH_RESULT_REPORT to manager
+
+The report prints waterfalls for the slowest matches (or the ones asked
+for) and per-span-name duration percentiles across all traces.
+
+Usage: python tools/trace_report.py [LOG_PATH ...] [--match R1M1] [--slowest 3] [--json]
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "SHARED"))
+
+from league_sdk import summarize
+
+DEFAULT_LOG_DIR = Path(__file__).parent.parent / "SHARED" / "logs"
+
+
+def load_spans(paths: Iterable[Path]) -> list[dict[str, Any]]:
+    """
+    Read SPAN records from JSONL log files.
+
+    Args:
+        paths: Log files, or directories searched for *.log.jsonl
+
+    Returns:
+        Span records (malformed lines and other events are skipped)
+    """
+    files: list[Path] = []
+    for path in paths:
+        files.extend(sorted(path.rglob("*.log.jsonl")) if path.is_dir() else [path])
+
+    spans = []
+    for file in files:
+        with open(file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("event_type") == "SPAN" and record.get("trace_id"):
+                    spans.append(record)
+    return spans
+
+
+@dataclass
+class Trace:
+    """All spans sharing one trace id."""
+
+    trace_id: str
+    spans: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def match_id(self) -> Optional[str]:
+        """Match id recorded on any span of the trace."""
+        return next((s["match_id"] for s in self.spans if s.get("match_id")), None)
+
+    @property
+    def start(self) -> float:
+        return min(s["start"] for s in self.spans)
+
+    @property
+    def end(self) -> float:
+        return max(s["start"] + s["duration_ms"] / 1000 for s in self.spans)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000
+
+    def tree(self) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Spans in depth-first order with their depth.
+
+        Children are ordered by start time. Spans whose parent was not
+        logged (an agent without a log file, say) are shown as roots.
+        """
+        ids = {s["span_id"] for s in self.spans}
+        children: dict[Optional[str], list[dict]] = defaultdict(list)
+        for span in self.spans:
+            parent = span.get("parent_span_id")
+            children[parent if parent in ids else None].append(span)
+
+        ordered: list[tuple[int, dict]] = []
+
+        def visit(parent: Optional[str], depth: int) -> None:
+            for span in sorted(children[parent], key=lambda s: s["start"]):
+                ordered.append((depth, span))
+                visit(span["span_id"], depth + 1)
+
+        visit(None, 0)
+        return ordered
+
+
+def group_traces(spans: Iterable[dict[str, Any]]) -> list[Trace]:
+    """Group spans by trace id, ordered by trace start."""
+    traces: dict[str, Trace] = {}
+    for span in spans:
+        trace_id = span["trace_id"]
+        traces.setdefault(trace_id, Trace(trace_id)).spans.append(span)
+    return sorted(traces.values(), key=lambda t: t.start)
+
+
+def span_stats(spans: Iterable[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    """Duration summary (milliseconds) per span name."""
+    durations: dict[str, list[float]] = defaultdict(list)
+    for span in spans:
+        durations[span["span"]].append(span["duration_ms"])
+    return {name: summarize(values) for name, values in sorted(durations.items())}
+
+
+def render_waterfall(trace: Trace, width: int = 40) -> str:
+    """Render a trace as an indented span tree with time bars."""
+    start, total = trace.start, max(trace.duration_ms, 1e-6)
+    lines = [f"Match {trace.match_id or '?'}  trace {trace.trace_id}  {trace.duration_ms:.1f} ms"]
+    for depth, span in trace.tree():
+        offset = (span["start"] - start) * 1000
+        lead = int(offset / total * width)
+        bar = max(int(span["duration_ms"] / total * width), 1)
+        label = f"{'  ' * depth}{span['span']}"
+        error = f"  !{span['error']}" if span.get("error") else ""
+        lines.append(
+            f"  {label:<36} {span.get('agent_id', ''):<8} "
+            f"|{' ' * lead}{'#' * min(bar, width - lead)}{' ' * max(width - lead - bar, 0)}| "
+            f"{offset:8.1f} +{span['duration_ms']:.1f} ms{error}"
+        )
+    return "\n".join(lines)
+
+
+def print_stats(stats: dict[str, dict[str, float]]) -> None:
+    """Print the per-span-name percentile table."""
+    print(f"{'span':<28} {'count':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, s in stats.items():
+        print(
+            f"{name:<28} {s['count']:>6} {s['p50']:>9.2f} {s['p95']:>9.2f} "
+            f"{s['p99']:>9.2f} {s['max']:>9.2f}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point; returns the exit code."""
+    parser = argparse.ArgumentParser(description="Match trace waterfalls from JSONL logs")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help=f"Log files or directories (default: {DEFAULT_LOG_DIR})")
+    parser.add_argument("--match", action="append", default=[],
+                        help="Show the waterfall of this match (repeatable)")
+    parser.add_argument("--slowest", type=int, default=3,
+                        help="Without --match, show the N slowest matches")
+    parser.add_argument("--json", action="store_true",
+                        help="Print per-span percentiles as JSON only")
+    args = parser.parse_args(argv)
+
+    spans = load_spans(args.paths or [DEFAULT_LOG_DIR])
+    if not spans:
+        print("No SPAN records found", file=sys.stderr)
+        return 1
+
+    stats = span_stats(spans)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return 0
+
+    traces = group_traces(spans)
+    if args.match:
+        shown = [t for t in traces if t.match_id in args.match]
+    else:
+        shown = sorted(traces, key=lambda t: t.duration_ms, reverse=True)[:args.slowest]
+    for trace in shown:
+        print(render_waterfall(trace))
+        print()
+
+    print(f"{len(traces)} traces, {len(spans)} spans")
+    print_stats(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())